@@ -0,0 +1,41 @@
+"""add form submission counters
+
+Revision ID: 5d8e0b6a4c12
+Revises: e7b2d4c81f90
+Create Date: 2026-10-17 12:00:00.000000
+
+Per-form submission counts maintained by the submission repository on insert
+and delete, so count lookups no longer scan form_submissions.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8e0b6a4c12'
+down_revision: Union[str, None] = 'e7b2d4c81f90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'form_submission_counters',
+        sa.Column('form_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('submission_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['form_id'], ['forms.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('form_id')
+    )
+    op.execute(
+        """
+        INSERT INTO form_submission_counters (form_id, submission_count)
+        SELECT form_id, count(*) FROM form_submissions GROUP BY form_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('form_submission_counters')
@@ -0,0 +1,203 @@
+"""add submission search indexes
+
+Revision ID: a3f1c9d27e01
+Revises: add_avatar_url_20251204
+Create Date: 2026-10-17 10:00:00.000000
+
+Adds trigram GIN indexes so the admin listing's ILIKE '%term%' filters on user
+name, email and field values can use an index, and a per-submission tsvector
+document (name, email and text values) for ranked full-text search.
+
+Signature values (base64 data URLs) are left out of both: the field value
+index is partial, and the document skips signature fields. The document is
+maintained by triggers, so it follows field value changes and renamed users.
+
+The backfill runs in committed batches and the indexes are built CONCURRENTLY,
+so this can run against a live database without blocking writes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f1c9d27e01'
+down_revision: Union[str, None] = 'add_avatar_url_20251204'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL_BATCH_SIZE = 5000
+
+# Must match SIGNATURE_VALUE_PATTERN in the submission repository, so the planner can use the partial index
+SIGNATURE_VALUE_PATTERN = "data:image/%"
+
+INDEXES = [
+    ('ix_users_name_trgm', 'users', 'name', {}),
+    ('ix_users_email_trgm', 'users', 'email', {}),
+    (
+        'ix_form_field_values_value_trgm', 'form_field_values', 'value',
+        {'postgresql_where': sa.text(f"value NOT LIKE '{SIGNATURE_VALUE_PATTERN}'")}
+    ),
+]
+
+FUNCTIONS = [
+    # Document of one submission: submitter name and email plus non-signature values
+    """
+    CREATE OR REPLACE FUNCTION form_submission_search_document(target_id uuid) RETURNS tsvector
+    LANGUAGE sql STABLE AS $$
+        SELECT to_tsvector('simple'::regconfig, concat_ws(
+            ' ', u.name, u.email,
+            (
+                SELECT string_agg(v.value, ' ')
+                FROM form_field_values AS v
+                JOIN form_fields AS f ON f.id = v.field_id
+                WHERE v.submission_id = s.id AND f.field_type <> 'signature'
+            )
+        ))
+        FROM form_submissions AS s
+        LEFT JOIN users AS u ON u.id = s.user_id
+        WHERE s.id = target_id
+    $$
+    """,
+    # New submissions start with the submitter; values are added as they are inserted
+    """
+    CREATE OR REPLACE FUNCTION form_submissions_init_search_vector() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        NEW.search_vector := to_tsvector('simple'::regconfig, coalesce(
+            (SELECT concat_ws(' ', name, email) FROM users WHERE id = NEW.user_id), ''
+        ));
+        RETURN NEW;
+    END
+    $$
+    """,
+    # Statement level: one refresh per submission, however many values a statement wrote
+    """
+    CREATE OR REPLACE FUNCTION form_field_values_refresh_search_vector() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        UPDATE form_submissions
+        SET search_vector = form_submission_search_document(id)
+        WHERE id IN (SELECT DISTINCT submission_id FROM changed_values);
+        RETURN NULL;
+    END
+    $$
+    """,
+    """
+    CREATE OR REPLACE FUNCTION users_refresh_search_vector() RETURNS trigger
+    LANGUAGE plpgsql AS $$
+    BEGIN
+        IF NEW.name IS DISTINCT FROM OLD.name OR NEW.email IS DISTINCT FROM OLD.email THEN
+            UPDATE form_submissions
+            SET search_vector = form_submission_search_document(id)
+            WHERE user_id = NEW.id;
+        END IF;
+        RETURN NULL;
+    END
+    $$
+    """,
+]
+
+TRIGGERS = [
+    (
+        'form_submissions_search_vector_init', 'form_submissions',
+        "BEFORE INSERT ON form_submissions FOR EACH ROW "
+        "EXECUTE FUNCTION form_submissions_init_search_vector()"
+    ),
+    # Transition tables allow a single event per trigger
+    (
+        'form_field_values_search_vector_insert', 'form_field_values',
+        "AFTER INSERT ON form_field_values REFERENCING NEW TABLE AS changed_values "
+        "FOR EACH STATEMENT EXECUTE FUNCTION form_field_values_refresh_search_vector()"
+    ),
+    (
+        'form_field_values_search_vector_update', 'form_field_values',
+        "AFTER UPDATE ON form_field_values REFERENCING NEW TABLE AS changed_values "
+        "FOR EACH STATEMENT EXECUTE FUNCTION form_field_values_refresh_search_vector()"
+    ),
+    (
+        'form_field_values_search_vector_delete', 'form_field_values',
+        "AFTER DELETE ON form_field_values REFERENCING OLD TABLE AS changed_values "
+        "FOR EACH STATEMENT EXECUTE FUNCTION form_field_values_refresh_search_vector()"
+    ),
+    (
+        'users_search_vector_refresh', 'users',
+        "AFTER UPDATE OF name, email ON users FOR EACH ROW "
+        "EXECUTE FUNCTION users_refresh_search_vector()"
+    ),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    op.add_column('form_submissions', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+    # Triggers go in before the backfill, so rows written while it runs are kept current
+    for function in FUNCTIONS:
+        op.execute(function)
+    for name, table, definition in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON {table}")
+        op.execute(f"CREATE TRIGGER {name} {definition}")
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block; each backfill
+    # batch commits on its own, so no long transaction holds row locks
+    with op.get_context().autocommit_block():
+        _backfill_search_vectors()
+        for name, table, column, options in INDEXES:
+            op.create_index(
+                name, table, [column],
+                postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True, if_not_exists=True, **options
+            )
+        op.create_index(
+            'ix_form_submissions_search_vector', 'form_submissions', ['search_vector'],
+            postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def _backfill_search_vectors() -> None:
+    """Fill search_vector for existing submissions in id-ordered batches (keyset, no rescans)."""
+    bind = op.get_bind()
+    after = '00000000-0000-0000-0000-000000000000'
+    while True:
+        until = bind.execute(
+            sa.text(
+                "SELECT id FROM ("
+                " SELECT id FROM form_submissions WHERE id > CAST(:after AS uuid) ORDER BY id LIMIT :batch_size"
+                ") AS batch ORDER BY id DESC LIMIT 1"
+            ),
+            {"after": after, "batch_size": BACKFILL_BATCH_SIZE}
+        ).scalar()
+        if until is None:
+            return
+        bind.execute(
+            sa.text(
+                "UPDATE form_submissions SET search_vector = form_submission_search_document(id) "
+                "WHERE id > CAST(:after AS uuid) AND id <= CAST(:until AS uuid)"
+            ),
+            {"after": after, "until": str(until)}
+        )
+        after = str(until)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_form_submissions_search_vector', table_name='form_submissions',
+            postgresql_concurrently=True, if_exists=True
+        )
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+    for name, table, _ in reversed(TRIGGERS):
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON {table}")
+    for function in (
+        'users_refresh_search_vector()',
+        'form_field_values_refresh_search_vector()',
+        'form_submissions_init_search_vector()',
+        'form_submission_search_document(uuid)',
+    ):
+        op.execute(f"DROP FUNCTION IF EXISTS {function}")
+    op.drop_column('form_submissions', 'search_vector')
@@ -0,0 +1,42 @@
+"""add file count to submission counters
+
+Revision ID: b4c7e2f9a813
+Revises: 5d8e0b6a4c12
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4c7e2f9a813'
+down_revision: Union[str, None] = '5d8e0b6a4c12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'form_submission_counters',
+        sa.Column('file_count', sa.Integer(), nullable=False, server_default='0')
+    )
+    op.execute(
+        """
+        UPDATE form_submission_counters AS c
+        SET file_count = f.file_count
+        FROM (
+            SELECT s.form_id, count(*) AS file_count
+            FROM files
+            JOIN form_submissions AS s ON s.id = files.submission_id
+            GROUP BY s.form_id
+        ) AS f
+        WHERE f.form_id = c.form_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('form_submission_counters', 'file_count')
@@ -0,0 +1,56 @@
+"""add export jobs
+
+Revision ID: c9e3a5d71b24
+Revises: b4c7e2f9a813
+Create Date: 2026-10-17 14:00:00.000000
+
+Background whole-form exports. The partial unique index keeps a single
+pending/running job per export, so duplicate requests attach to it.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e3a5d71b24'
+down_revision: Union[str, None] = 'b4c7e2f9a813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'export_jobs',
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('form_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('format', sa.String(length=10), nullable=False),
+        sa.Column('locale', sa.String(length=10), nullable=False),
+        sa.Column('filters', sa.JSON(), nullable=False),
+        sa.Column('dedupe_key', sa.String(length=64), nullable=False),
+        sa.Column('status', sa.String(length=20), nullable=False),
+        sa.Column('processed_rows', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('total_rows', sa.Integer(), nullable=True),
+        sa.Column('blob_name', sa.String(length=500), nullable=True),
+        sa.Column('filename', sa.String(length=255), nullable=True),
+        sa.Column('file_size', sa.Integer(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('completed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['form_id'], ['forms.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_export_jobs_form_id', 'export_jobs', ['form_id'])
+    op.create_index(
+        'uq_export_jobs_active_dedupe_key', 'export_jobs', ['dedupe_key'], unique=True,
+        postgresql_where=sa.text("status IN ('pending', 'running')")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_export_jobs_active_dedupe_key', table_name='export_jobs')
+    op.drop_index('ix_export_jobs_form_id', table_name='export_jobs')
+    op.drop_table('export_jobs')
@@ -0,0 +1,51 @@
+"""add foreign key and ordering indexes
+
+Revision ID: e7b2d4c81f90
+Revises: a3f1c9d27e01
+Create Date: 2026-10-17 11:00:00.000000
+
+Composite indexes matched to the repository queries: per-form and per-user
+submission listings (keyset over submitted_at, id), the creator's form listing
+(keyset over created_at, id), child-row lookups by submission/field/form, and
+users by admin. notification_channels(user_id) is already covered by the
+leading column of uq_user_channel_type.
+
+Indexes are built CONCURRENTLY outside the migration transaction, so this can
+run against a live database without blocking writes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2d4c81f90'
+down_revision: Union[str, None] = 'a3f1c9d27e01'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+INDEXES = [
+    ('ix_form_submissions_form_id_submitted_at', 'form_submissions', ['form_id', 'submitted_at', 'id']),
+    ('ix_form_submissions_user_id_submitted_at', 'form_submissions', ['user_id', 'submitted_at', 'id']),
+    ('ix_form_field_values_submission_id', 'form_field_values', ['submission_id']),
+    ('ix_form_field_values_field_id', 'form_field_values', ['field_id']),
+    ('ix_files_submission_id', 'files', ['submission_id']),
+    ('ix_files_field_id', 'files', ['field_id']),
+    ('ix_form_fields_form_id_order', 'form_fields', ['form_id', 'order']),
+    ('ix_forms_creator_id_created_at', 'forms', ['creator_id', 'created_at', 'id']),
+    ('ix_users_admin_id', 'users', ['admin_id']),
+]
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -10,8 +10,9 @@ from app.application.handlers.auth.change_password_handler import (
 from fastapi import Depends
 from app.core.dependencies import get_current_user
 from app.domain.models import User
+from app.core.responses import TypedResponseRoute
 
-router = APIRouter(tags=["Auth"])
+router = APIRouter(tags=["Auth"], route_class=TypedResponseRoute)
 
 
 @router.post("/register", response_model=RegisterResponse)
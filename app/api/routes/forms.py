@@ -1,6 +1,7 @@
-from typing import cast
+from typing import Literal, cast
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File as FastAPIFile, Form, Response, Query
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File as FastAPIFile, Form, Response, Query, Header
+from fastapi.responses import RedirectResponse, StreamingResponse
 import unicodedata
 from urllib.parse import quote
 import os
@@ -11,23 +12,35 @@ from datetime import datetime
 
 from app.application.handlers.forms.create_form_handler import CreateFormRequest, CreateFormResponse
 from app.application.handlers.forms.get_form_handler import GetFormRequest, GetFormResponse
+from app.application.handlers.forms.get_form_version_handler import GetFormVersionRequest, GetFormVersionResponse
 from app.application.handlers.forms.get_forms_by_creator_handler import GetFormsByCreatorRequest, GetFormsByCreatorResponse
+from app.application.handlers.forms.get_forms_overview_handler import GetFormsOverviewRequest, GetFormsOverviewResponse
 from app.application.handlers.forms.update_form_handler import UpdateFormRequest, UpdateFormResponse
 from app.application.handlers.forms.delete_form_handler import DeleteFormRequest, DeleteFormResponse
 from app.application.handlers.submissions.submit_form_handler import SubmitFormRequest, SubmitFormResponse
+from app.application.handlers.submissions.create_upload_url_handler import CreateUploadUrlRequest, CreateUploadUrlResponse
 from app.application.handlers.submissions.get_submissions_by_admin_handler import GetSubmissionsByAdminRequest, GetSubmissionsByAdminResponse
 from app.application.handlers.submissions.get_submissions_by_form_handler import GetSubmissionsByFormRequest, GetSubmissionsByFormResponse
 from app.application.handlers.submissions.get_submission_handler import GetSubmissionRequest, GetSubmissionResponse
 from app.application.handlers.submissions.delete_submission_handler import DeleteSubmissionRequest, DeleteSubmissionResponse
 from app.application.handlers.submissions.export_submission_handler import ExportSubmissionRequest
+from app.application.handlers.submissions.export_form_submissions_handler import ExportFormSubmissionsRequest, ExportFormSubmissionsResponse
+from app.application.handlers.submissions.create_export_job_handler import CreateExportJobRequest, CreateExportJobResponse
+from app.application.handlers.submissions.get_export_job_handler import GetExportJobRequest, GetExportJobResponse
 from app.application.handlers.submissions.get_submission_count_handler import GetSubmissionCountRequest, GetSubmissionCountResponse
+from app.application.handlers.submissions.get_submission_counts_handler import GetSubmissionCountsRequest, GetSubmissionCountsResponse
 from app.application.handlers.files.view_file_handler import ViewFileRequest, ViewFileResponse
+from app.domain.services.submission_export_service import ExportFormat
 from app.core.dependencies import get_current_user
 from app.domain.models import User
+from app.core.responses import TypedResponseRoute, FastJSONResponse, etag_matches
+from app.core.config import settings
+from app.application.services.form_schema_cache import form_etag
+from app.infrastructure.services.xlsx_writer import iter_file_chunks
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(tags=["Forms"])
+router = APIRouter(tags=["Forms"], route_class=TypedResponseRoute)
 
 
 @router.get("/forms/{form_id}/submissions/count", response_model=GetSubmissionCountResponse)
@@ -40,6 +53,21 @@ async def get_submission_count(
     return response
 
 
+# Must be declared before /forms/{form_id} so the literal path is not parsed as an id
+@router.get("/forms/submission-counts", response_model=GetSubmissionCountsResponse)
+async def get_submission_counts(
+    form_ids: list[str] = Query(..., description="Form IDs, repeated or comma-separated"),
+):
+    """Get submission counts for many forms in one call"""
+    try:
+        ids = [UUID(value.strip()) for item in form_ids for value in item.split(",") if value.strip()]
+        use_case_request = GetSubmissionCountsRequest(form_ids=ids)
+        response = cast(GetSubmissionCountsResponse, await Mediator.send_async(use_case_request))
+        return response
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.post("/forms", response_model=CreateFormResponse)
 async def create_form(
     request: CreateFormRequest,
@@ -55,12 +83,25 @@ async def create_form(
 @router.get("/forms/{form_id}", response_model=GetFormResponse)
 async def get_form(
     form_id: UUID,
+    if_none_match: str | None = Header(None),
 ):
-    """Get form by ID (public endpoint, no auth required)"""
+    """Get form by ID (public endpoint, no auth required); supports ETag revalidation"""
+    cache_headers = {"Cache-Control": f"public, max-age={settings.form_http_max_age_seconds}"}
+    if if_none_match:
+        # Version check only: answered from the form cache or a single-column lookup
+        version = cast(GetFormVersionResponse, await Mediator.send_async(GetFormVersionRequest(form_id=form_id)))
+        if version.etag and etag_matches(if_none_match, version.etag):
+            return Response(status_code=304, headers={**cache_headers, "ETag": version.etag})
+
     use_case_request = GetFormRequest(form_id=form_id)
     response = cast(GetFormResponse, await Mediator.send_async(use_case_request))
     # Return 200 with form=None when not found (for public access)
-    return response
+    if response.form is None:
+        return FastJSONResponse(response, headers={"Cache-Control": "no-store"})
+    return FastJSONResponse(
+        response,
+        headers={**cache_headers, "ETag": form_etag(response.form.id, response.form.updated_at)}
+    )
 
 
 @router.post("/forms/{form_id}/submit", response_model=SubmitFormResponse)
@@ -70,12 +111,15 @@ async def submit_form(
     user_email: str | None = Form(None),
     field_values_json: str | None = Form(None),  # JSON string
     file_fields_json: str | None = Form(None),  # JSON string mapping file index to field_id
+    uploaded_files_json: str | None = Form(None),  # JSON list of directly uploaded blobs
     files: list[UploadFile] | None = FastAPIFile(None),
 ):
     """Submit a form (public endpoint, no auth required)
     
     field_values should be JSON like {"field-uuid-1": "value1", "field-uuid-2": "value2"}
     file_fields should be JSON like {"0": "field-uuid-1", "1": "field-uuid-2"} mapping file index to field_id
+    uploaded_files should be JSON like [{"field_id": "field-uuid-1", "blob_name": "uploads/...", "filename": "a.pdf"}]
+    referencing blobs uploaded through /forms/{form_id}/uploads
     """
     use_case_request = SubmitFormRequest(
         form_id=form_id,
@@ -83,6 +127,7 @@ async def submit_form(
         user_email=user_email,
         field_values_json=field_values_json,
         file_fields_json=file_fields_json,
+        uploaded_files_json=uploaded_files_json,
         files=files
     )
     
@@ -96,6 +141,23 @@ async def submit_form(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@router.post("/forms/{form_id}/uploads", response_model=CreateUploadUrlResponse)
+async def create_upload_url(
+    form_id: UUID,
+    request: CreateUploadUrlRequest,
+):
+    """Get a short-lived, write-only URL to upload a file for a form field directly to storage
+    (public endpoint, no auth required). Pass the returned blob_name to /forms/{form_id}/submit
+    in uploaded_files_json.
+    """
+    request.form_id = form_id
+    try:
+        response = cast(CreateUploadUrlResponse, await Mediator.send_async(request))
+        return response
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/admin/{admin_id}/submissions", response_model=GetSubmissionsByAdminResponse)
 async def get_submissions_by_admin(
     admin_id: UUID,
@@ -107,6 +169,13 @@ async def get_submissions_by_admin(
     user_email: str | None = Query(None, description="Filter by user email (partial match)"),
     field_value_search: str | None = Query(None, description="Search in form field values"),
     form_id: UUID | None = Query(None, description="Filter by form ID"),
+    cursor: str | None = Query(None, description="Opaque cursor from the previous page's next_cursor"),
+    search: str | None = Query(None, description="Full-text search over user name, email and field values (ranked)"),
+    view: Literal["full", "summary", "normalized"] = Query(
+        "full",
+        description="'summary' returns ids, form title, submitter, timestamp and counts only; "
+                    "'normalized' returns forms and users once in top-level maps keyed by id"
+    ),
 ):
     """Get all submissions for forms created by admin or submitted by users linked to admin"""
     use_case_request = GetSubmissionsByAdminRequest(
@@ -118,20 +187,32 @@ async def get_submissions_by_admin(
         user_name=user_name,
         user_email=user_email,
         field_value_search=field_value_search,
-        form_id=form_id
+        form_id=form_id,
+        cursor=cursor,
+        search=search,
+        view=view
     )
-    response = cast(GetSubmissionsByAdminResponse, await Mediator.send_async(use_case_request))
-    return response
+    try:
+        response = cast(GetSubmissionsByAdminResponse, await Mediator.send_async(use_case_request))
+        return response
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/forms/{form_id}/submissions", response_model=GetSubmissionsByFormResponse)
 async def get_submissions_by_form(
     form_id: UUID,
+    skip: int = 0,
+    limit: int = 10,
+    cursor: str | None = Query(None, description="Opaque cursor from the previous page's next_cursor"),
 ):
-    """Get all submissions for a specific form"""
-    use_case_request = GetSubmissionsByFormRequest(form_id=form_id)
-    response = cast(GetSubmissionsByFormResponse, await Mediator.send_async(use_case_request))
-    return response
+    """Get submissions for a specific form, newest first"""
+    use_case_request = GetSubmissionsByFormRequest(form_id=form_id, skip=skip, limit=limit, cursor=cursor)
+    try:
+        response = cast(GetSubmissionsByFormResponse, await Mediator.send_async(use_case_request))
+        return response
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.get("/submissions/{submission_id}", response_model=GetSubmissionResponse)
@@ -163,7 +244,7 @@ async def delete_submission(
 @router.get("/submissions/{submission_id}/export")
 async def export_submission(
     submission_id: UUID,
-    format: str = Query(..., regex="^(csv|xlsx)$", description="Export format: csv or xlsx"),
+    format: ExportFormat = Query(..., description="Export format: csv or xlsx"),
     locale: str = Query("en", description="Locale: en or uk (defaults to en for unknown values)"),
 ):
     """Export a submission to CSV or XLSX format"""
@@ -174,7 +255,7 @@ async def export_submission(
     try:
         use_case_request = ExportSubmissionRequest(
             submission_id=submission_id,
-            format=format,  # type: ignore
+            format=format,
             locale=locale
         )
         response = await Mediator.send_async(use_case_request)
@@ -192,8 +273,9 @@ async def export_submission(
             f"attachment; filename=\"{ascii_fallback}\"; filename*=UTF-8''{encoded_utf8}"
         )
 
-        return Response(
-            content=response.file_buffer.getvalue(),
+        # Streamed from the (possibly disk-spooled) export file, which is closed afterwards
+        return StreamingResponse(
+            iter_file_chunks(response.file_buffer),
             media_type=response.media_type,
             headers={
                 "Content-Disposition": content_disposition,
@@ -203,16 +285,139 @@ async def export_submission(
         raise HTTPException(status_code=404, detail=str(e))
 
 
+@router.get("/forms/{form_id}/export")
+async def export_form_submissions(
+    form_id: UUID,
+    format: ExportFormat = Query("csv", description="Export format: csv or xlsx"),
+    locale: str = Query("en", description="Locale: en or uk (defaults to en for unknown values)"),
+    current_user: User = Depends(get_current_user),
+):
+    """Export all submissions of a form as one table (a row per submission, a column per field), streamed.
+    Only the form's creator or a super admin may export it.
+    """
+    if locale not in ["en", "uk"]:
+        locale = "en"
+    
+    try:
+        use_case_request = ExportFormSubmissionsRequest(
+            form_id=form_id,
+            format=format,
+            locale=locale,
+            requester_id=current_user.id,
+            requester_is_super_admin=bool(current_user.is_super_admin),
+        )
+        response = cast(ExportFormSubmissionsResponse, await Mediator.send_async(use_case_request))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    
+    return StreamingResponse(
+        response.content,
+        media_type=response.media_type,
+        headers={"Content-Disposition": _attachment_disposition(response.filename, "export")},
+    )
+
+
+@router.post("/forms/{form_id}/export-jobs", response_model=CreateExportJobResponse, status_code=202)
+async def create_export_job(
+    form_id: UUID,
+    request: CreateExportJobRequest,
+    current_user: User = Depends(get_current_user),
+):
+    """Export all submissions of a form in the background; poll /export-jobs/{job_id} for progress.
+    An identical export that is still pending or running is returned instead of starting another.
+    Only the form's creator or a super admin may export it.
+    """
+    request.form_id = form_id
+    request.requester_id = current_user.id
+    request.requester_is_super_admin = bool(current_user.is_super_admin)
+    if request.locale not in ["en", "uk"]:
+        request.locale = "en"
+    try:
+        response = cast(CreateExportJobResponse, await Mediator.send_async(request))
+        return response
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.get("/export-jobs/{job_id}", response_model=GetExportJobResponse)
+async def get_export_job(
+    job_id: UUID,
+    current_user: User = Depends(get_current_user),
+):
+    """Get status and progress of a background export; completed jobs include a download_url"""
+    return await _get_export_job(job_id, current_user)
+
+
+@router.get("/export-jobs/{job_id}/download")
+async def download_export_job(
+    job_id: UUID,
+    current_user: User = Depends(get_current_user),
+):
+    """Redirect to the file of a completed background export (409 while it is not ready)"""
+    response = await _get_export_job(job_id, current_user)
+    if not response.job.download_url:
+        raise HTTPException(status_code=409, detail=f"Export job is {response.job.status}")
+    return RedirectResponse(response.job.download_url, status_code=303)
+
+
+async def _get_export_job(job_id: UUID, current_user: User) -> GetExportJobResponse:
+    use_case_request = GetExportJobRequest(
+        job_id=job_id,
+        requester_id=current_user.id,
+        requester_is_super_admin=bool(current_user.is_super_admin),
+    )
+    try:
+        return cast(GetExportJobResponse, await Mediator.send_async(use_case_request))
+    except PermissionError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+def _attachment_disposition(filename: str, fallback_stem: str) -> str:
+    """RFC 6266 attachment Content-Disposition with an ASCII fallback for non-ASCII filenames."""
+    ascii_fallback = unicodedata.normalize('NFKD', filename).encode('ascii', 'ignore').decode('ascii')
+    if not ascii_fallback:
+        _, ext = os.path.splitext(filename)
+        ascii_fallback = f"{fallback_stem}{ext or ''}"
+    encoded_utf8 = quote(filename.encode('utf-8'))
+    return f"attachment; filename=\"{ascii_fallback}\"; filename*=UTF-8''{encoded_utf8}"
+
+
 @router.get("/admin/{creator_id}/forms", response_model=GetFormsByCreatorResponse)
 async def get_forms_by_creator(
     creator_id: UUID,
     skip: int = 0,
     limit: int = 10,
+    cursor: str | None = Query(None, description="Opaque cursor from the previous page's next_cursor"),
 ):
     """Get all forms created by a specific creator (admin only)"""
-    use_case_request = GetFormsByCreatorRequest(creator_id=creator_id, skip=skip, limit=limit)
-    response = cast(GetFormsByCreatorResponse, await Mediator.send_async(use_case_request))
-    return response
+    use_case_request = GetFormsByCreatorRequest(creator_id=creator_id, skip=skip, limit=limit, cursor=cursor)
+    try:
+        response = cast(GetFormsByCreatorResponse, await Mediator.send_async(use_case_request))
+        return response
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/admin/{creator_id}/forms/overview", response_model=GetFormsOverviewResponse)
+async def get_forms_overview(
+    creator_id: UUID,
+    skip: int = 0,
+    limit: int = 10,
+    cursor: str | None = Query(None, description="Opaque cursor from the previous page's next_cursor"),
+):
+    """Get a creator's forms (without fields) with submission/file counts and last submission time"""
+    use_case_request = GetFormsOverviewRequest(creator_id=creator_id, skip=skip, limit=limit, cursor=cursor)
+    try:
+        response = cast(GetFormsOverviewResponse, await Mediator.send_async(use_case_request))
+        return response
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.put("/forms/{form_id}", response_model=UpdateFormResponse)
@@ -7,10 +7,14 @@ from app.core.dependencies import get_current_super_admin
 from app.application.handlers.users.get_unapproved_admins_handler import GetUnapprovedAdminsRequest, GetUnapprovedAdminsResponse
 from app.application.handlers.users.approve_admin_handler import ApproveAdminRequest, ApproveAdminResponse
 from app.application.handlers.users.reject_admin_handler import RejectAdminRequest, RejectAdminResponse
+from app.application.handlers.system.get_database_pool_stats_handler import (
+    GetDatabasePoolStatsRequest, GetDatabasePoolStatsResponse
+)
 from app.api.schemas import UserSchema
 from app.domain.models import User
+from app.core.responses import TypedResponseRoute
 
-router = APIRouter(tags=["Super Admin"])
+router = APIRouter(tags=["Super Admin"], route_class=TypedResponseRoute)
 
 
 @router.get("/super-admin/unapproved-admins", response_model=GetUnapprovedAdminsResponse)
@@ -51,3 +55,11 @@ async def reject_admin(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.get("/super-admin/database/pool", response_model=GetDatabasePoolStatsResponse)
+async def get_database_pool_stats(
+    current_user: User = Depends(get_current_super_admin),
+):
+    """Get connection pool statistics of the serving worker process (super admin only)"""
+    use_case_request = GetDatabasePoolStatsRequest()
+    response = cast(GetDatabasePoolStatsResponse, await Mediator.send_async(use_case_request))
+    return response
@@ -23,8 +23,9 @@ from app.application.handlers.users.upload_avatar_handler import (
     UploadAvatarRequest,
     UploadAvatarResponse,
 )
+from app.core.responses import TypedResponseRoute
 
-router = APIRouter(tags=["Users"])
+router = APIRouter(tags=["Users"], route_class=TypedResponseRoute)
 
 
 @router.post("/users", response_model=CreateUserResponse)
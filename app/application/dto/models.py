@@ -62,3 +62,63 @@ class FormSubmissionDTO(BaseModel):
     form: Optional[FormDTO] = None
     field_values: List[FormFieldValueDTO] = []
     files: List[FileDTO] = []
+
+
+class FormSubmissionSummaryDTO(BaseModel):
+    """Compact submission row for list views (no values, files or form definition)."""
+    id: UUID
+    form_id: UUID
+    form_title: str
+    user_id: UUID
+    user_name: str
+    user_email: Optional[str] = None
+    submitted_at: datetime
+    field_value_count: int = 0
+    file_count: int = 0
+
+
+class FormOverviewDTO(BaseModel):
+    """Form summary for dashboards: no fields, with submission activity."""
+    id: UUID
+    title: str
+    description: Optional[str] = None
+    creator_id: UUID
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    submission_count: int = 0
+    file_count: int = 0
+    last_submitted_at: Optional[datetime] = None
+
+
+class DatabasePoolStatsDTO(BaseModel):
+    """Connection pool state and cumulative checkout statistics of one engine."""
+    pool_size: Optional[int] = None
+    max_overflow: Optional[int] = None
+    checked_out: Optional[int] = None
+    idle: Optional[int] = None
+    overflow: Optional[int] = None
+    checkouts: int = 0
+    checkout_wait_avg_ms: float = 0.0
+    checkout_wait_max_ms: float = 0.0
+    timeouts: int = 0
+    overflow_connects: int = 0
+    invalidations: int = 0
+
+
+class ExportJobDTO(BaseModel):
+    """Background export job status and progress."""
+    id: UUID
+    form_id: UUID
+    format: str
+    locale: str
+    filters: dict = {}
+    status: str
+    processed_rows: int = 0
+    total_rows: Optional[int] = None
+    filename: Optional[str] = None
+    file_size: Optional[int] = None
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    completed_at: Optional[datetime] = None
+    download_url: Optional[str] = None
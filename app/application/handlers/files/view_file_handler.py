@@ -5,6 +5,7 @@ from app.core.container import Container  # noqa: F401
 from uuid import UUID
 
 from app.application.ports.usecase import UseCase
+from app.application.queries import ReadOnlyRequest
 from app.domain.repositories.file_repository import IFileRepository
 from app.infrastructure.services.azure_storage import azure_storage_client
 from typing import TYPE_CHECKING
@@ -18,7 +19,7 @@ class ViewFileResponse(BaseModel):
     disposition: str  # "inline" or "attachment"
 
 
-class ViewFileRequest(BaseModel, GenericQuery[ViewFileResponse]):
+class ViewFileRequest(BaseModel, ReadOnlyRequest, GenericQuery[ViewFileResponse]):
     """Request for viewing/downloading a file."""
     file_id: UUID
 
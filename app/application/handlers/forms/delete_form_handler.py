@@ -1,3 +1,4 @@
+from datetime import datetime
 from uuid import UUID
 from pydantic import BaseModel
 from mediatr import GenericQuery, Mediator
@@ -6,6 +7,9 @@ from app.core.container import Container  # noqa: F401
 
 from app.application.ports.usecase import UseCase
 from app.domain.repositories.form_repository import IFormRepository
+from app.application.services.form_schema_cache import FormSchemaCache
+from app.domain.services.export_cache import IExportCache
+from app.core.request_scope import on_commit
 
 
 
@@ -24,12 +28,27 @@ class DeleteFormHandler(UseCase[DeleteFormRequest, DeleteFormResponse]):
     """Use case for deleting a form."""
     
     @inject
-    def __init__(self, form_repository: IFormRepository = Provide[Container.form_repository]):
+    def __init__(
+        self,
+        form_repository: IFormRepository = Provide[Container.form_repository],
+        form_cache: FormSchemaCache = Provide[Container.form_schema_cache],
+        export_cache: IExportCache = Provide[Container.export_cache],
+    ):
         self.form_repository = form_repository
+        self.form_cache = form_cache
+        self.export_cache = export_cache
     
     async def handle(self, request: DeleteFormRequest) -> DeleteFormResponse:
         success = await self.form_repository.delete(request.form_id)
         if not success:
             raise ValueError("Form not found")
+        
+        async def invalidate_caches() -> None:
+            # No version of a deleted form may be cached again
+            self.form_cache.invalidate(request.form_id, min_version=datetime.max)
+            await self.export_cache.invalidate_form(request.form_id)
+        
+        # Before the commit, a concurrent read would just cache the deleted form again
+        await on_commit(invalidate_caches)
         return DeleteFormResponse(success=success)
 
@@ -5,10 +5,10 @@ from dependency_injector.wiring import inject, Provide
 from app.core.container import Container  # noqa: F401
 
 from app.application.ports.usecase import UseCase
-from app.domain.models import Form
+from app.application.queries import ReadOnlyRequest
 from app.domain.repositories.form_repository import IFormRepository
-from app.application.dto.models import FormDTO, FormFieldDTO
-from typing import TYPE_CHECKING
+from app.application.dto.models import FormDTO
+from app.application.services.form_schema_cache import FormSchemaCache
 
 
 class GetFormResponse(BaseModel):
@@ -16,7 +16,7 @@ class GetFormResponse(BaseModel):
     form: FormDTO | None
 
 
-class GetFormRequest(BaseModel, GenericQuery[GetFormResponse]):
+class GetFormRequest(BaseModel, ReadOnlyRequest, GenericQuery[GetFormResponse]):
     """Request for getting a form by ID."""
     form_id: UUID
 
@@ -26,32 +26,17 @@ class GetFormHandler(UseCase[GetFormRequest, GetFormResponse]):
     """Use case for getting a form by ID."""
     
     @inject
-    def __init__(self, form_repository: IFormRepository = Provide[Container.form_repository]):
+    def __init__(
+        self,
+        form_repository: IFormRepository = Provide[Container.form_repository],
+        form_cache: FormSchemaCache = Provide[Container.form_schema_cache],
+    ):
         self.form_repository = form_repository
+        self.form_cache = form_cache
     
     async def handle(self, request: GetFormRequest) -> GetFormResponse:
-        form = await self.form_repository.get_by_id(request.form_id)
+        # Served from the compiled form cache; the DTO is built once per form version
+        form = await self.form_cache.get_or_load(request.form_id, self.form_repository.get_by_id)
         if not form:
             return GetFormResponse(form=None)
-        form_dto = FormDTO(
-            id=form.id,
-            title=form.title,
-            description=form.description,
-            creator_id=form.creator_id,
-            created_at=form.created_at,
-            updated_at=form.updated_at,
-            fields=[
-                FormFieldDTO(
-                    id=f.id,
-                    field_type=f.field_type,
-                    label=f.label,
-                    name=f.name,
-                    is_required=f.is_required,
-                    order=f.order,
-                    options=f.options,
-                    placeholder=getattr(f, 'placeholder', None)
-                ) for f in form.fields
-            ]
-        )
-        return GetFormResponse(form=form_dto)
-
+        return GetFormResponse(form=form.dto)
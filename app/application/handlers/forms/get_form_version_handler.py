@@ -0,0 +1,44 @@
+from uuid import UUID
+from pydantic import BaseModel
+from mediatr import GenericQuery, Mediator
+from dependency_injector.wiring import inject, Provide
+from app.core.container import Container  # noqa: F401
+
+from app.application.ports.usecase import UseCase
+from app.application.queries import ReadOnlyRequest
+from app.domain.repositories.form_repository import IFormRepository
+from app.application.services.form_schema_cache import FormSchemaCache, form_etag
+
+
+class GetFormVersionResponse(BaseModel):
+    """Response containing the current entity tag of a form."""
+    etag: str | None
+
+
+class GetFormVersionRequest(BaseModel, ReadOnlyRequest, GenericQuery[GetFormVersionResponse]):
+    """Request for getting the version (ETag) of a form by ID."""
+    form_id: UUID
+
+
+@Mediator.handler
+class GetFormVersionHandler(UseCase[GetFormVersionRequest, GetFormVersionResponse]):
+    """Use case for conditional GETs: resolve a form's ETag without loading its fields."""
+    
+    @inject
+    def __init__(
+        self,
+        form_repository: IFormRepository = Provide[Container.form_repository],
+        form_cache: FormSchemaCache = Provide[Container.form_schema_cache],
+    ):
+        self.form_repository = form_repository
+        self.form_cache = form_cache
+    
+    async def handle(self, request: GetFormVersionRequest) -> GetFormVersionResponse:
+        # Answered from memory while the compiled form is cached
+        compiled = self.form_cache.get(request.form_id)
+        if compiled is not None:
+            return GetFormVersionResponse(etag=compiled.etag)
+        updated_at = await self.form_repository.get_updated_at(request.form_id)
+        if updated_at is None:
+            return GetFormVersionResponse(etag=None)
+        return GetFormVersionResponse(etag=form_etag(request.form_id, updated_at))
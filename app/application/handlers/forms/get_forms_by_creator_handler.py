@@ -5,8 +5,10 @@ from dependency_injector.wiring import inject, Provide
 from app.core.container import Container  # noqa: F401
 
 from app.application.ports.usecase import UseCase
+from app.application.queries import ReadOnlyRequest
 from app.domain.models import Form
 from app.domain.repositories.form_repository import IFormRepository
+from app.application.pagination import encode_cursor, decode_cursor
 from app.application.dto.models import FormDTO, FormFieldDTO
 from typing import TYPE_CHECKING
 
@@ -14,13 +16,16 @@ from typing import TYPE_CHECKING
 class GetFormsByCreatorResponse(BaseModel):
     """Response containing forms created by creator."""
     forms: list[FormDTO]
+    # Pass back as `cursor` to fetch the next page; None on the last page
+    next_cursor: str | None = None
 
 
-class GetFormsByCreatorRequest(BaseModel, GenericQuery[GetFormsByCreatorResponse]):
+class GetFormsByCreatorRequest(BaseModel, ReadOnlyRequest, GenericQuery[GetFormsByCreatorResponse]):
     """Request for getting forms by creator ID."""
     creator_id: UUID
     skip: int = 0
     limit: int = 10
+    cursor: str | None = None
 
 
 @Mediator.handler
@@ -32,7 +37,18 @@ class GetFormsByCreatorHandler(UseCase[GetFormsByCreatorRequest, GetFormsByCreat
         self.form_repository = form_repository
     
     async def handle(self, request: GetFormsByCreatorRequest) -> GetFormsByCreatorResponse:
-        forms = await self.form_repository.get_by_creator_id(request.creator_id, request.skip, request.limit)
+        cursor = decode_cursor(request.cursor) if request.cursor else None
+        # Fetch one extra row to know whether another page exists
+        forms = await self.form_repository.get_by_creator_id(
+            request.creator_id,
+            0 if cursor else request.skip,
+            request.limit + 1,
+            cursor
+        )
+        next_cursor = None
+        if len(forms) > request.limit:
+            forms = forms[:request.limit]
+            next_cursor = encode_cursor(forms[-1].created_at, forms[-1].id)
         form_dtos = [
             FormDTO(
                 id=f.id,
@@ -55,5 +71,5 @@ class GetFormsByCreatorHandler(UseCase[GetFormsByCreatorRequest, GetFormsByCreat
                 ]
             ) for f in forms
         ]
-        return GetFormsByCreatorResponse(forms=form_dtos)
+        return GetFormsByCreatorResponse(forms=form_dtos, next_cursor=next_cursor)
 
@@ -0,0 +1,53 @@
+from uuid import UUID
+from pydantic import BaseModel
+from mediatr import GenericQuery, Mediator
+from dependency_injector.wiring import inject, Provide
+from app.core.container import Container  # noqa: F401
+
+from app.application.ports.usecase import UseCase
+from app.application.queries import ReadOnlyRequest
+from app.domain.repositories.form_repository import IFormRepository
+from app.application.pagination import encode_cursor, decode_cursor
+from app.application.dto.models import FormOverviewDTO
+
+
+class GetFormsOverviewResponse(BaseModel):
+    """Response containing a creator's forms with submission activity."""
+    forms: list[FormOverviewDTO]
+    # Pass back as `cursor` to fetch the next page; None on the last page
+    next_cursor: str | None = None
+
+
+class GetFormsOverviewRequest(BaseModel, ReadOnlyRequest, GenericQuery[GetFormsOverviewResponse]):
+    """Request for getting the forms overview of a creator."""
+    creator_id: UUID
+    skip: int = 0
+    limit: int = 10
+    cursor: str | None = None
+
+
+@Mediator.handler
+class GetFormsOverviewHandler(UseCase[GetFormsOverviewRequest, GetFormsOverviewResponse]):
+    """Use case for the dashboard overview: forms with counts and last activity."""
+    
+    @inject
+    def __init__(self, form_repository: IFormRepository = Provide[Container.form_repository]):
+        self.form_repository = form_repository
+    
+    async def handle(self, request: GetFormsOverviewRequest) -> GetFormsOverviewResponse:
+        cursor = decode_cursor(request.cursor) if request.cursor else None
+        # Fetch one extra row to know whether another page exists
+        rows = await self.form_repository.get_overview_by_creator_id(
+            request.creator_id,
+            0 if cursor else request.skip,
+            request.limit + 1,
+            cursor
+        )
+        next_cursor = None
+        if len(rows) > request.limit:
+            rows = rows[:request.limit]
+            next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+        return GetFormsOverviewResponse(
+            forms=[FormOverviewDTO.model_validate(row) for row in rows],
+            next_cursor=next_cursor
+        )
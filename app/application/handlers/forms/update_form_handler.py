@@ -8,7 +8,10 @@ from dependency_injector.wiring import inject, Provide
 from app.application.ports.usecase import UseCase
 from app.domain.models import Form, FormField
 from app.domain.repositories.form_repository import IFormRepository
+from app.application.services.form_schema_cache import FormSchemaCache
+from app.domain.services.export_cache import IExportCache
 from app.application.dto.models import FormDTO, FormFieldDTO
+from app.core.request_scope import on_commit
 from typing import TYPE_CHECKING
 from app.core.container import Container  # noqa: F401
 
@@ -31,8 +34,15 @@ class UpdateFormHandler(UseCase[UpdateFormRequest, UpdateFormResponse]):
     """Use case for updating a form."""
     
     @inject
-    def __init__(self, form_repository: IFormRepository = Provide[Container.form_repository]):
+    def __init__(
+        self,
+        form_repository: IFormRepository = Provide[Container.form_repository],
+        form_cache: FormSchemaCache = Provide[Container.form_schema_cache],
+        export_cache: IExportCache = Provide[Container.export_cache],
+    ):
         self.form_repository = form_repository
+        self.form_cache = form_cache
+        self.export_cache = export_cache
     
     async def handle(self, request: UpdateFormRequest) -> UpdateFormResponse:
         form = await self.form_repository.get_by_id(request.form_id)
@@ -69,6 +79,14 @@ class UpdateFormHandler(UseCase[UpdateFormRequest, UpdateFormResponse]):
                 form.fields.append(field)
         
         updated_form = await self.form_repository.update(form)
+        form_id, version = updated_form.id, updated_form.updated_at
+        
+        async def invalidate_caches() -> None:
+            self.form_cache.invalidate(form_id, min_version=version)
+            await self.export_cache.invalidate_form(form_id)
+        
+        # Before the commit, a concurrent read would just cache the old version again
+        await on_commit(invalidate_caches)
         form_dto = FormDTO(
             id=updated_form.id,
             title=updated_form.title,
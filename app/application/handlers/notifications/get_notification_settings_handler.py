@@ -10,6 +10,7 @@ from app.domain.repositories.user_repository import IUserRepository
 from app.domain.repositories.notification_channel_repository import INotificationChannelRepository
 from app.domain.models import NotificationChannelType
 from app.application.ports.usecase import UseCase
+from app.application.queries import ReadOnlyRequest
 
 from typing import TYPE_CHECKING
 
@@ -21,7 +22,7 @@ class GetNotificationSettingsResponse(BaseModel):
     notification_preferences: Optional[dict] = None
 
 
-class GetNotificationSettingsRequest(BaseModel, GenericQuery[GetNotificationSettingsResponse]):
+class GetNotificationSettingsRequest(BaseModel, ReadOnlyRequest, GenericQuery[GetNotificationSettingsResponse]):
     user_id: UUID
 
 
@@ -0,0 +1,114 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+from pydantic import BaseModel
+from mediatr import GenericQuery, Mediator
+from dependency_injector.wiring import inject, Provide
+
+from app.application.dto.models import ExportJobDTO
+from app.application.ports.usecase import UseCase
+from app.domain.events.event_bus import EventBus
+from app.domain.events.export_events import ExportJobRequestedEvent
+from app.domain.models import ExportJob
+from app.domain.repositories.export_job_repository import IExportJobRepository
+from app.domain.repositories.form_repository import IFormRepository
+from app.domain.services.submission_export_service import ExportFormat
+from app.core.config import settings
+from app.core.container import Container  # noqa: F401
+
+
+class ExportJobFilters(BaseModel):
+    """Submission filters of a background export (same meaning as in the admin listing)."""
+    date_from: datetime | None = None
+    date_to: datetime | None = None
+    user_name: str | None = None
+    user_email: str | None = None
+    field_value_search: str | None = None
+
+
+def export_job_to_dto(job: ExportJob, download_url: str | None = None) -> ExportJobDTO:
+    return ExportJobDTO(
+        id=job.id,
+        form_id=job.form_id,
+        format=job.format,
+        locale=job.locale,
+        filters=job.filters or {},
+        status=job.status.value,
+        processed_rows=job.processed_rows,
+        total_rows=job.total_rows,
+        filename=job.filename,
+        file_size=job.file_size,
+        error=job.error,
+        created_at=job.created_at,
+        updated_at=job.updated_at,
+        completed_at=job.completed_at,
+        download_url=download_url,
+    )
+
+
+class CreateExportJobResponse(BaseModel):
+    """Response containing the job rendering the requested export."""
+    job: ExportJobDTO
+    # False when the request attached to an export already in progress
+    created: bool
+
+
+class CreateExportJobRequest(BaseModel, GenericQuery[CreateExportJobResponse]):
+    """Request for exporting a form's submissions in the background."""
+    form_id: UUID | None = None
+    format: ExportFormat = "csv"
+    locale: str = "en"
+    filters: ExportJobFilters = ExportJobFilters()
+    # Set by the route from the authenticated user; only the form's creator (or a
+    # super admin) may export its submissions
+    requester_id: UUID | None = None
+    requester_is_super_admin: bool = False
+
+
+@Mediator.handler
+class CreateExportJobHandler(UseCase[CreateExportJobRequest, CreateExportJobResponse]):
+    """Use case for queueing a whole-form export, or joining an identical one still running."""
+    
+    @inject
+    def __init__(
+        self,
+        form_repository: IFormRepository = Provide[Container.form_repository],
+        export_job_repository: IExportJobRepository = Provide[Container.export_job_repository],
+        event_bus: EventBus = Provide[Container.request_event_bus],
+    ):
+        self.form_repository = form_repository
+        self.export_job_repository = export_job_repository
+        self.event_bus = event_bus
+    
+    async def handle(self, request: CreateExportJobRequest) -> CreateExportJobResponse:
+        form = await self.form_repository.get_by_id(request.form_id)
+        if not form:
+            raise ValueError(f"Form with id {request.form_id} not found")
+        if form.creator_id != request.requester_id and not request.requester_is_super_admin:
+            raise PermissionError(f"Not authorized to export form {request.form_id}")
+        
+        filters = request.filters.model_dump(mode="json", exclude_none=True)
+        job, created = await self.export_job_repository.create_or_get_active(
+            ExportJob(
+                id=uuid4(),
+                form_id=form.id,
+                format=request.format,
+                locale=request.locale,
+                filters=filters,
+                dedupe_key=self._dedupe_key(form.id, request.format, request.locale, filters),
+            ),
+            stale_before=datetime.utcnow() - timedelta(seconds=settings.export_job_stale_seconds),
+        )
+        if created:
+            # Published after commit, so the worker always finds the job row
+            await self.event_bus.publish(ExportJobRequestedEvent(job_id=job.id))
+        return CreateExportJobResponse(job=export_job_to_dto(job), created=created)
+    
+    @staticmethod
+    def _dedupe_key(form_id: UUID, format: str, locale: str, filters: dict) -> str:
+        payload = json.dumps(
+            {"form_id": str(form_id), "format": format, "locale": locale, "filters": filters},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
@@ -0,0 +1,83 @@
+from uuid import UUID, uuid4
+from datetime import datetime, timedelta
+from pydantic import BaseModel
+from mediatr import GenericQuery, Mediator
+from dependency_injector.wiring import inject, Provide
+from app.core.container import Container  # noqa: F401
+from app.core.config import settings
+
+from app.application.ports.usecase import UseCase
+from app.domain.repositories.form_repository import IFormRepository
+from app.infrastructure.services.azure_storage import azure_storage_client
+
+
+# Direct uploads live here until a submission takes them over (or the sweeper removes them)
+UPLOAD_BLOB_ROOT = "uploads/"
+
+
+def upload_blob_prefix(form_id: UUID, field_id: UUID) -> str:
+    """Blob path prefix that direct uploads for a form field must live under."""
+    return f"{UPLOAD_BLOB_ROOT}{form_id}/{field_id}/"
+
+
+def safe_blob_filename(filename: str) -> str:
+    """Client-supplied filename made safe for the last segment of a blob name."""
+    filename = filename.replace("/", "_").replace("\\", "_")
+    if ".." in filename:
+        raise ValueError("Invalid filename")
+    return filename or "file"
+
+
+class CreateUploadUrlResponse(BaseModel):
+    """Response containing a pre-signed upload URL."""
+    blob_name: str
+    upload_url: str
+    expires_at: datetime
+    # Headers the client must send with the PUT request
+    headers: dict[str, str]
+
+
+class CreateUploadUrlRequest(BaseModel, GenericQuery[CreateUploadUrlResponse]):
+    """Request for a write-only upload URL scoped to a form field."""
+    form_id: UUID | None = None
+    field_id: UUID
+    filename: str
+    content_type: str | None = None
+    file_size: int | None = None
+
+
+@Mediator.handler
+class CreateUploadUrlHandler(UseCase[CreateUploadUrlRequest, CreateUploadUrlResponse]):
+    """Use case for issuing a short-lived SAS URL for a direct-to-storage upload."""
+
+    @inject
+    def __init__(self, form_repository: IFormRepository = Provide[Container.form_repository]):
+        self.form_repository = form_repository
+
+    async def handle(self, request: CreateUploadUrlRequest) -> CreateUploadUrlResponse:
+        if request.file_size is not None and request.file_size > settings.upload_max_file_size:
+            raise ValueError(f"File too large (max {settings.upload_max_file_size} bytes)")
+
+        form = await self.form_repository.get_by_id(request.form_id)
+        if not form:
+            raise ValueError("Form not found")
+        if not any(f.id == request.field_id for f in form.fields):
+            raise ValueError("Field not found in form")
+
+        filename = safe_blob_filename(request.filename)
+        blob_name = f"{upload_blob_prefix(form.id, request.field_id)}{uuid4()}/{filename}"
+        upload_url, expires_at = await azure_storage_client.generate_upload_url(
+            blob_name,
+            timedelta(minutes=settings.upload_url_expiry_minutes)
+        )
+
+        headers = {"x-ms-blob-type": "BlockBlob"}
+        if request.content_type:
+            headers["x-ms-blob-content-type"] = request.content_type
+
+        return CreateUploadUrlResponse(
+            blob_name=blob_name,
+            upload_url=upload_url,
+            expires_at=expires_at,
+            headers=headers
+        )
@@ -6,7 +6,8 @@ from app.core.container import Container  # noqa: F401
 
 from app.application.ports.usecase import UseCase
 from app.domain.repositories.form_submission_repository import IFormSubmissionRepository
-from typing import TYPE_CHECKING
+from app.domain.services.export_cache import IExportCache
+from app.core.request_scope import on_commit
 
 
 class DeleteSubmissionResponse(BaseModel):
@@ -24,12 +25,22 @@ class DeleteSubmissionHandler(UseCase[DeleteSubmissionRequest, DeleteSubmissionR
     """Use case for deleting a submission."""
     
     @inject
-    def __init__(self, submission_repository: IFormSubmissionRepository = Provide[Container.form_submission_repository]):
+    def __init__(
+        self,
+        submission_repository: IFormSubmissionRepository = Provide[Container.form_submission_repository],
+        export_cache: IExportCache = Provide[Container.export_cache],
+    ):
         self.submission_repository = submission_repository
+        self.export_cache = export_cache
     
     async def handle(self, request: DeleteSubmissionRequest) -> DeleteSubmissionResponse:
+        # Cached exports are stored under the form, so look it up before deleting
+        metadata = await self.submission_repository.get_export_metadata(request.submission_id)
         success = await self.submission_repository.delete(request.submission_id)
         if not success:
             raise ValueError("Submission not found")
+        if metadata:
+            # Before the commit, a concurrent export would just cache the deleted submission again
+            await on_commit(lambda: self.export_cache.invalidate_submission(metadata["form_id"], request.submission_id))
         return DeleteSubmissionResponse(success=success)
 
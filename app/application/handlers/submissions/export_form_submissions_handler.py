@@ -0,0 +1,71 @@
+from collections.abc import AsyncIterator
+from pydantic import BaseModel
+from mediatr import GenericQuery, Mediator
+from dependency_injector.wiring import inject, Provide
+from uuid import UUID
+
+from app.application.ports.usecase import UseCase
+from app.application.queries import ReadOnlyRequest
+from app.domain.repositories.form_repository import IFormRepository
+from app.domain.repositories.form_submission_repository import IFormSubmissionRepository
+from app.domain.services.submission_export_service import ISubmissionExportService, ExportFormat, EXPORT_MEDIA_TYPES
+from app.core.config import settings
+from app.core.container import Container  # noqa: F401
+
+
+class ExportFormSubmissionsResponse(BaseModel):
+    """Response containing the streamed export of all submissions of a form."""
+    content: AsyncIterator[bytes]
+    filename: str
+    media_type: str
+    
+    class Config:
+        arbitrary_types_allowed = True
+
+
+class ExportFormSubmissionsRequest(BaseModel, ReadOnlyRequest, GenericQuery[ExportFormSubmissionsResponse]):
+    """Request for exporting all submissions of a form as one table."""
+    form_id: UUID
+    format: ExportFormat = "csv"
+    locale: str = "en"
+    # Only the form's creator (or a super admin) may export its submissions
+    requester_id: UUID
+    requester_is_super_admin: bool = False
+
+
+@Mediator.handler
+class ExportFormSubmissionsHandler(UseCase[ExportFormSubmissionsRequest, ExportFormSubmissionsResponse]):
+    """Use case for exporting a form's submissions, one row per submission and one column per field."""
+    
+    @inject
+    def __init__(
+        self,
+        form_repository: IFormRepository = Provide[Container.form_repository],
+        submission_repository: IFormSubmissionRepository = Provide[Container.form_submission_repository],
+        export_service: ISubmissionExportService = Provide[Container.submission_export_service],
+    ):
+        self.form_repository = form_repository
+        self.submission_repository = submission_repository
+        self.export_service = export_service
+    
+    async def handle(self, request: ExportFormSubmissionsRequest) -> ExportFormSubmissionsResponse:
+        form = await self.form_repository.get_by_id(request.form_id)
+        if not form:
+            raise ValueError(f"Form with id {request.form_id} not found")
+        if form.creator_id != request.requester_id and not request.requester_is_super_admin:
+            raise PermissionError(f"Not authorized to export form {request.form_id}")
+        
+        # Signatures are exported as present/absent only, so their images are never loaded
+        signature_field_ids = [field.id for field in form.fields if field.field_type == "signature"]
+        batches = self.submission_repository.stream_export_batches(
+            form.id, signature_field_ids, settings.export_batch_size
+        )
+        if request.format == "xlsx":
+            content = self.export_service.stream_form_xlsx(form, batches, request.locale)
+        else:
+            content = self.export_service.stream_form_csv(form, batches, request.locale)
+        return ExportFormSubmissionsResponse(
+            content=content,
+            filename=self.export_service.form_export_filename(form, request.format),
+            media_type=EXPORT_MEDIA_TYPES[request.format],
+        )
@@ -0,0 +1,192 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+from typing import Any
+from uuid import UUID
+
+from app.application.handlers.submissions.create_export_job_handler import ExportJobFilters
+from app.domain.events.export_events import ExportJobRequestedEvent
+from app.domain.repositories.export_job_repository import IExportJobRepository
+from app.domain.services.submission_export_service import ISubmissionExportService, EXPORT_MEDIA_TYPES
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.infrastructure.repositories.export_job_repository import ExportJobRepository
+from app.infrastructure.repositories.form_repository import FormRepository
+from app.infrastructure.repositories.form_submission_repository import FormSubmissionRepository
+from app.infrastructure.services.azure_storage import AzureBlobStorageClient, azure_storage_client
+
+
+logger = logging.getLogger(__name__)
+
+
+def export_blob_name(form_id: UUID, job_id: UUID, format: str) -> str:
+    """Blob path of the file produced by an export job."""
+    return f"exports/{form_id}/{job_id}.{format}"
+
+
+class _ChunkReader:
+    """Awaitable `read(n)` over an async iterator of byte chunks, for `upload_stream`."""
+    
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks.__aiter__()
+        self._buffer = bytearray()
+        self._exhausted = False
+    
+    async def read(self, size: int = -1) -> bytes:
+        while not self._exhausted and (size < 0 or len(self._buffer) < size):
+            try:
+                self._buffer += await self._chunks.__anext__()
+            except StopAsyncIteration:
+                self._exhausted = True
+        if size < 0:
+            size = len(self._buffer)
+        data = bytes(self._buffer[:size])
+        del self._buffer[:size]
+        return data
+
+
+class ExportJobWorker:
+    """
+    Event handler rendering background export jobs and uploading them to blob storage.
+    
+    Jobs run as tasks of this process, at most `concurrency` at a time; `handle`
+    only schedules them, so publishing the event does not wait for the export.
+    Status and progress are written to the job row in short transactions of their
+    own, leaving the session that streams the submissions untouched.
+    
+    On startup, `recover` picks up jobs a previous run left behind; on shutdown,
+    `shutdown` lets running jobs finish within a grace period and fails the rest.
+    Jobs still waiting for a slot stay pending for the next `recover`.
+    """
+    
+    def __init__(
+        self,
+        export_service: ISubmissionExportService,
+        storage: AzureBlobStorageClient = azure_storage_client,
+        session_factory=AsyncSessionLocal,
+        concurrency: int = settings.export_job_concurrency,
+    ):
+        self.export_service = export_service
+        self.storage = storage
+        self.session_factory = session_factory
+        self._semaphore = asyncio.Semaphore(concurrency)
+        # Strong references, so running jobs are not garbage collected
+        self._tasks: set[asyncio.Task] = set()
+        self._closed = False
+    
+    async def handle(self, event: ExportJobRequestedEvent) -> None:
+        """Schedule the requested job."""
+        if self._closed:
+            logger.info(f"Shutting down; export job {event.job_id} stays pending until the next start")
+            return
+        task = asyncio.create_task(self._run(event.job_id))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+    
+    async def drain(self) -> None:
+        """Wait for all scheduled jobs to finish."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+    
+    async def recover(self) -> None:
+        """
+        Take over the jobs left behind by a previous run.
+        
+        Running jobs that stopped reporting progress are failed (a partial export can't
+        be resumed), and pending ones are scheduled again. Another process picking up
+        the same pending job is harmless: only one of them can move it to running.
+        """
+        stale_before = datetime.utcnow() - timedelta(seconds=settings.export_job_stale_seconds)
+        async with self.session_factory() as session:
+            jobs: IExportJobRepository = ExportJobRepository(session)
+            failed = await jobs.fail_stale_running(stale_before)
+            pending = await jobs.requeue_pending()
+            await session.commit()
+        if failed or pending:
+            logger.info(f"Recovered export jobs: {failed} stale failed, {len(pending)} pending requeued")
+        for job_id in pending:
+            await self.handle(ExportJobRequestedEvent(job_id=job_id))
+    
+    async def shutdown(self, grace_seconds: float) -> None:
+        """Stop taking jobs and wait up to `grace_seconds` for scheduled ones; interrupt the rest."""
+        self._closed = True
+        if not self._tasks:
+            return
+        _, unfinished = await asyncio.wait(set(self._tasks), timeout=grace_seconds)
+        for task in unfinished:
+            task.cancel()
+        await asyncio.gather(*unfinished, return_exceptions=True)
+        if unfinished:
+            logger.warning(f"Interrupted {len(unfinished)} export job(s) on shutdown")
+    
+    async def _run(self, job_id: UUID) -> None:
+        # Cancelled while waiting for a slot, the job is still pending and is picked up again
+        async with self._semaphore:
+            try:
+                await self._export(job_id)
+            except asyncio.CancelledError:
+                await self._update(lambda jobs: jobs.mark_failed(job_id, "Export interrupted by server shutdown"))
+                raise
+            except Exception as e:
+                logger.error(f"Export job {job_id} failed: {e}", exc_info=True)
+                await self._update(lambda jobs: jobs.mark_failed(job_id, str(e) or type(e).__name__))
+    
+    async def _export(self, job_id: UUID) -> None:
+        async with self.session_factory() as session:
+            jobs: IExportJobRepository = ExportJobRepository(session)
+            submission_repo = FormSubmissionRepository(session)
+            
+            job = await jobs.get_by_id(job_id)
+            if not job:
+                logger.warning(f"Export job {job_id} not found")
+                return
+            form = await FormRepository(session).get_by_id(job.form_id)
+            if not form:
+                raise ValueError(f"Form with id {job.form_id} not found")
+            
+            filters = ExportJobFilters.model_validate(job.filters or {}).model_dump()
+            total_rows = await submission_repo.count_for_export(form.id, **filters)
+            if not await jobs.mark_running(job.id, total_rows):
+                logger.info(f"Export job {job_id} is already being processed")
+                return
+            await session.commit()
+            
+            # Signatures are exported as present/absent only, so their images are never loaded
+            signature_field_ids = [field.id for field in form.fields if field.field_type == "signature"]
+            batches = self._report_progress(
+                job.id,
+                submission_repo.stream_export_batches(
+                    form.id, signature_field_ids, settings.export_batch_size, **filters
+                )
+            )
+            if job.format == "xlsx":
+                content = self.export_service.stream_form_xlsx(form, batches, job.locale)
+            else:
+                content = self.export_service.stream_form_csv(form, batches, job.locale)
+            
+            blob_name = export_blob_name(form.id, job.id, job.format)
+            _, file_size = await self.storage.upload_stream(
+                _ChunkReader(content), blob_name, content_type=EXPORT_MEDIA_TYPES[job.format]
+            )
+            filename = self.export_service.form_export_filename(form, job.format)
+        
+        await self._update(lambda jobs: jobs.mark_completed(job_id, blob_name, filename, file_size))
+        logger.info(f"Export job {job_id} completed: {file_size} bytes in {blob_name}")
+    
+    async def _report_progress(
+        self,
+        job_id: UUID,
+        batches: AsyncIterator[list[dict[str, Any]]],
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        processed_rows = 0
+        async for batch in batches:
+            yield batch
+            # The previous batch has been rendered once the next one is requested
+            processed_rows += len(batch)
+            await self._update(lambda jobs: jobs.update_progress(job_id, processed_rows))
+    
+    async def _update(self, change) -> None:
+        async with self.session_factory() as session:
+            await change(ExportJobRepository(session))
+            await session.commit()
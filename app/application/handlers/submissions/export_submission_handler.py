@@ -1,18 +1,20 @@
 from pydantic import BaseModel
 from mediatr import GenericQuery, Mediator
 from dependency_injector.wiring import inject, Provide
-from io import BytesIO
+from io import IOBase
 from uuid import UUID
 
 from app.application.ports.usecase import UseCase
+from app.application.queries import ReadOnlyRequest
 from app.domain.repositories.form_submission_repository import IFormSubmissionRepository
 from app.domain.services.submission_export_service import ISubmissionExportService, ExportFormat
+from app.domain.services.export_cache import IExportCache, export_cache_key
 from app.core.container import Container  # noqa: F401
 
 
 class ExportSubmissionResponse(BaseModel):
     """Response containing exported submission file."""
-    file_buffer: BytesIO
+    file_buffer: IOBase
     filename: str
     media_type: str
     
@@ -20,7 +22,7 @@ class ExportSubmissionResponse(BaseModel):
         arbitrary_types_allowed = True
 
 
-class ExportSubmissionRequest(BaseModel, GenericQuery[ExportSubmissionResponse]):
+class ExportSubmissionRequest(BaseModel, ReadOnlyRequest, GenericQuery[ExportSubmissionResponse]):
     """Request for exporting a submission."""
     submission_id: UUID
     format: ExportFormat
@@ -36,30 +38,45 @@ class ExportSubmissionHandler(UseCase[ExportSubmissionRequest, ExportSubmissionR
         self,
         submission_repository: IFormSubmissionRepository = Provide[Container.form_submission_repository],
         export_service: ISubmissionExportService = Provide[Container.submission_export_service],
+        export_cache: IExportCache = Provide[Container.export_cache],
     ):
         self.submission_repository = submission_repository
         self.export_service = export_service
+        self.export_cache = export_cache
     
     async def handle(self, request: ExportSubmissionRequest) -> ExportSubmissionResponse:
         """Handle export submission request."""
-        # Get submission with all related data
-        submission = await self.submission_repository.get_by_id(request.submission_id)
+        # Narrow lookup first: enough to name the file and find a cached copy
+        metadata = await self.submission_repository.get_export_metadata(request.submission_id)
         
-        if not submission:
+        if not metadata:
             raise ValueError(f"Submission with id {request.submission_id} not found")
         
-        # Export submission
-        file_buffer, filename = await self.export_service.export_submission(
-            submission, 
-            request.format,
-            request.locale
-        )
+        key = export_cache_key(request.submission_id, metadata["form_updated_at"], request.format, request.locale)
+        file_buffer = await self.export_cache.get(metadata["form_id"], request.submission_id, key)
+        if file_buffer is None:
+            # Get submission with all related data
+            submission = await self.submission_repository.get_by_id(request.submission_id)
+            if not submission:
+                raise ValueError(f"Submission with id {request.submission_id} not found")
+            
+            # Export submission
+            file_buffer, _ = await self.export_service.export_submission(
+                submission, 
+                request.format,
+                request.locale
+            )
+            # Keyed by the form version actually rendered
+            key = export_cache_key(request.submission_id, submission.form.updated_at, request.format, request.locale)
+            await self.export_cache.put(submission.form_id, request.submission_id, key, file_buffer)
         
         # Determine media type based on format
         media_type = "text/csv" if request.format == "csv" else "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
         
         return ExportSubmissionResponse(
             file_buffer=file_buffer,
-            filename=filename,
+            filename=self.export_service.submission_export_filename(
+                metadata["form_title"], metadata["user_name"], request.format
+            ),
             media_type=media_type
         )
@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta
+from uuid import UUID
+from pydantic import BaseModel
+from mediatr import GenericQuery, Mediator
+from dependency_injector.wiring import inject, Provide
+
+from app.application.dto.models import ExportJobDTO
+from app.application.handlers.submissions.create_export_job_handler import export_job_to_dto
+from app.application.ports.usecase import UseCase
+from app.application.queries import PrimaryReadRequest
+from app.domain.models import ExportJobStatus, ACTIVE_EXPORT_JOB_STATUSES, STALE_EXPORT_JOB_ERROR
+from app.domain.repositories.export_job_repository import IExportJobRepository
+from app.domain.repositories.form_repository import IFormRepository
+from app.infrastructure.services.azure_storage import azure_storage_client
+from app.core.config import settings
+from app.core.container import Container  # noqa: F401
+
+
+class GetExportJobResponse(BaseModel):
+    """Response containing an export job; completed jobs carry a download URL."""
+    job: ExportJobDTO
+
+
+class GetExportJobRequest(BaseModel, PrimaryReadRequest, GenericQuery[GetExportJobResponse]):
+    """
+    Request for the status of a background export.
+    
+    Read from the primary: the job is polled while the worker updates it, and a
+    lagging replica would show stale progress or no job at all.
+    """
+    job_id: UUID
+    # Only the exported form's creator (or a super admin) may follow the job
+    requester_id: UUID
+    requester_is_super_admin: bool = False
+
+
+@Mediator.handler
+class GetExportJobHandler(UseCase[GetExportJobRequest, GetExportJobResponse]):
+    """Use case for polling a background export job."""
+    
+    @inject
+    def __init__(
+        self,
+        export_job_repository: IExportJobRepository = Provide[Container.export_job_repository],
+        form_repository: IFormRepository = Provide[Container.form_repository],
+    ):
+        self.export_job_repository = export_job_repository
+        self.form_repository = form_repository
+    
+    async def handle(self, request: GetExportJobRequest) -> GetExportJobResponse:
+        job = await self.export_job_repository.get_by_id(request.job_id)
+        if not job:
+            raise ValueError(f"Export job with id {request.job_id} not found")
+        form = await self.form_repository.get_by_id(job.form_id)
+        if not request.requester_is_super_admin and (form is None or form.creator_id != request.requester_id):
+            raise PermissionError(f"Not authorized to access export job {request.job_id}")
+        
+        stale_before = datetime.utcnow() - timedelta(seconds=settings.export_job_stale_seconds)
+        if job.status in ACTIVE_EXPORT_JOB_STATUSES and job.updated_at < stale_before:
+            # Abandoned, e.g. its process died; the row itself is failed by the next
+            # request for the same export or on worker startup
+            dto = export_job_to_dto(job)
+            return GetExportJobResponse(
+                job=dto.model_copy(update={"status": ExportJobStatus.FAILED.value, "error": STALE_EXPORT_JOB_ERROR})
+            )
+        
+        download_url = None
+        if job.status == ExportJobStatus.COMPLETED:
+            download_url, _ = await azure_storage_client.generate_download_url(
+                job.blob_name,
+                timedelta(minutes=settings.export_job_url_expiry_minutes),
+                filename=job.filename
+            )
+        return GetExportJobResponse(job=export_job_to_dto(job, download_url))
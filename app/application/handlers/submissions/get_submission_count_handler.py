@@ -5,6 +5,7 @@ from dependency_injector.wiring import inject, Provide
 from app.core.container import Container  # noqa: F401
 
 from app.application.ports.usecase import UseCase
+from app.application.queries import ReadOnlyRequest
 from app.domain.repositories.form_submission_repository import IFormSubmissionRepository
 from typing import TYPE_CHECKING
 
@@ -14,7 +15,7 @@ class GetSubmissionCountResponse(BaseModel):
     count: int
 
 
-class GetSubmissionCountRequest(BaseModel, GenericQuery[GetSubmissionCountResponse]):
+class GetSubmissionCountRequest(BaseModel, ReadOnlyRequest, GenericQuery[GetSubmissionCountResponse]):
     """Request for getting submission count by form ID."""
     form_id: UUID
 
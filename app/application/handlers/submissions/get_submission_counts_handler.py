@@ -0,0 +1,38 @@
+from uuid import UUID
+from pydantic import BaseModel
+from mediatr import GenericQuery, Mediator
+from dependency_injector.wiring import inject, Provide
+from app.core.container import Container  # noqa: F401
+
+from app.application.ports.usecase import UseCase
+from app.application.queries import ReadOnlyRequest
+from app.domain.repositories.form_submission_repository import IFormSubmissionRepository
+
+
+MAX_FORM_IDS = 500
+
+
+class GetSubmissionCountsResponse(BaseModel):
+    """Response containing submission counts keyed by form ID."""
+    counts: dict[UUID, int]
+
+
+class GetSubmissionCountsRequest(BaseModel, ReadOnlyRequest, GenericQuery[GetSubmissionCountsResponse]):
+    """Request for getting submission counts for several forms."""
+    form_ids: list[UUID]
+
+
+@Mediator.handler
+class GetSubmissionCountsHandler(UseCase[GetSubmissionCountsRequest, GetSubmissionCountsResponse]):
+    """Use case for getting submission counts for many forms in one call."""
+    
+    @inject
+    def __init__(self, submission_repository: IFormSubmissionRepository = Provide[Container.form_submission_repository]):
+        self.submission_repository = submission_repository
+    
+    async def handle(self, request: GetSubmissionCountsRequest) -> GetSubmissionCountsResponse:
+        form_ids = list(dict.fromkeys(request.form_ids))
+        if len(form_ids) > MAX_FORM_IDS:
+            raise ValueError(f"Too many form ids (max {MAX_FORM_IDS})")
+        counts = await self.submission_repository.count_by_form_ids(form_ids)
+        return GetSubmissionCountsResponse(counts=counts)
@@ -5,6 +5,7 @@ from dependency_injector.wiring import inject, Provide
 from app.core.container import Container  # noqa: F401
 
 from app.application.ports.usecase import UseCase
+from app.application.queries import ReadOnlyRequest
 from app.domain.repositories.form_submission_repository import IFormSubmissionRepository
 from app.application.dto.models import FormSubmissionDTO, FileDTO, FormFieldValueDTO, UserDTO, FormDTO, FormFieldDTO
 
@@ -13,7 +14,7 @@ class GetSubmissionResponse(BaseModel):
     submission: FormSubmissionDTO
 
 
-class GetSubmissionRequest(BaseModel, GenericQuery[GetSubmissionResponse]):
+class GetSubmissionRequest(BaseModel, ReadOnlyRequest, GenericQuery[GetSubmissionResponse]):
     submission_id: UUID
 
 
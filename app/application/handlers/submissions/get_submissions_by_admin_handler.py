@@ -6,18 +6,27 @@ from dependency_injector.wiring import inject, Provide
 from app.core.container import Container  # noqa: F401
 
 from app.application.ports.usecase import UseCase
-from app.domain.models import FormSubmission
+from app.application.queries import ReadOnlyRequest
+from app.domain.repositories.form_repository import IFormRepository
 from app.domain.repositories.form_submission_repository import IFormSubmissionRepository
-from app.application.dto.models import FormSubmissionDTO, FileDTO, FormFieldValueDTO, UserDTO, FormDTO, FormFieldDTO
-from typing import TYPE_CHECKING
+from app.application.services.form_schema_cache import FormSchemaCache
+from app.application.pagination import encode_cursor, decode_cursor
+from app.application.dto.models import FormSubmissionDTO, FormSubmissionSummaryDTO, FormDTO, UserDTO
+from typing import Literal
 
 
 class GetSubmissionsByAdminResponse(BaseModel):
     """Response containing submissions for admin."""
-    submissions: list[FormSubmissionDTO]
+    # Full submissions, or summary rows when requested with view="summary"
+    submissions: list[FormSubmissionDTO] | list[FormSubmissionSummaryDTO]
+    # Pass back as `cursor` to fetch the next page; None on the last page
+    next_cursor: str | None = None
+    # view="normalized" only: each form/user once, referenced by the submissions' ids
+    forms: dict[UUID, FormDTO] | None = None
+    users: dict[UUID, UserDTO] | None = None
 
 
-class GetSubmissionsByAdminRequest(BaseModel, GenericQuery[GetSubmissionsByAdminResponse]):
+class GetSubmissionsByAdminRequest(BaseModel, ReadOnlyRequest, GenericQuery[GetSubmissionsByAdminResponse]):
     """Request for getting submissions by admin ID."""
     admin_id: UUID
     skip: int = 0
@@ -28,6 +37,12 @@ class GetSubmissionsByAdminRequest(BaseModel, GenericQuery[GetSubmissionsByAdmin
     user_email: str | None = None
     field_value_search: str | None = None
     form_id: UUID | None = None
+    cursor: str | None = None
+    # Full-text search over submitter and values; results are ranked by relevance
+    search: str | None = None
+    # "summary" returns FormSubmissionSummaryDTO rows loaded with a narrow projection;
+    # "normalized" moves forms and users to top-level maps keyed by id
+    view: Literal["full", "summary", "normalized"] = "full"
 
 
 @Mediator.handler
@@ -35,77 +50,74 @@ class GetSubmissionsByAdminHandler(UseCase[GetSubmissionsByAdminRequest, GetSubm
     """Use case for getting submissions by admin ID."""
     
     @inject
-    def __init__(self, submission_repository: IFormSubmissionRepository = Provide[Container.form_submission_repository]):
+    def __init__(
+        self,
+        submission_repository: IFormSubmissionRepository = Provide[Container.form_submission_repository],
+        form_repository: IFormRepository = Provide[Container.form_repository],
+        form_cache: FormSchemaCache = Provide[Container.form_schema_cache]
+    ):
         self.submission_repository = submission_repository
+        self.form_repository = form_repository
+        self.form_cache = form_cache
     
     async def handle(self, request: GetSubmissionsByAdminRequest) -> GetSubmissionsByAdminResponse:
-        submissions = await self.submission_repository.get_by_admin_id(
+        cursor = decode_cursor(request.cursor) if request.cursor else None
+        # Fetch one extra row to know whether another page exists
+        load_rows = (
+            self.submission_repository.get_summary_rows_by_admin_id
+            if request.view == "summary"
+            else self.submission_repository.get_rows_by_admin_id
+        )
+        options = {"include_form": False} if request.view == "normalized" else {}
+        rows = await load_rows(
             request.admin_id,
-            request.skip,
-            request.limit,
+            0 if cursor else request.skip,
+            request.limit + 1,
             request.date_from,
             request.date_to,
             request.user_name,
             request.user_email,
             request.field_value_search,
-            request.form_id
+            request.form_id,
+            cursor,
+            request.search,
+            **options
+        )
+        next_cursor = None
+        if len(rows) > request.limit:
+            rows = rows[:request.limit]
+            # Ranked search results are not in keyset order; page them with skip/limit
+            if not request.search:
+                next_cursor = encode_cursor(rows[-1]["submitted_at"], rows[-1]["id"])
+        if request.view == "normalized":
+            return await self._normalized_response(rows, next_cursor)
+        # Rows are already shaped like the DTO (nested JSON aggregated by the database)
+        dto_class = FormSubmissionSummaryDTO if request.view == "summary" else FormSubmissionDTO
+        dto_list = [dto_class.model_validate(row) for row in rows]
+        return GetSubmissionsByAdminResponse(submissions=dto_list, next_cursor=next_cursor)
+    
+    async def _normalized_response(self, rows: list[dict], next_cursor: str | None) -> GetSubmissionsByAdminResponse:
+        """Move users and forms out of the rows into maps, loading each distinct form once."""
+        users: dict[UUID, UserDTO] = {}
+        for row in rows:
+            user = row.pop("user")
+            if row["user_id"] not in users:
+                users[row["user_id"]] = UserDTO.model_validate(user)
+        
+        forms: dict[UUID, FormDTO] = {}
+        missing: list[UUID] = []
+        for form_id in dict.fromkeys(row["form_id"] for row in rows):
+            compiled = self.form_cache.get(form_id)
+            if compiled is not None:
+                forms[form_id] = compiled.dto
+            else:
+                missing.append(form_id)
+        for form in await self.form_repository.get_by_ids(missing):
+            forms[form.id] = self.form_cache.put(form).dto
+        
+        return GetSubmissionsByAdminResponse(
+            submissions=[FormSubmissionDTO.model_validate(row) for row in rows],
+            next_cursor=next_cursor,
+            forms=forms,
+            users=users
         )
-        dto_list: list[FormSubmissionDTO] = []
-        for s in submissions:
-            dto_list.append(
-                FormSubmissionDTO(
-                    id=s.id,
-                    form_id=s.form_id,
-                    user_id=s.user_id,
-                    submitted_at=s.submitted_at,
-                    user=UserDTO(
-                        id=s.user.id,
-                        name=s.user.name,
-                        email=s.user.email,
-                        is_admin=s.user.is_admin,
-                        is_super_admin=s.user.is_super_admin,
-                        is_approved=s.user.is_approved,
-                        admin_id=s.user.admin_id,
-                        created_at=getattr(s.user, 'created_at', None)
-                    ) if getattr(s, 'user', None) else None,
-                    form=FormDTO(
-                        id=s.form.id,
-                        title=s.form.title,
-                        description=s.form.description,
-                        creator_id=s.form.creator_id,
-                        created_at=getattr(s.form, 'created_at', None),
-                        updated_at=getattr(s.form, 'updated_at', None),
-                        fields=[
-                            FormFieldDTO(
-                                id=f.id,
-                                field_type=f.field_type,
-                                label=f.label,
-                                name=f.name,
-                                is_required=f.is_required,
-                                order=f.order,
-                                options=f.options,
-                                placeholder=getattr(f, 'placeholder', None)
-                            ) for f in s.form.fields
-                        ]
-                    ) if getattr(s, 'form', None) else None,
-                    field_values=[
-                        FormFieldValueDTO(
-                            id=v.id,
-                            field_id=v.field_id,
-                            value=v.value
-                        ) for v in s.field_values
-                    ],
-                    files=[
-                        FileDTO(
-                            id=f.id,
-                            field_id=f.field_id,
-                            original_filename=f.original_filename,
-                            blob_url=f.blob_url,
-                            file_size=f.file_size,
-                            content_type=f.content_type
-                        ) for f in s.files
-                    ]
-                )
-            )
-        return GetSubmissionsByAdminResponse(submissions=dto_list)
-
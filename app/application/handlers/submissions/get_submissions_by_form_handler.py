@@ -5,8 +5,10 @@ from dependency_injector.wiring import inject, Provide
 from app.core.container import Container  # noqa: F401
 
 from app.application.ports.usecase import UseCase
+from app.application.queries import ReadOnlyRequest
 from app.domain.models import FormSubmission
 from app.domain.repositories.form_submission_repository import IFormSubmissionRepository
+from app.application.pagination import encode_cursor, decode_cursor
 from app.application.dto.models import FormSubmissionDTO, FileDTO, FormFieldValueDTO
 from typing import TYPE_CHECKING
 
@@ -14,11 +16,16 @@ from typing import TYPE_CHECKING
 class GetSubmissionsByFormResponse(BaseModel):
     """Response containing submissions for form."""
     submissions: list[FormSubmissionDTO]
+    # Pass back as `cursor` to fetch the next page; None on the last page
+    next_cursor: str | None = None
 
 
-class GetSubmissionsByFormRequest(BaseModel, GenericQuery[GetSubmissionsByFormResponse]):
+class GetSubmissionsByFormRequest(BaseModel, ReadOnlyRequest, GenericQuery[GetSubmissionsByFormResponse]):
     """Request for getting submissions by form ID."""
     form_id: UUID
+    skip: int = 0
+    limit: int = 10
+    cursor: str | None = None
 
 
 @Mediator.handler
@@ -30,7 +37,18 @@ class GetSubmissionsByFormHandler(UseCase[GetSubmissionsByFormRequest, GetSubmis
         self.submission_repository = submission_repository
     
     async def handle(self, request: GetSubmissionsByFormRequest) -> GetSubmissionsByFormResponse:
-        submissions = await self.submission_repository.get_by_form_id(request.form_id)
+        cursor = decode_cursor(request.cursor) if request.cursor else None
+        # Fetch one extra row to know whether another page exists
+        submissions = await self.submission_repository.get_by_form_id(
+            request.form_id,
+            0 if cursor else request.skip,
+            request.limit + 1,
+            cursor
+        )
+        next_cursor = None
+        if len(submissions) > request.limit:
+            submissions = submissions[:request.limit]
+            next_cursor = encode_cursor(submissions[-1].submitted_at, submissions[-1].id)
         dto_list: list[FormSubmissionDTO] = []
         for s in submissions:
             dto_list.append(
@@ -60,5 +78,5 @@ class GetSubmissionsByFormHandler(UseCase[GetSubmissionsByFormRequest, GetSubmis
                     ]
                 )
             )
-        return GetSubmissionsByFormResponse(submissions=dto_list)
+        return GetSubmissionsByFormResponse(submissions=dto_list, next_cursor=next_cursor)
 
@@ -1,5 +1,7 @@
 from uuid import UUID, uuid4
 from typing import Any
+import asyncio
+from datetime import datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 import json
@@ -7,6 +9,8 @@ from pydantic import BaseModel
 from mediatr import GenericQuery, Mediator
 from dependency_injector.wiring import inject, Provide
 from app.core.container import Container  # noqa: F401
+from app.core.config import settings
+from app.core.request_scope import on_commit, on_rollback
 
 from app.application.ports.usecase import UseCase
 from app.domain.models import FormSubmission, FormFieldValue, User, File
@@ -19,6 +23,8 @@ from app.domain.events.event_bus import EventBus
 from app.domain.events.submission_events import SubmissionCreatedEvent
 import mimetypes
 from app.application.dto.models import FormSubmissionDTO, FileDTO, FormFieldValueDTO
+from app.application.handlers.submissions.create_upload_url_handler import safe_blob_filename, upload_blob_prefix
+from app.application.services.form_schema_cache import FormSchemaCache, CompiledForm
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +41,9 @@ class SubmitFormRequest(BaseModel, GenericQuery[SubmitFormResponse]):
     user_email: str | None = None
     field_values_json: str | None = None
     file_fields_json: str | None = None
+    # JSON list of blobs uploaded directly via pre-signed URLs:
+    # [{"field_id": "...", "blob_name": "...", "filename": "...", "file_size": 123, "content_type": "..."}]
+    uploaded_files_json: str | None = None
     # will hold starlette UploadFile objects; allow arbitrary types
     files: list[Any] | None = None
 
@@ -54,7 +63,8 @@ class SubmitFormHandler(UseCase[SubmitFormRequest, SubmitFormResponse]):
         submission_repository: IFormSubmissionRepository = Provide[Container.form_submission_repository],
         file_repository: IFileRepository = Provide[Container.file_repository],
         session: AsyncSession = Provide[Container.db_session],
-        event_bus: EventBus = Provide[Container.event_bus]
+        event_bus: EventBus = Provide[Container.request_event_bus],
+        form_cache: FormSchemaCache = Provide[Container.form_schema_cache]
     ):
         self.user_repository = user_repository
         self.form_repository = form_repository
@@ -62,6 +72,7 @@ class SubmitFormHandler(UseCase[SubmitFormRequest, SubmitFormResponse]):
         self.file_repository = file_repository
         self.session = session
         self.event_bus = event_bus
+        self.form_cache = form_cache
     
     async def handle(self, request: SubmitFormRequest) -> SubmitFormResponse:
         # Debug logging
@@ -75,6 +86,8 @@ class SubmitFormHandler(UseCase[SubmitFormRequest, SubmitFormResponse]):
             field_values_dict = json.loads(request.field_values_json) if request.field_values_json else {}
         except json.JSONDecodeError:
             raise ValueError("Invalid field_values JSON")
+        if not isinstance(field_values_dict, dict):
+            raise ValueError("Invalid field_values JSON")
         
         # Parse and process files
         files_dict = {}
@@ -84,9 +97,9 @@ class SubmitFormHandler(UseCase[SubmitFormRequest, SubmitFormResponse]):
                 for idx, file in enumerate(request.files):
                     field_id_str = file_fields_dict.get(str(idx))
                     if field_id_str:
-                        content = await file.read()
+                        # Keep the UploadFile itself; its content is streamed to storage later
                         files_dict.setdefault(field_id_str, []).append({
-                            "content": content,
+                            "file": file,
                             "filename": file.filename or "file"
                         })
             except json.JSONDecodeError as e:
@@ -95,11 +108,42 @@ class SubmitFormHandler(UseCase[SubmitFormRequest, SubmitFormResponse]):
             logger.error(f"Files provided but no file_fields_json. Files: {[f.filename for f in request.files]}")
             raise ValueError("file_fields mapping is required when files are uploaded")
         
-        # Get form
-        form = await self.form_repository.get_by_id(request.form_id)
+        # Parse references to directly uploaded blobs
+        try:
+            uploaded_files = json.loads(request.uploaded_files_json) if request.uploaded_files_json else []
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid uploaded_files JSON: {str(e)}")
+        if not isinstance(uploaded_files, list):
+            raise ValueError("uploaded_files must be a list")
+        
+        # Get compiled form (cached in-process, invalidated on form update/delete)
+        form = await self.form_cache.get_or_load(request.form_id, self.form_repository.get_by_id)
         if not form:
             raise ValueError("Form not found")
         
+        submitted_field_ids = set(field_values_dict) | set(files_dict) | {
+            str(ref.get("field_id")) for ref in uploaded_files if isinstance(ref, dict)
+        }
+        if submitted_field_ids - {str(field_id) for field_id in form.fields}:
+            # Unknown field ids may mean the form changed in another worker; reload once
+            form = await self.form_cache.refresh(request.form_id, self.form_repository.get_by_id)
+            if not form:
+                raise ValueError("Form not found")
+        
+        # Validate required fields and typed values before any upload happens
+        file_field_ids: set[UUID] = set()
+        for field_id in form.fields:
+            field_id_str = str(field_id)
+            has_upload = any(
+                getattr(file_data["file"], "size", None) != 0 for file_data in files_dict.get(field_id_str, [])
+            )
+            has_direct_upload = any(
+                isinstance(ref, dict) and str(ref.get("field_id")) == field_id_str for ref in uploaded_files
+            )
+            if has_upload or has_direct_upload:
+                file_field_ids.add(field_id)
+        form.validate(field_values_dict, file_field_ids)
+        
         # Create or get user
         user = None
         if request.user_email:
@@ -121,12 +165,13 @@ class SubmitFormHandler(UseCase[SubmitFormRequest, SubmitFormResponse]):
         submission = FormSubmission(
             id=uuid4(),
             form_id=request.form_id,
-            user_id=user.id
+            user_id=user.id,
+            submitted_at=datetime.utcnow()
         )
         
         # Create field values
         if field_values_dict:
-            for field in form.fields:
+            for field in form.fields.values():
                 field_id_str = str(field.id)
                 if field_id_str in field_values_dict:
                     value = FormFieldValue(
@@ -137,60 +182,63 @@ class SubmitFormHandler(UseCase[SubmitFormRequest, SubmitFormResponse]):
                     )
                     submission.field_values.append(value)
         
+        # Check direct uploads first: a rejected reference must fail the submission
+        # before any multipart file has been streamed to storage
+        accepted_uploads: list[File] = []
+        upload_sources: list[str] = []
+        if uploaded_files:
+            accepted_uploads, upload_sources = await self._accept_uploaded_files(form, submission.id, uploaded_files)
+            submission.files.extend(accepted_uploads)
+        
         # Handle files
         if files_dict:
+            uploads: list[dict[str, Any]] = []
             for field_id_str, files_list in files_dict.items():
                 try:
                     field_id = UUID(field_id_str)
-                    # Find corresponding field
-                    field = next((f for f in form.fields if f.id == field_id), None)
-                    if not field:
-                        logger.warning(f"Field {field_id_str} not found in form {form.id}")
+                except ValueError:
+                    logger.error(f"Invalid field id in file_fields: {field_id_str}")
+                    continue
+                if field_id not in form.fields:
+                    logger.warning(f"Field {field_id_str} not found in form {form.id}")
+                    continue
+                
+                for file_data in files_list:
+                    upload = file_data.get("file")
+                    if upload is None or getattr(upload, "size", None) == 0:
+                        logger.error(f"No file content for field {field_id_str}")
                         continue
                     
-                    for file_data in files_list:
-                        try:
-                            # Upload file to Azure
-                            file_content = file_data.get("content")
-                            if not file_content:
-                                logger.error(f"No file content for field {field_id_str}")
-                                continue
-                            
-                            original_filename = file_data.get("filename", "file")
-                            blob_name = f"{submission.id}/{field_id}/{uuid4()}/{original_filename}"
-                            
-                            try:
-                                blob_url = await azure_storage_client.upload_file(
-                                    file_content,
-                                    blob_name
-                                )
-                            except Exception as e:
-                                logger.error(f"Failed to upload file to Azure: {str(e)}")
-                                raise ValueError(f"Failed to upload file: {str(e)}")
-                            
-                            # Create file record
-                            file_record = File(
-                                id=uuid4(),
-                                submission_id=submission.id,
-                                field_id=field_id,
-                                original_filename=original_filename,
-                                blob_name=blob_name,
-                                blob_url=blob_url,
-                                file_size=len(file_content),
-                                content_type=mimetypes.guess_type(original_filename)[0]
-                            )
-                            submission.files.append(file_record)
-                        except Exception as e:
-                            logger.error(f"Error processing file for field {field_id_str}: {str(e)}")
-                            raise ValueError(f"Error processing file: {str(e)}")
-                            
-                except ValueError as e:
-                    logger.error(f"Error processing files for field {field_id_str}: {str(e)}")
-                except Exception as e:
-                    logger.error(f"Error processing files for field {field_id_str}: {str(e)}")
-                    raise ValueError(f"Error processing files: {str(e)}")
-        
-        created_submission = await self.submission_repository.create(submission)
+                    original_filename = file_data.get("filename", "file")
+                    uploads.append({
+                        "file": upload,
+                        "field_id": field_id,
+                        "filename": original_filename,
+                        "blob_name": f"{submission.id}/{field_id}/{uuid4()}/{original_filename}",
+                        "content_type": mimetypes.guess_type(original_filename)[0],
+                    })
+            
+            try:
+                uploaded = await self._upload_files(submission.id, uploads)
+            except ValueError:
+                await self._delete_blobs([file.blob_name for file in accepted_uploads])
+                raise
+            submission.files.extend(uploaded)
+        
+        stored_blobs = [file.blob_name for file in submission.files]
+        try:
+            created_submission = await self.submission_repository.create(submission)
+        except Exception:
+            await self._delete_blobs(stored_blobs)
+            raise
+        
+        # The accepted copies are all that is kept of the direct uploads, but the client's
+        # uploads stay until the submission is committed, so a failed submission can be
+        # retried; if it does not commit, the copies and streamed files go instead
+        if upload_sources:
+            await on_commit(lambda: self._delete_blobs(upload_sources))
+        if stored_blobs:
+            on_rollback(lambda: self._delete_blobs(stored_blobs))
         
         # Publish event for notification
         # Note: Transaction is automatically committed by middleware for POST requests
@@ -227,3 +275,171 @@ class SubmitFormHandler(UseCase[SubmitFormRequest, SubmitFormResponse]):
             )
         )
 
+    async def _upload_files(self, submission_id: UUID, uploads: list[dict[str, Any]]) -> list[File]:
+        """
+        Stream all files of a submission to Azure concurrently.
+        
+        At most ``upload_concurrency_per_request`` uploads of this submission run at
+        once (the storage client additionally caps uploads per process). Uploads are
+        all-or-nothing: if any of them fails, the blobs that were already written are
+        deleted and a ValueError is raised.
+        """
+        semaphore = asyncio.Semaphore(settings.upload_concurrency_per_request)
+        
+        async def upload_one(upload: dict[str, Any]) -> tuple[str, int]:
+            async with semaphore:
+                return await azure_storage_client.upload_stream(
+                    upload["file"],
+                    upload["blob_name"],
+                    content_type=upload["content_type"]
+                )
+        
+        results = await asyncio.gather(
+            *(upload_one(upload) for upload in uploads),
+            return_exceptions=True
+        )
+        
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            uploaded = [
+                upload["blob_name"] for upload, result in zip(uploads, results)
+                if not isinstance(result, BaseException)
+            ]
+            logger.error(
+                f"Failed to upload {len(errors)} of {len(uploads)} file(s) to Azure: {str(errors[0])}; "
+                f"removing {len(uploaded)} uploaded blob(s)"
+            )
+            await self._delete_blobs(uploaded)
+            raise ValueError(f"Failed to upload file: {str(errors[0])}")
+        
+        file_records: list[File] = []
+        for upload, (blob_url, file_size) in zip(uploads, results):
+            file_records.append(File(
+                id=uuid4(),
+                submission_id=submission_id,
+                field_id=upload["field_id"],
+                original_filename=upload["filename"],
+                blob_name=upload["blob_name"],
+                blob_url=blob_url,
+                file_size=file_size,
+                content_type=upload["content_type"]
+            ))
+        return file_records
+
+    async def _accept_uploaded_files(
+        self, form: CompiledForm, submission_id: UUID, references: list[Any]
+    ) -> tuple[list[File], list[str]]:
+        """
+        Check blobs uploaded through pre-signed URLs and take them over.
+        
+        Each reference must point inside the upload prefix of a field of this form.
+        The blob is copied to a submission path the upload SAS does not cover, and
+        the checks (exists, non-empty, within the size limit, declared size and
+        content type) run on that copy, so the client cannot swap the content after
+        it was accepted. All-or-nothing: on any rejection the copies are deleted and
+        a ValueError is raised.
+        
+        Returns:
+            Tuple of (file records of the copies, names of the original upload blobs)
+        """
+        accepted: list[dict[str, Any]] = []
+        for reference in references:
+            if not isinstance(reference, dict):
+                raise ValueError("Invalid uploaded file reference")
+            try:
+                field_id = UUID(str(reference.get("field_id")))
+            except ValueError:
+                raise ValueError("Invalid field_id in uploaded file reference")
+            if field_id not in form.fields:
+                raise ValueError(f"Field {field_id} not found in form")
+            
+            blob_name = str(reference.get("blob_name") or "")
+            if not blob_name.startswith(upload_blob_prefix(form.id, field_id)) or ".." in blob_name:
+                raise ValueError(f"Uploaded file {blob_name} does not belong to this form field")
+            
+            filename = reference.get("filename") or blob_name.rsplit("/", 1)[-1]
+            if not isinstance(filename, str):
+                raise ValueError("Invalid filename in uploaded file reference")
+            filename = safe_blob_filename(filename)
+            
+            file_size = reference.get("file_size")
+            # bool is an int subclass; JSON true/false is not a size
+            if file_size is not None and (isinstance(file_size, bool) or not isinstance(file_size, int)):
+                raise ValueError("Invalid file_size in uploaded file reference")
+            
+            content_type = reference.get("content_type")
+            if content_type is not None and not isinstance(content_type, str):
+                raise ValueError("Invalid content_type in uploaded file reference")
+            
+            accepted.append({
+                "field_id": field_id,
+                "source_blob_name": blob_name,
+                "blob_name": f"{submission_id}/{field_id}/{uuid4()}/{filename}",
+                "filename": filename,
+                "file_size": file_size,
+                "content_type": content_type,
+            })
+        
+        copied = await asyncio.gather(
+            *(azure_storage_client.copy_blob(ref["source_blob_name"], ref["blob_name"]) for ref in accepted),
+            return_exceptions=True
+        )
+        copies = [ref["blob_name"] for ref, result in zip(accepted, copied) if result is True]
+        try:
+            for ref, result in zip(accepted, copied):
+                if isinstance(result, BaseException):
+                    raise ValueError(f"Failed to accept uploaded file {ref['source_blob_name']}: {str(result)}")
+                if not result:
+                    raise ValueError(f"Uploaded file {ref['source_blob_name']} not found")
+            
+            properties = await asyncio.gather(
+                *(azure_storage_client.get_blob_properties(ref["blob_name"]) for ref in accepted)
+            )
+            file_records = [
+                self._accepted_file_record(submission_id, ref, blob) for ref, blob in zip(accepted, properties)
+            ]
+        except ValueError:
+            await self._delete_blobs(copies)
+            raise
+        
+        return file_records, [ref["source_blob_name"] for ref in accepted]
+
+    @staticmethod
+    def _accepted_file_record(submission_id: UUID, ref: dict[str, Any], blob: dict[str, Any] | None) -> File:
+        """Validate the accepted copy of a direct upload against what the client declared."""
+        name = ref["source_blob_name"]
+        if blob is None:
+            raise ValueError(f"Uploaded file {name} not found")
+        if not blob["size"]:
+            raise ValueError(f"Uploaded file {name} is empty")
+        if blob["size"] > settings.upload_max_file_size:
+            raise ValueError(f"Uploaded file {name} is too large")
+        if ref["file_size"] is not None and ref["file_size"] != blob["size"]:
+            raise ValueError(f"Uploaded file {name} size does not match")
+        
+        expected_type = ref["content_type"] or mimetypes.guess_type(ref["filename"])[0]
+        content_type = blob["content_type"] or expected_type
+        if expected_type and blob["content_type"] and expected_type != blob["content_type"]:
+            raise ValueError(f"Uploaded file {name} content type does not match")
+        
+        return File(
+            id=uuid4(),
+            submission_id=submission_id,
+            field_id=ref["field_id"],
+            original_filename=ref["filename"],
+            blob_name=ref["blob_name"],
+            blob_url=blob["url"],
+            file_size=blob["size"],
+            content_type=content_type
+        )
+
+    @staticmethod
+    async def _delete_blobs(blob_names: list[str]) -> None:
+        """Best-effort removal of blobs that will not be referenced by a submission."""
+        results = await asyncio.gather(
+            *(azure_storage_client.delete_file(blob_name) for blob_name in blob_names),
+            return_exceptions=True
+        )
+        for blob_name, result in zip(blob_names, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to delete orphaned blob {blob_name}: {str(result)}")
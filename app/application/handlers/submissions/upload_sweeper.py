@@ -0,0 +1,67 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from app.application.handlers.submissions.create_upload_url_handler import UPLOAD_BLOB_ROOT
+from app.core.config import settings
+from app.infrastructure.services.azure_storage import AzureBlobStorageClient, azure_storage_client
+
+
+logger = logging.getLogger(__name__)
+
+
+class UploadSweeper:
+    """
+    Background task deleting direct uploads that no submission took over.
+    
+    Upload URLs are issued to anonymous clients, and a submission removes the blobs
+    it accepted, so whatever is left under `uploads/` was never submitted. A blob is
+    abandoned once it is older than the URL lifetime plus `grace`; until then the
+    client may still submit it. Every process sweeps on its own schedule; deleting
+    a blob another process already removed is harmless.
+    """
+    
+    def __init__(
+        self,
+        storage: AzureBlobStorageClient = azure_storage_client,
+        interval_seconds: float = settings.upload_sweep_interval_minutes * 60,
+        max_age: timedelta = timedelta(
+            minutes=settings.upload_url_expiry_minutes + settings.upload_orphan_grace_minutes
+        ),
+    ):
+        self.storage = storage
+        self.interval_seconds = interval_seconds
+        self.max_age = max_age
+        self._task: asyncio.Task | None = None
+    
+    async def sweep(self) -> int:
+        """Delete abandoned uploads once; returns the number deleted."""
+        deleted = await self.storage.delete_older_than(UPLOAD_BLOB_ROOT, datetime.now(timezone.utc) - self.max_age)
+        if deleted:
+            logger.info(f"Deleted {deleted} abandoned direct upload(s)")
+        return deleted
+    
+    def start(self) -> None:
+        """Sweep now and then every interval, until `stop`."""
+        if self.interval_seconds <= 0:
+            logger.info("Upload sweep disabled")
+            return
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception as e:
+                logger.error(f"Failed to sweep abandoned uploads: {e}", exc_info=True)
+            await asyncio.sleep(self.interval_seconds)
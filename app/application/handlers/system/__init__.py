@@ -0,0 +1 @@
+"""System and operations handlers."""
@@ -0,0 +1,32 @@
+from pydantic import BaseModel
+from mediatr import GenericQuery, Mediator
+from dependency_injector.wiring import inject, Provide
+from app.core.container import Container  # noqa: F401
+
+from app.application.ports.usecase import UseCase
+from app.application.dto.models import DatabasePoolStatsDTO
+from app.core.pool_metrics import PoolMetrics
+
+
+class GetDatabasePoolStatsResponse(BaseModel):
+    """Response containing pool statistics per engine ("primary", "replica")."""
+    pools: dict[str, DatabasePoolStatsDTO]
+
+
+class GetDatabasePoolStatsRequest(BaseModel, GenericQuery[GetDatabasePoolStatsResponse]):
+    """Request for the connection pool statistics of this worker process."""
+    pass
+
+
+@Mediator.handler
+class GetDatabasePoolStatsHandler(UseCase[GetDatabasePoolStatsRequest, GetDatabasePoolStatsResponse]):
+    """Use case for reading the connection pool statistics."""
+
+    @inject
+    def __init__(self, pool_metrics: dict[str, PoolMetrics] = Provide[Container.database_pool_metrics]):
+        self.pool_metrics = pool_metrics
+
+    async def handle(self, request: GetDatabasePoolStatsRequest) -> GetDatabasePoolStatsResponse:
+        return GetDatabasePoolStatsResponse(
+            pools={name: DatabasePoolStatsDTO(**metrics.snapshot()) for name, metrics in self.pool_metrics.items()}
+        )
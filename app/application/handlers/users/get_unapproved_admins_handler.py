@@ -3,6 +3,7 @@ from mediatr import GenericQuery, Mediator
 from dependency_injector.wiring import inject, Provide
 
 from app.application.ports.usecase import UseCase
+from app.application.queries import ReadOnlyRequest
 from app.domain.models import User
 from app.domain.repositories.user_repository import IUserRepository
 from app.application.dto.models import UserDTO
@@ -14,7 +15,7 @@ class GetUnapprovedAdminsResponse(BaseModel):
     admins: list[UserDTO]
 
 
-class GetUnapprovedAdminsRequest(BaseModel, GenericQuery[GetUnapprovedAdminsResponse]):
+class GetUnapprovedAdminsRequest(BaseModel, ReadOnlyRequest, GenericQuery[GetUnapprovedAdminsResponse]):
     """Request for getting unapproved admin users."""
     pass
 
@@ -5,6 +5,7 @@ from dependency_injector.wiring import inject, Provide
 from app.core.container import Container  # noqa: F401
 
 from app.application.ports.usecase import UseCase
+from app.application.queries import ReadOnlyRequest
 from app.domain.models import User
 from app.domain.repositories.user_repository import IUserRepository
 from app.application.dto.models import UserDTO
@@ -16,7 +17,7 @@ class GetUserResponse(BaseModel):
     user: UserDTO | None
 
 
-class GetUserRequest(BaseModel, GenericQuery[GetUserResponse]):
+class GetUserRequest(BaseModel, ReadOnlyRequest, GenericQuery[GetUserResponse]):
     """Request for getting a user by ID."""
     user_id: UUID
 
@@ -5,6 +5,7 @@ from dependency_injector.wiring import inject, Provide
 from app.core.container import Container  # noqa: F401
 
 from app.application.ports.usecase import UseCase
+from app.application.queries import ReadOnlyRequest
 from app.domain.models import User
 from app.domain.repositories.user_repository import IUserRepository
 from app.application.dto.models import UserDTO
@@ -16,7 +17,7 @@ class ListUsersByAdminResponse(BaseModel):
     users: list[UserDTO]
 
 
-class ListUsersByAdminRequest(BaseModel, GenericQuery[ListUsersByAdminResponse]):
+class ListUsersByAdminRequest(BaseModel, ReadOnlyRequest, GenericQuery[ListUsersByAdminResponse]):
     """Request for listing users by admin ID."""
     admin_id: UUID
 
@@ -0,0 +1,23 @@
+"""Opaque keyset cursors for timestamp-ordered listings."""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from uuid import UUID
+
+
+def encode_cursor(timestamp: datetime, item_id: UUID) -> str:
+    """Encode the (timestamp, id) sort key of the last item on a page."""
+    payload = json.dumps({"t": timestamp.isoformat(), "id": str(item_id)}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    """Decode a cursor produced by `encode_cursor`; raises ValueError if it is malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["t"]), UUID(payload["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValueError("Invalid cursor")
@@ -0,0 +1,43 @@
+from typing import Any, Awaitable, Callable
+from mediatr import Mediator
+
+from app.core.read_replica import PRIMARY_ONLY, READ_FROM_REPLICA
+from app.core.request_scope import find_request_session, get_request_session
+
+
+class ReadOnlyRequest:
+    """Marker for requests whose handlers only read, so they may be served by the read replica."""
+
+
+class PrimaryReadRequest:
+    """Marker for requests that must read from the primary, even in a GET request."""
+
+
+@Mediator.behavior
+class ReplicaReadBehavior:
+    """Routes the reads of read-only requests to the replica (when one is configured)."""
+
+    async def handle(self, request: ReadOnlyRequest, next: Callable[[], Awaitable[Any]]) -> Any:
+        session = find_request_session()
+        if session is None or session.info.get(READ_FROM_REPLICA):
+            return await next()
+        session.info[READ_FROM_REPLICA] = True
+        try:
+            return await next()
+        finally:
+            session.info[READ_FROM_REPLICA] = False
+
+
+@Mediator.behavior
+class PrimaryReadBehavior:
+    """Pins the request's session to the primary for requests that must not see replica lag."""
+
+    async def handle(self, request: PrimaryReadRequest, next: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            # Opened here if needed, so the flag is set before the handler's first read
+            session = get_request_session()
+        except RuntimeError:
+            # Outside of a request there is no replica routing to override
+            return await next()
+        session.info[PRIMARY_ONLY] = True
+        return await next()
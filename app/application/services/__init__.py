@@ -0,0 +1,2 @@
+# Empty __init__.py
+
@@ -0,0 +1,268 @@
+import json
+import logging
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+from uuid import UUID
+
+from app.application.dto.models import FormDTO, FormFieldDTO
+from app.domain.models import Form
+
+
+logger = logging.getLogger(__name__)
+
+FILE_FIELD_TYPES = {"file", "files"}
+CHOICE_FIELD_TYPES = {"select", "radio"}
+EMAIL_PATTERN = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Returns an error message for an invalid (non-empty) value, or None if it is valid
+FieldValidator = Callable[[str], str | None]
+
+
+def form_etag(form_id: UUID, updated_at: datetime | None) -> str:
+    """Strong HTTP entity tag for a form version (id + updated_at)."""
+    version = int(updated_at.timestamp() * 1_000_000) if updated_at else 0
+    return f'"{form_id.hex}-{version:x}"'
+
+
+def _parse_options(options: str | None) -> set[str] | None:
+    """Parse the JSON `options` text of a choice field into the set of accepted values."""
+    if not options:
+        return None
+    try:
+        parsed = json.loads(options)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(parsed, list):
+        return None
+
+    accepted: set[str] = set()
+    for option in parsed:
+        if isinstance(option, dict):
+            # Accept both the stored value and the displayed label
+            for key in ("value", "label"):
+                if option.get(key) is not None:
+                    accepted.add(str(option[key]))
+        elif option is not None:
+            accepted.add(str(option))
+    return accepted or None
+
+
+def _validate_email(value: str) -> str | None:
+    return None if EMAIL_PATTERN.match(value.strip()) else "must be a valid email address"
+
+
+def _validate_number(value: str) -> str | None:
+    try:
+        float(value)
+    except ValueError:
+        return "must be a number"
+    return None
+
+
+def _choice_validator(accepted: set[str]) -> FieldValidator:
+    def validate(value: str) -> str | None:
+        return None if value in accepted else "is not one of the allowed options"
+    return validate
+
+
+def _compile_validator(field_type: str, options: str | None) -> FieldValidator | None:
+    if field_type == "email":
+        return _validate_email
+    if field_type == "number":
+        return _validate_number
+    if field_type in CHOICE_FIELD_TYPES:
+        accepted = _parse_options(options)
+        if accepted:
+            return _choice_validator(accepted)
+    return None
+
+
+@dataclass
+class CompiledForm:
+    """Immutable, precomputed view of a form used by the public fetch and submit paths."""
+    id: UUID
+    creator_id: UUID
+    updated_at: datetime | None
+    dto: FormDTO
+    # field id -> field, in display order
+    fields: dict[UUID, FormFieldDTO]
+    validators: dict[UUID, FieldValidator] = field(default_factory=dict)
+    loaded_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def etag(self) -> str:
+        return form_etag(self.id, self.updated_at)
+
+    @classmethod
+    def compile(cls, form: Form) -> "CompiledForm":
+        field_dtos = [
+            FormFieldDTO(
+                id=f.id,
+                field_type=f.field_type,
+                label=f.label,
+                name=f.name,
+                is_required=f.is_required,
+                order=f.order,
+                options=f.options,
+                placeholder=getattr(f, 'placeholder', None)
+            ) for f in form.fields
+        ]
+        dto = FormDTO(
+            id=form.id,
+            title=form.title,
+            description=form.description,
+            creator_id=form.creator_id,
+            created_at=form.created_at,
+            updated_at=form.updated_at,
+            fields=field_dtos
+        )
+        validators: dict[UUID, FieldValidator] = {}
+        for f in field_dtos:
+            validator = _compile_validator(f.field_type, f.options)
+            if validator is not None:
+                validators[f.id] = validator
+        return cls(
+            id=form.id,
+            creator_id=form.creator_id,
+            updated_at=form.updated_at,
+            dto=dto,
+            fields={f.id: f for f in field_dtos},
+            validators=validators
+        )
+
+    def validate(self, values: dict[str, Any], file_field_ids: set[UUID]) -> None:
+        """
+        Validate submitted values against the form definition.
+
+        Args:
+            values: field id (string) -> submitted value
+            file_field_ids: ids of fields that received at least one file
+
+        Raises:
+            ValueError: on the first missing required field or invalid value
+        """
+        for field_id, f in self.fields.items():
+            raw = values.get(str(field_id))
+            value = "" if raw is None else str(raw)
+
+            if f.field_type in FILE_FIELD_TYPES:
+                if f.is_required and field_id not in file_field_ids:
+                    raise ValueError(f"Field '{f.label}' is required")
+                continue
+
+            if not value.strip():
+                if f.is_required:
+                    raise ValueError(f"Field '{f.label}' is required")
+                continue
+
+            validator = self.validators.get(field_id)
+            if validator is not None:
+                error = validator(value)
+                if error:
+                    raise ValueError(f"Field '{f.label}' {error}")
+
+
+class FormSchemaCache:
+    """
+    In-process LRU cache of compiled forms keyed by form id.
+
+    Entries carry the form's `updated_at`, so an older version never replaces a newer
+    one. Form update/delete handlers invalidate entries in this process once their
+    transaction has committed; the TTL bounds how long other worker processes may
+    serve a stale definition.
+
+    Invalidating with `min_version` also keeps older versions out of the cache for
+    one TTL: a read that started before the commit, or one served by a lagging
+    replica, still gets its (old) answer but can't cache it over the new version.
+    """
+
+    def __init__(self, ttl_seconds: float = 30, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[UUID, CompiledForm] = OrderedDict()
+        # form id -> (oldest version that may be cached, when it was set)
+        self._min_versions: OrderedDict[UUID, tuple[datetime, float]] = OrderedDict()
+
+    def get(self, form_id: UUID) -> CompiledForm | None:
+        entry = self._entries.get(form_id)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.loaded_at > self.ttl_seconds:
+            self._entries.pop(form_id, None)
+            return None
+        self._entries.move_to_end(form_id)
+        return entry
+
+    def put(self, form: Form) -> CompiledForm:
+        compiled = CompiledForm.compile(form)
+        if self._is_outdated(compiled):
+            return compiled
+        current = self._entries.get(form.id)
+        if (
+            current is not None
+            and current.updated_at is not None
+            and compiled.updated_at is not None
+            and current.updated_at > compiled.updated_at
+        ):
+            return current
+        self._entries[form.id] = compiled
+        self._entries.move_to_end(form.id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return compiled
+
+    async def get_or_load(
+        self,
+        form_id: UUID,
+        loader: Callable[[UUID], Awaitable[Form | None]],
+    ) -> CompiledForm | None:
+        """Return the cached compiled form, loading and compiling it on a miss."""
+        compiled = self.get(form_id)
+        if compiled is not None:
+            return compiled
+        form = await loader(form_id)
+        if form is None:
+            return None
+        return self.put(form)
+
+    async def refresh(
+        self,
+        form_id: UUID,
+        loader: Callable[[UUID], Awaitable[Form | None]],
+    ) -> CompiledForm | None:
+        """Drop the cached entry and load the form again."""
+        self.invalidate(form_id)
+        return await self.get_or_load(form_id, loader)
+
+    def invalidate(self, form_id: UUID, min_version: datetime | None = None) -> None:
+        """
+        Drop the cached entry.
+
+        With `min_version` (the committed `updated_at`, or `datetime.max` for a deleted
+        form), versions older than it are not cached again for the next TTL.
+        """
+        if self._entries.pop(form_id, None) is not None:
+            logger.debug(f"Invalidated compiled form {form_id}")
+        if min_version is not None:
+            self._min_versions[form_id] = (min_version, time.monotonic())
+            self._min_versions.move_to_end(form_id)
+            while len(self._min_versions) > self.max_entries:
+                self._min_versions.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._min_versions.clear()
+
+    def _is_outdated(self, compiled: CompiledForm) -> bool:
+        floor = self._min_versions.get(compiled.id)
+        if floor is None:
+            return False
+        min_version, set_at = floor
+        if time.monotonic() - set_at > self.ttl_seconds:
+            self._min_versions.pop(compiled.id, None)
+            return False
+        return compiled.updated_at is None or compiled.updated_at < min_version
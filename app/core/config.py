@@ -1,13 +1,48 @@
+import os
+import tempfile
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class Settings(BaseSettings):
     # Database
     database_url: str
+    # Optional read replica: GET requests and read-only queries are served from it,
+    # except for clients that wrote within the pin window (read-after-write). Pins are
+    # kept per worker process and sent to the client as a cookie; with several workers,
+    # read-after-write across them only holds for clients that send the cookie back
+    # (browsers do for same-site API origins, or cross-site with credentials)
+    database_replica_url: str | None = None
+    replica_pin_seconds: float = 5
+    # Connection pool (per engine and worker process). Stale connections are
+    # replaced by recycling; enable pre-ping only if idle connections get dropped
+    # faster than that (it costs a round trip per checkout)
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 10
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = False
+    # asyncpg: prepared statement cache (set 0 behind PgBouncer in transaction mode)
+    # and per-statement timeout in seconds
+    db_statement_cache_size: int = 100
+    db_command_timeout: float | None = 30
+    # Log every SQL statement (independent of `debug`)
+    db_echo: bool = False
     
     # Azure Blob Storage
     azure_storage_connection_string: str
     azure_storage_container_name: str = "forms-files"
+    # Uploads are streamed to blob storage in staged blocks of this size (bytes)
+    azure_upload_chunk_size: int = 4 * 1024 * 1024
+    # Max concurrent blob uploads for a single submission / for the whole worker process
+    upload_concurrency_per_request: int = 4
+    upload_concurrency_per_process: int = 16
+    # Direct-to-storage uploads: SAS lifetime and the largest accepted blob (bytes)
+    upload_url_expiry_minutes: int = 15
+    upload_max_file_size: int = 100 * 1024 * 1024
+    # Direct uploads never submitted are deleted once their URL has expired and the
+    # grace period for submitting them has passed; swept every interval (0 disables)
+    upload_orphan_grace_minutes: int = 60
+    upload_sweep_interval_minutes: float = 30
     
     # Application
     app_name: str = "Form Manager API"
@@ -16,6 +51,33 @@ class Settings(BaseSettings):
     secret_key: str
     environment: str = "development"
     
+    # In-process cache of compiled public forms
+    form_cache_ttl_seconds: float = 30
+    form_cache_max_entries: int = 1024
+    # Browser/CDN freshness of public form definitions; revalidated via ETag afterwards
+    form_http_max_age_seconds: int = 60
+    
+    # Whole-form exports read submissions from the database in batches of this size
+    export_batch_size: int = 500
+    # Threads rendering exports (CSV/XLSX) off the event loop, per worker process
+    export_workers: int = 2
+    # Background export jobs: concurrent jobs per process, seconds without progress
+    # after which an active job counts as abandoned, download link lifetime, and how
+    # long shutdown waits for running jobs before interrupting them
+    export_job_concurrency: int = 2
+    export_job_stale_seconds: int = 600
+    export_job_url_expiry_minutes: int = 15
+    export_job_shutdown_grace_seconds: float = 20
+    # Rendered single-submission exports cached on local disk (LRU up to max bytes,
+    # 0 disables), optionally also in blob storage for other hosts
+    export_cache_dir: str = os.path.join(tempfile.gettempdir(), "fmanager-export-cache")
+    export_cache_max_bytes: int = 512 * 1024 * 1024
+    export_cache_blob_tier: bool = False
+    
+    # Response compression (brotli/zstd are used when the packages are installed)
+    compression_minimum_size: int = 1024
+    compression_gzip_level: int = 6
+    
     # Server
     host: str = "0.0.0.0"
     port: int = 8000
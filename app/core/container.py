@@ -1,15 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
 from dependency_injector import containers, providers
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.infrastructure.repositories.user_repository import UserRepository
 from app.infrastructure.repositories.form_repository import FormRepository
 from app.infrastructure.repositories.form_submission_repository import FormSubmissionRepository
 from app.infrastructure.repositories.file_repository import FileRepository
 from app.infrastructure.repositories.notification_channel_repository import NotificationChannelRepository
+from app.infrastructure.repositories.export_job_repository import ExportJobRepository
 from app.infrastructure.services.submission_export_service import SubmissionExportService
+from app.infrastructure.services.export_cache import DiskExportCache
+from app.infrastructure.services.azure_storage import azure_storage_client
 from app.infrastructure.services.telegram_notification_service import TelegramNotificationService
 from app.infrastructure.services.telegram_bot_polling_service import TelegramBotPollingService
+from app.application.services.form_schema_cache import FormSchemaCache
 from app.domain.events.event_bus import EventBus
+from app.core.request_scope import get_request_session, get_request_event_bus
+from app.core.database import pool_metrics
 from app.core.config import settings
 import logging
 
@@ -19,8 +25,8 @@ logger = logging.getLogger(__name__)
 class Container(containers.DeclarativeContainer):
     """Dependency Injection Container"""
     
-    # Database session provider - will be injected from FastAPI Depends
-    db_session = providers.Dependency(instance_of=AsyncSession)
+    # Database session of the current request (set per request by ContainerSessionMiddleware)
+    db_session = providers.Callable(get_request_session)
     
     # Repository providers
     user_repository = providers.Factory(
@@ -48,14 +54,48 @@ class Container(containers.DeclarativeContainer):
         session=db_session
     )
     
+    export_job_repository = providers.Factory(
+        ExportJobRepository,
+        session=db_session
+    )
+    
+    # Bounded pool for CPU-bound export rendering - Singleton (shared by all requests of this process)
+    export_executor = providers.Singleton(
+        ThreadPoolExecutor,
+        max_workers=settings.export_workers,
+        thread_name_prefix="export"
+    )
+    
     # Service providers
     submission_export_service = providers.Factory(
-        SubmissionExportService
+        SubmissionExportService,
+        executor=export_executor
     )
     
-    # Event Bus - Singleton
+    # Rendered single-submission exports - Singleton (one LRU index per process)
+    export_cache = providers.Singleton(
+        DiskExportCache,
+        directory=settings.export_cache_dir,
+        max_bytes=settings.export_cache_max_bytes,
+        blob_storage=azure_storage_client if settings.export_cache_blob_tier else None
+    )
+    
+    # Compiled form definitions - Singleton (shared by all requests of this process)
+    form_schema_cache = providers.Singleton(
+        FormSchemaCache,
+        ttl_seconds=settings.form_cache_ttl_seconds,
+        max_entries=settings.form_cache_max_entries
+    )
+    
+    # Connection pool statistics per engine (filled when the engines are created)
+    database_pool_metrics = providers.Object(pool_metrics)
+    
+    # Event Bus - Singleton (process-wide; subscribers are registered at startup)
     event_bus = providers.Singleton(EventBus)
     
+    # Deferred event bus of the current request, published after commit
+    request_event_bus = providers.Callable(get_request_event_bus, fallback=event_bus)
+    
     # Notification Services
     telegram_notification_service = providers.Factory(
         TelegramNotificationService,
@@ -70,7 +110,7 @@ class Container(containers.DeclarativeContainer):
     
     # No handler providers here to avoid circular imports.
 
-# Global container instance (for cases where session is provided via override)
+# Global container instance; request-scoped providers resolve through app.core.request_scope
 container = Container()
 
 
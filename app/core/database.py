@@ -1,20 +1,55 @@
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from typing import Any
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from collections.abc import AsyncGenerator
 
 from app.core.config import settings
+from app.core.pool_metrics import PoolMetrics
+from app.core.read_replica import REPLICA_BIND, RoutingSession
+
+# Runtime pool statistics per engine, exposed to super admins
+pool_metrics: dict[str, PoolMetrics] = {}
+
+
+def create_engine(name: str, url: str) -> AsyncEngine:
+    """Create an async engine with the configured pool settings and pool instrumentation."""
+    metrics = PoolMetrics()
+    options: dict[str, Any] = {"echo": settings.db_echo, "pool_pre_ping": settings.db_pool_pre_ping}
+    database_url = make_url(url)
+    if database_url.get_backend_name() != "sqlite":
+        options.update(
+            poolclass=metrics.pool_class(),
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+    if database_url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "statement_cache_size": settings.db_statement_cache_size,
+            "command_timeout": settings.db_command_timeout,
+        }
+    new_engine = create_async_engine(url, **options)
+    metrics.instrument(new_engine)
+    pool_metrics[name] = metrics
+    return new_engine
+
 
 # Create async engine
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    pool_pre_ping=True,
+engine = create_engine("primary", settings.database_url)
+
+# Optional read replica; reads are routed to it per request by RoutingSession
+replica_engine = (
+    create_engine("replica", settings.database_replica_url) if settings.database_replica_url else None
 )
 
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    info={REPLICA_BIND: replica_engine.sync_engine} if replica_engine is not None else None,
     expire_on_commit=False,
     autocommit=False,
     autoflush=False,
@@ -1,20 +1,37 @@
-from starlette.types import ASGIApp, Receive, Scope, Send
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from app.core.config import settings
 from app.core.database import AsyncSessionLocal
 from app.core.container import container
 from app.core.deferred_event_bus import DeferredEventBus
+from app.core.read_replica import (
+    PRIMARY_ONLY, READ_FROM_REPLICA, REPLICA_BIND, PrimaryPinRegistry, client_pin_key, has_pin_cookie,
+    pin_cookie_header
+)
+from app.core.request_scope import RequestScope, request_scope
+
+MUTATING_METHODS = ("POST", "PUT", "DELETE", "PATCH")
 
 class ContainerSessionMiddleware:
     """
-    Pure ASGI middleware that creates a DB session and DI container override per request.
+    Pure ASGI middleware that sets up the request scope (DB session and deferred event bus) for the DI container.
     
     Features:
-    - Automatically commits transactions for mutating methods (POST, PUT, DELETE, PATCH)
+    - Opens the session and creates the deferred bus lazily, on first use; routes that
+      never touch the database skip the session, commit and close entirely
+    - Automatically commits transactions for mutating methods (POST, PUT, DELETE, PATCH),
+      then runs the request's commit callbacks and flushes its deferred events; rollback
+      callbacks run instead when the request fails or its transaction cannot commit
     - Skips session creation for OPTIONS and HEAD requests (optimization)
+    - With a read replica configured, GET requests read from it; clients that sent
+      a mutating request within the pin window read from the primary instead. The pin
+      is kept in this process and returned to the client as a cookie, so it also holds
+      on other workers for clients that send cookies back
     - Closes session properly in finally block
     """
 
     def __init__(self, app: ASGIApp) -> None:
         self.app = app
+        self.primary_pins = PrimaryPinRegistry(settings.replica_pin_seconds)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] not in ("http", "websocket"):
@@ -26,30 +43,74 @@ class ContainerSessionMiddleware:
             await self.app(scope, receive, send)
             return
 
-        scope.setdefault("state", {})
+        def open_session():
+            session = AsyncSessionLocal()
+            if REPLICA_BIND in session.info:
+                self._route_reads(scope, session)
+            return session
+
+        # Wrap the global EventBus with a per-request deferred bus (created on first use)
+        request = RequestScope(open_session, lambda: DeferredEventBus(container.event_bus()))
+        if scope["type"] == "http" and scope["method"] in MUTATING_METHODS:
+            send = self._with_pin_cookie(send, request)
 
-        session = AsyncSessionLocal()
-        # Wrap the global EventBus with a per-request deferred bus
-        base_bus = container.event_bus()
-        deferred_bus = DeferredEventBus(base_bus)
-        
         try:
-            with container.db_session.override(session), container.event_bus.override(deferred_bus):
+            # Request-scoped providers resolve from this context only, never from
+            # other requests running concurrently on the same event loop
+            with request_scope(request):
                 # Expose container on request state for dependencies
                 scope.setdefault("state", {})
                 scope["state"]["container"] = container
                 await self.app(scope, receive, send)
-                
-                # Auto-commit for mutating methods if session is still active
-                if scope["type"] == "http" and scope["method"] in ("POST", "PUT", "DELETE", "PATCH"):
-                    if session.is_active:
-                        await session.commit()
-                        # After successful commit, flush deferred events
-                        await deferred_bus.flush()
+
+                # Auto-commit for mutating methods
+                if scope["type"] == "http" and scope["method"] in MUTATING_METHODS:
+                    await self._commit(scope, request)
+                else:
+                    # Nothing to commit: whatever the request read is already committed
+                    await request.run_commit_callbacks()
         except Exception:
             # Rollback on any exception
-            if session.is_active:
+            session = request.opened_session
+            if session is not None and session.is_active:
                 await session.rollback()
+            await request.run_rollback_callbacks()
             raise
         finally:
-            await session.close()
\ No newline at end of file
+            if request.opened_session is not None:
+                await request.opened_session.close()
+
+    async def _commit(self, scope: Scope, request: RequestScope) -> None:
+        session = request.opened_session
+        if session is not None:
+            if not session.is_active:
+                # A failed flush already rolled the transaction back
+                await request.run_rollback_callbacks()
+                return
+            await session.commit()
+            if REPLICA_BIND in session.info:
+                # Restart the pin window from the commit
+                self.primary_pins.pin(client_pin_key(scope))
+        # After successful commit, run commit callbacks (e.g. cache invalidation) and flush deferred events
+        await request.run_commit_callbacks()
+        if request.opened_event_bus is not None:
+            await request.opened_event_bus.flush()
+
+    def _with_pin_cookie(self, send: Send, request: RequestScope) -> Send:
+        """Wrap `send` to return the pin cookie with the response of a write."""
+        async def send_with_pin(message: Message) -> None:
+            session = request.opened_session
+            if message["type"] == "http.response.start" and session is not None and REPLICA_BIND in session.info:
+                message["headers"] = [*message.get("headers", []), pin_cookie_header(self.primary_pins.window_seconds)]
+            await send(message)
+        return send_with_pin
+
+    def _route_reads(self, scope: Scope, session) -> None:
+        pin_key = client_pin_key(scope)
+        if self.primary_pins.is_pinned(pin_key) or has_pin_cookie(scope, self.primary_pins.window_seconds):
+            session.info[PRIMARY_ONLY] = True
+        else:
+            session.info[READ_FROM_REPLICA] = scope.get("method") == "GET"
+        if scope.get("method") in MUTATING_METHODS:
+            # Pinned before the write runs, so follow-up reads can't race the commit
+            self.primary_pins.pin(pin_key)
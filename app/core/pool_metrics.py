@@ -0,0 +1,88 @@
+import time
+from typing import Any
+from sqlalchemy import event, exc
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    """
+    Runtime counters for one engine's connection pool.
+
+    Checkout latency (queueing for a free connection plus opening new ones) and
+    timeouts are measured by the pool class returned from `pool_class()`;
+    overflow connections and invalidations are counted from pool events.
+    """
+
+    def __init__(self) -> None:
+        self.checkouts = 0
+        self.checkout_wait_total = 0.0
+        self.checkout_wait_max = 0.0
+        self.timeouts = 0
+        self.overflow_connects = 0
+        self.invalidations = 0
+        self._engine = None
+
+    def pool_class(self) -> type[AsyncAdaptedQueuePool]:
+        """Queue pool class that reports its checkouts to these metrics."""
+        metrics = self
+
+        class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+            def connect(self):
+                start = time.perf_counter()
+                try:
+                    return super().connect()
+                except exc.TimeoutError:
+                    metrics.timeouts += 1
+                    raise
+                finally:
+                    metrics.record_checkout(time.perf_counter() - start)
+
+        return InstrumentedAsyncPool
+
+    def instrument(self, engine: AsyncEngine) -> None:
+        """Attach the event listeners to `engine`'s pool (kept across pool re-creation)."""
+        self._engine = engine.sync_engine
+        event.listen(self._engine, "connect", self._on_connect)
+        event.listen(self._engine, "invalidate", self._on_invalidate)
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        self.checkouts += 1
+        self.checkout_wait_total += wait_seconds
+        self.checkout_wait_max = max(self.checkout_wait_max, wait_seconds)
+
+    def snapshot(self) -> dict[str, Any]:
+        pool = self._engine.pool if self._engine is not None else None
+        stats: dict[str, Any] = {
+            "pool_size": None,
+            "max_overflow": None,
+            "checked_out": None,
+            "idle": None,
+            "overflow": None,
+        }
+        if isinstance(pool, QueuePool):
+            stats.update(
+                pool_size=pool.size(),
+                max_overflow=pool._max_overflow,
+                checked_out=pool.checkedout(),
+                idle=pool.checkedin(),
+                # Negative while the pool hasn't opened `pool_size` connections yet
+                overflow=max(pool.overflow(), 0),
+            )
+        stats.update(
+            checkouts=self.checkouts,
+            checkout_wait_avg_ms=self.checkout_wait_total / self.checkouts * 1000 if self.checkouts else 0.0,
+            checkout_wait_max_ms=self.checkout_wait_max * 1000,
+            timeouts=self.timeouts,
+            overflow_connects=self.overflow_connects,
+            invalidations=self.invalidations,
+        )
+        return stats
+
+    def _on_connect(self, dbapi_connection, connection_record) -> None:
+        pool = self._engine.pool
+        if isinstance(pool, QueuePool) and pool.overflow() > 0:
+            self.overflow_connects += 1
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception) -> None:
+        self.invalidations += 1
@@ -0,0 +1,118 @@
+import hashlib
+import math
+import time
+from sqlalchemy import CompoundSelect, Delete, Insert, Select, Update
+from sqlalchemy.orm import Session
+from starlette.datastructures import Headers
+from starlette.requests import cookie_parser
+from starlette.types import Scope
+
+# Keys of `Session.info` that drive read routing
+REPLICA_BIND = "replica_bind"
+READ_FROM_REPLICA = "read_from_replica"
+PRIMARY_ONLY = "primary_only"
+
+# Cookie holding the end of the client's pin window (Unix time), so the pin also holds
+# when the next request is served by another worker process or host
+PIN_COOKIE = "replica_pin_until"
+
+
+class RoutingSession(Session):
+    """
+    Session that sends plain reads to the read replica when the request allows it.
+
+    Reads go to the engine stored under `info[REPLICA_BIND]` only while
+    `info[READ_FROM_REPLICA]` is set. Flushes, DML, locking reads and raw
+    connections always use the primary. The first write pins the rest of the
+    session to the primary, so a request always reads its own writes.
+    """
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        replica = self.info.get(REPLICA_BIND)
+        if replica is not None and not self.info.get(PRIMARY_ONLY):
+            if self._flushing or isinstance(clause, (Insert, Update, Delete)):
+                self.info[PRIMARY_ONLY] = True
+            elif self.info.get(READ_FROM_REPLICA) and _is_plain_read(clause):
+                return replica
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+def _is_plain_read(clause) -> bool:
+    if isinstance(clause, Select):
+        return clause._for_update_arg is None
+    return isinstance(clause, CompoundSelect)
+
+
+class PrimaryPinRegistry:
+    """
+    Clients that wrote recently and must read from the primary until the window ends.
+
+    Replicas apply changes with some lag, so a client that just submitted or
+    edited something would otherwise not see its own write on the next GET.
+    Pins are kept in process memory, keyed by a digest of the client identity
+    (see `client_pin_key`), so they only hold within one worker process; across
+    processes the client carries its pin in the `PIN_COOKIE` cookie instead.
+    """
+
+    def __init__(self, window_seconds: float, max_entries: int = 10_000):
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self._pins: dict[bytes, float] = {}
+
+    def pin(self, key: bytes) -> None:
+        now = time.monotonic()
+        if len(self._pins) >= self.max_entries:
+            self._prune(now)
+        self._pins[key] = now + self.window_seconds
+
+    def is_pinned(self, key: bytes) -> bool:
+        expires_at = self._pins.get(key)
+        if expires_at is None:
+            return False
+        if expires_at <= time.monotonic():
+            del self._pins[key]
+            return False
+        return True
+
+    def _prune(self, now: float) -> None:
+        self._pins = {key: expires_at for key, expires_at in self._pins.items() if expires_at > now}
+        # Still full of live pins: drop the ones closest to expiry
+        overflow = len(self._pins) - self.max_entries + 1
+        if overflow > 0:
+            for key in sorted(self._pins, key=self._pins.__getitem__)[:overflow]:
+                del self._pins[key]
+
+
+def client_pin_key(scope: Scope) -> bytes:
+    """
+    Identify the client of a request by its bearer token, or its address without one.
+    
+    Behind a proxy, all anonymous clients share the proxy's address and thus one pin;
+    that only sends more of their reads to the primary, never a stale read.
+    """
+    authorization = Headers(scope=scope).get("authorization")
+    if authorization:
+        identity = authorization
+    else:
+        client = scope.get("client")
+        identity = client[0] if client else ""
+    return hashlib.blake2b(identity.encode(), digest_size=16).digest()
+
+
+def pin_cookie_header(window_seconds: float) -> tuple[bytes, bytes]:
+    """Set-Cookie header pinning the client to the primary for the next `window_seconds`."""
+    until = time.time() + window_seconds
+    cookie = f"{PIN_COOKIE}={until:.3f}; Max-Age={math.ceil(window_seconds)}; Path=/; HttpOnly; SameSite=Lax"
+    return b"set-cookie", cookie.encode("latin-1")
+
+
+def has_pin_cookie(scope: Scope, window_seconds: float) -> bool:
+    """Whether the request carries a pin cookie that has not expired yet."""
+    value = cookie_parser(Headers(scope=scope).get("cookie", "")).get(PIN_COOKIE)
+    try:
+        until = float(value)
+    except (TypeError, ValueError):
+        return False
+    now = time.time()
+    # A made-up cookie cannot pin a client for longer than one window
+    return now < until <= now + window_seconds
@@ -0,0 +1,134 @@
+import inspect
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from collections.abc import Awaitable, Callable, Iterator
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.events.event_bus import EventBus
+
+
+logger = logging.getLogger(__name__)
+
+# Runs once the request's transaction has committed (or rolled back); may be sync or async
+CommitCallback = Callable[[], Awaitable[None] | None]
+
+
+class RequestScope:
+    """
+    Resources owned by a single request: its DB session, deferred event bus and
+    the callbacks to run after its transaction commits or rolls back.
+
+    Both are created on first use, so requests that never touch the database
+    or publish events don't pay for them. The active scope is held in a
+    ContextVar, so concurrent requests on the same event loop each resolve
+    their own session from the (global) DI container.
+    """
+
+    def __init__(self, session_factory: Callable[[], AsyncSession], event_bus_factory: Callable[[], EventBus]):
+        self._session_factory = session_factory
+        self._event_bus_factory = event_bus_factory
+        self._session: AsyncSession | None = None
+        self._event_bus: EventBus | None = None
+        self._commit_callbacks: list[CommitCallback] = []
+        self._rollback_callbacks: list[CommitCallback] = []
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self._session_factory()
+        return self._session
+
+    @property
+    def event_bus(self) -> EventBus:
+        if self._event_bus is None:
+            self._event_bus = self._event_bus_factory()
+        return self._event_bus
+
+    @property
+    def opened_session(self) -> AsyncSession | None:
+        """The session if one was opened during the request."""
+        return self._session
+
+    @property
+    def opened_event_bus(self) -> EventBus | None:
+        """The deferred event bus if one was created during the request."""
+        return self._event_bus
+
+    def on_commit(self, callback: CommitCallback) -> None:
+        """Run `callback` after the request's transaction commits; dropped on rollback."""
+        self._commit_callbacks.append(callback)
+
+    def on_rollback(self, callback: CommitCallback) -> None:
+        """Run `callback` if the request's transaction does not commit; dropped on commit."""
+        self._rollback_callbacks.append(callback)
+
+    async def run_commit_callbacks(self) -> None:
+        """Run the queued commit callbacks; failures are logged, the commit already happened."""
+        callbacks, self._commit_callbacks, self._rollback_callbacks = self._commit_callbacks, [], []
+        for callback in callbacks:
+            await _run_callback(callback)
+
+    async def run_rollback_callbacks(self) -> None:
+        """Run the queued rollback callbacks; failures are logged."""
+        callbacks, self._rollback_callbacks, self._commit_callbacks = self._rollback_callbacks, [], []
+        for callback in callbacks:
+            await _run_callback(callback)
+
+
+async def _run_callback(callback: CommitCallback) -> None:
+    try:
+        result = callback()
+        if inspect.isawaitable(result):
+            await result
+    except Exception:
+        logger.exception(f"Commit callback {callback!r} failed")
+
+
+_current_scope: ContextVar[RequestScope | None] = ContextVar("request_scope", default=None)
+
+
+@contextmanager
+def request_scope(scope: RequestScope) -> Iterator[RequestScope]:
+    """Make `scope` the active request scope for the current context."""
+    token = _current_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _current_scope.reset(token)
+
+
+def get_request_session() -> AsyncSession:
+    """Return the DB session of the active request scope."""
+    scope = _current_scope.get()
+    if scope is None:
+        raise RuntimeError("No active request scope: DB session is only available inside a request")
+    return scope.session
+
+
+def get_request_event_bus(fallback: EventBus) -> EventBus:
+    """Return the request's deferred event bus, or `fallback` outside of a request."""
+    scope = _current_scope.get()
+    return scope.event_bus if scope is not None else fallback
+
+
+def find_request_session() -> AsyncSession | None:
+    """Return the request's DB session if it was opened, or None (also outside of a request)."""
+    scope = _current_scope.get()
+    return scope.opened_session if scope is not None else None
+
+
+async def on_commit(callback: CommitCallback) -> None:
+    """Run `callback` after the active request commits, or right away outside of a request."""
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.on_commit(callback)
+    else:
+        await _run_callback(callback)
+
+
+def on_rollback(callback: CommitCallback) -> None:
+    """Run `callback` if the active request does not commit; a no-op outside of a request."""
+    scope = _current_scope.get()
+    if scope is not None:
+        scope.on_rollback(callback)
@@ -0,0 +1,91 @@
+import asyncio
+import functools
+from typing import Any
+
+import pydantic_core
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, request_response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response that serializes pydantic models with pydantic-core and everything
+    else with orjson (falling back to the stdlib encoder when orjson is missing).
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return pydantic_core.to_json(content, by_alias=True)
+        if orjson is not None:
+            return orjson.dumps(content, default=jsonable_encoder, option=orjson.OPT_NON_STR_KEYS)
+        return super().render(content)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an entity tag (RFC 9110)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == target for tag in if_none_match.split(","))
+
+
+class TypedResponseRoute(APIRoute):
+    """
+    Route that skips `response_model` re-validation for already-typed results.
+
+    FastAPI dumps a returned model to a dict, validates it against `response_model`
+    again and then JSON-encodes the result. When an endpoint returns an instance of
+    exactly its `response_model` (and no include/exclude options are set), that work
+    is redundant, so the model is rendered directly with `FastJSONResponse`. Any
+    other return value, and endpoints that take a `Response` parameter to set
+    headers or cookies, go through the regular FastAPI path.
+    """
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, endpoint, **kwargs)
+        if self._can_bypass_validation():
+            self.dependant.call = self._wrap_endpoint(self.dependant.call)
+            self.app = request_response(self.get_route_handler())
+
+    def _can_bypass_validation(self) -> bool:
+        return (
+            isinstance(self.response_model, type)
+            and issubclass(self.response_model, BaseModel)
+            and self.response_model_include is None
+            and self.response_model_exclude is None
+            and self.response_model_by_alias
+            and not self.response_model_exclude_unset
+            and not self.response_model_exclude_defaults
+            and not self.response_model_exclude_none
+            and asyncio.iscoroutinefunction(self.dependant.call)
+            and not _uses_response_parameter(self.dependant)
+        )
+
+    def _wrap_endpoint(self, call):
+        response_model = self.response_model
+        status_code = self.status_code or 200
+
+        @functools.wraps(call)
+        async def endpoint(*args, **kwargs):
+            result = await call(*args, **kwargs)
+            if type(result) is response_model:
+                return FastJSONResponse(result, status_code=status_code)
+            return result
+
+        return endpoint
+
+
+def _uses_response_parameter(dependant) -> bool:
+    """Whether the endpoint or any of its dependencies injects the sub-response."""
+    if dependant.response_param_name is not None:
+        return True
+    return any(_uses_response_parameter(sub) for sub in dependant.dependencies)
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from uuid import UUID
+from app.domain.events.base_event import DomainEvent
+
+
+@dataclass
+class ExportJobRequestedEvent(DomainEvent):
+    """Event raised when a new background export job is created."""
+    job_id: UUID
+    
+    def __init__(self, job_id: UUID):
+        super().__init__()
+        self.job_id = job_id
@@ -1,6 +1,6 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Integer, JSON, Enum as SQLEnum, UniqueConstraint
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text, Integer, JSON, Enum as SQLEnum, UniqueConstraint, Index
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 import uuid
 from enum import Enum
@@ -13,6 +13,19 @@ class NotificationChannelType(str, Enum):
     TELEGRAM = "telegram"
 
 
+class ExportJobStatus(str, Enum):
+    """Lifecycle of an asynchronous export job"""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+ACTIVE_EXPORT_JOB_STATUSES = (ExportJobStatus.PENDING.value, ExportJobStatus.RUNNING.value)
+# Error of an active job that stopped updating its row (e.g. its process died)
+STALE_EXPORT_JOB_ERROR = "Export job stopped reporting progress"
+
+
 class NotificationChannel(Base):
     """
     Notification channels table.
@@ -62,6 +75,10 @@ class User(Base):
     admin_users = relationship("User", remote_side=[id], foreign_keys=[admin_id])
     notification_channels = relationship("NotificationChannel", back_populates="user", cascade="all, delete-orphan")
     
+    __table_args__ = (
+        Index('ix_users_admin_id', 'admin_id'),
+    )
+    
     def __repr__(self):
         return f"<User(id={self.id}, name={self.name}, is_admin={self.is_admin})>"
 
@@ -80,6 +97,12 @@ class Form(Base):
     creator = relationship("User", back_populates="created_forms", foreign_keys=[creator_id])
     fields = relationship("FormField", back_populates="form", cascade="all, delete-orphan", order_by="FormField.order")
     submissions = relationship("FormSubmission", back_populates="form", cascade="all, delete-orphan")
+    submission_counter = relationship("FormSubmissionCounter", uselist=False, cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Creator's form listing: keyset over (created_at, id)
+        Index('ix_forms_creator_id_created_at', 'creator_id', 'created_at', 'id'),
+    )
     
     def __repr__(self):
         return f"<Form(id={self.id}, title={self.title})>"
@@ -102,6 +125,10 @@ class FormField(Base):
     form = relationship("Form", back_populates="fields")
     values = relationship("FormFieldValue", back_populates="field", cascade="all, delete-orphan")
     
+    __table_args__ = (
+        Index('ix_form_fields_form_id_order', 'form_id', 'order'),
+    )
+    
     def __repr__(self):
         return f"<FormField(id={self.id}, name={self.name}, type={self.field_type})>"
 
@@ -113,6 +140,9 @@ class FormSubmission(Base):
     form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id"), nullable=False)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     submitted_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Full-text document (submitter name, email and non-signature values), maintained by
+    # database triggers; PostgreSQL only - deferred so regular loads don't fetch it
+    search_vector = deferred(Column(TSVECTOR().with_variant(Text(), "sqlite"), nullable=True))
     
     # Relationships
     form = relationship("Form", back_populates="submissions")
@@ -120,10 +150,32 @@ class FormSubmission(Base):
     field_values = relationship("FormFieldValue", back_populates="submission", cascade="all, delete-orphan")
     files = relationship("File", back_populates="submission", cascade="all, delete-orphan")
     
+    __table_args__ = (
+        # Per-form and per-user listings: keyset over (submitted_at, id), and counts
+        Index('ix_form_submissions_form_id_submitted_at', 'form_id', 'submitted_at', 'id'),
+        Index('ix_form_submissions_user_id_submitted_at', 'user_id', 'submitted_at', 'id'),
+    )
+    
     def __repr__(self):
         return f"<FormSubmission(id={self.id}, form_id={self.form_id}, user_id={self.user_id})>"
 
 
+class FormSubmissionCounter(Base):
+    """
+    Number of submissions (and their files) per form, maintained by the submission
+    repository in the same transaction as each insert/delete so counts are a
+    primary-key lookup.
+    """
+    __tablename__ = "form_submission_counters"
+    
+    form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id", ondelete="CASCADE"), primary_key=True)
+    submission_count = Column(Integer, default=0, nullable=False)
+    file_count = Column(Integer, default=0, nullable=False)
+    
+    def __repr__(self):
+        return f"<FormSubmissionCounter(form_id={self.form_id}, count={self.submission_count})>"
+
+
 class FormFieldValue(Base):
     __tablename__ = "form_field_values"
     
@@ -136,6 +188,11 @@ class FormFieldValue(Base):
     submission = relationship("FormSubmission", back_populates="field_values")
     field = relationship("FormField", back_populates="values")
     
+    __table_args__ = (
+        Index('ix_form_field_values_submission_id', 'submission_id'),
+        Index('ix_form_field_values_field_id', 'field_id'),
+    )
+    
     def __repr__(self):
         return f"<FormFieldValue(id={self.id}, field_id={self.field_id})>"
 
@@ -156,6 +213,54 @@ class File(Base):
     # Relationships
     submission = relationship("FormSubmission", back_populates="files")
     
+    __table_args__ = (
+        Index('ix_files_submission_id', 'submission_id'),
+        Index('ix_files_field_id', 'field_id'),
+    )
+    
     def __repr__(self):
         return f"<File(id={self.id}, filename={self.original_filename})>"
 
+
+class ExportJob(Base):
+    """
+    Whole-form export rendered in the background and stored in blob storage.
+    
+    `dedupe_key` identifies the export (form, format, locale, filters); at most one
+    pending/running job exists per key, so repeated requests attach to it.
+    """
+    __tablename__ = "export_jobs"
+    
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    form_id = Column(UUID(as_uuid=True), ForeignKey("forms.id", ondelete="CASCADE"), nullable=False)
+    format = Column(String(10), nullable=False)
+    locale = Column(String(10), nullable=False)
+    filters = Column(JSON, nullable=False, default=dict)
+    dedupe_key = Column(String(64), nullable=False)
+    status = Column(
+        SQLEnum(ExportJobStatus, native_enum=False, length=20, values_callable=lambda e: [m.value for m in e]),
+        default=ExportJobStatus.PENDING,
+        nullable=False
+    )
+    processed_rows = Column(Integer, default=0, nullable=False)
+    total_rows = Column(Integer, nullable=True)
+    blob_name = Column(String(500), nullable=True)
+    filename = Column(String(255), nullable=True)
+    file_size = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    # Touched on every progress update; active jobs that stop updating are abandoned
+    updated_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    completed_at = Column(DateTime, nullable=True)
+    
+    __table_args__ = (
+        Index(
+            'uq_export_jobs_active_dedupe_key', 'dedupe_key', unique=True,
+            postgresql_where=status.in_(ACTIVE_EXPORT_JOB_STATUSES),
+            sqlite_where=status.in_(ACTIVE_EXPORT_JOB_STATUSES),
+        ),
+        Index('ix_export_jobs_form_id', 'form_id'),
+    )
+    
+    def __repr__(self):
+        return f"<ExportJob(id={self.id}, form_id={self.form_id}, status={self.status})>"
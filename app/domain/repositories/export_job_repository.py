@@ -0,0 +1,57 @@
+"""Repository interface for ExportJob"""
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from app.domain.models import ExportJob
+
+
+class IExportJobRepository(ABC):
+    """Interface for export job repository"""
+    
+    @abstractmethod
+    async def get_by_id(self, job_id: UUID) -> Optional[ExportJob]:
+        """Get job by ID"""
+        pass
+    
+    @abstractmethod
+    async def create_or_get_active(self, job: ExportJob, stale_before: datetime) -> tuple[ExportJob, bool]:
+        """
+        Insert `job` unless a pending/running job with the same dedupe key exists.
+        
+        An active job not updated since `stale_before` is considered abandoned: it
+        is marked failed and replaced. Returns the job to follow and whether it was
+        created by this call.
+        """
+        pass
+    
+    @abstractmethod
+    async def mark_running(self, job_id: UUID, total_rows: int) -> bool:
+        """Move a pending job to running; False if it is no longer pending"""
+        pass
+    
+    @abstractmethod
+    async def update_progress(self, job_id: UUID, processed_rows: int) -> None:
+        """Record the number of rows rendered so far"""
+        pass
+    
+    @abstractmethod
+    async def mark_completed(self, job_id: UUID, blob_name: str, filename: str, file_size: int) -> None:
+        """Record the uploaded export file"""
+        pass
+    
+    @abstractmethod
+    async def mark_failed(self, job_id: UUID, error: str) -> None:
+        """Record why the job failed"""
+        pass
+    
+    @abstractmethod
+    async def fail_stale_running(self, stale_before: datetime) -> int:
+        """Mark running jobs not updated since `stale_before` failed; returns how many"""
+        pass
+    
+    @abstractmethod
+    async def requeue_pending(self) -> list[UUID]:
+        """Restart the staleness clock of all pending jobs and return their ids, oldest first"""
+        pass
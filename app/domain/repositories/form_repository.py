@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
+from datetime import datetime
+from typing import Any
 from app.domain.models import Form
 
 
@@ -13,7 +15,38 @@ class IFormRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_by_creator_id(self, creator_id: UUID, skip: int = 0, limit: int = 10) -> list[Form]:
+    async def get_updated_at(self, form_id: UUID) -> datetime | None:
+        """Version timestamp of a form without loading it; None if it does not exist."""
+        pass
+    
+    @abstractmethod
+    async def get_by_ids(self, form_ids: list[UUID]) -> list[Form]:
+        """Load several forms (with fields) in one query; missing ids are skipped."""
+        pass
+    
+    @abstractmethod
+    async def get_by_creator_id(
+        self,
+        creator_id: UUID,
+        skip: int = 0,
+        limit: int = 10,
+        cursor: tuple[datetime, UUID] | None = None
+    ) -> list[Form]:
+        """List forms newest first, starting after the (created_at, id) `cursor` if given."""
+        pass
+    
+    @abstractmethod
+    async def get_overview_by_creator_id(
+        self,
+        creator_id: UUID,
+        skip: int = 0,
+        limit: int = 10,
+        cursor: tuple[datetime, UUID] | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Creator's forms without fields, each with `submission_count`, `file_count`
+        and `last_submitted_at`, newest first.
+        """
         pass
     
     @abstractmethod
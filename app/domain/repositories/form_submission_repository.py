@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 from datetime import datetime
+from collections.abc import AsyncIterator
+from typing import Any
 from app.domain.models import FormSubmission
 
 
@@ -14,11 +16,23 @@ class IFormSubmissionRepository(ABC):
         pass
     
     @abstractmethod
-    async def get_by_form_id(self, form_id: UUID, skip: int = 0, limit: int = 10) -> list[FormSubmission]:
+    async def get_by_form_id(
+        self,
+        form_id: UUID,
+        skip: int = 0,
+        limit: int = 10,
+        cursor: tuple[datetime, UUID] | None = None
+    ) -> list[FormSubmission]:
         pass
     
     @abstractmethod
-    async def get_by_user_id(self, user_id: UUID, skip: int = 0, limit: int = 10) -> list[FormSubmission]:
+    async def get_by_user_id(
+        self,
+        user_id: UUID,
+        skip: int = 0,
+        limit: int = 10,
+        cursor: tuple[datetime, UUID] | None = None
+    ) -> list[FormSubmission]:
         pass
     
     @abstractmethod
@@ -32,14 +46,116 @@ class IFormSubmissionRepository(ABC):
         user_name: str | None = None,
         user_email: str | None = None,
         field_value_search: str | None = None,
-        form_id: UUID | None = None
+        form_id: UUID | None = None,
+        cursor: tuple[datetime, UUID] | None = None
     ) -> list[FormSubmission]:
+        """
+        List submissions newest first. `cursor` is the (submitted_at, id) of the last
+        item of the previous page; when given, only older items are returned.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_rows_by_admin_id(
+        self,
+        admin_id: UUID,
+        skip: int = 0,
+        limit: int = 10,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        user_name: str | None = None,
+        user_email: str | None = None,
+        field_value_search: str | None = None,
+        form_id: UUID | None = None,
+        cursor: tuple[datetime, UUID] | None = None,
+        search: str | None = None,
+        include_form: bool = True
+    ) -> list[dict[str, Any]]:
+        """
+        Same listing as get_by_admin_id, returned as plain dicts (with nested user,
+        form, field_values and files) produced by a single query.
+        
+        `search` is a full-text query; matches are ordered by relevance.
+        `include_form=False` leaves `form` as None instead of embedding the definition.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_summary_rows_by_admin_id(
+        self,
+        admin_id: UUID,
+        skip: int = 0,
+        limit: int = 10,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        user_name: str | None = None,
+        user_email: str | None = None,
+        field_value_search: str | None = None,
+        form_id: UUID | None = None,
+        cursor: tuple[datetime, UUID] | None = None,
+        search: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Same listing as get_rows_by_admin_id, projected to summary columns (keys, form
+        title, submitter name/email, timestamp) plus field value and file counts.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_export_metadata(self, submission_id: UUID) -> dict[str, Any] | None:
+        """
+        Form id, form title, form updated_at and submitter name of a submission.
+
+        Enough to name a single-submission export and to key its cached copy
+        without loading the submission.
+        """
+        pass
+    
+    @abstractmethod
+    def stream_export_batches(
+        self,
+        form_id: UUID,
+        presence_only_field_ids: list[UUID],
+        batch_size: int = 500,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        user_name: str | None = None,
+        user_email: str | None = None,
+        field_value_search: str | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Stream a form's submissions oldest first, in batches read through a server-side cursor.
+
+        Each row has id, submitted_at, user_name, user_email, `values` (field id -> value)
+        and `file_counts` (field id -> number of files). Values of
+        `presence_only_field_ids` are cut to their first character, which is enough to
+        tell whether one was given without loading e.g. signature images. The optional
+        filters match those of the admin submission listing.
+        """
+        pass
+    
+    @abstractmethod
+    async def count_for_export(
+        self,
+        form_id: UUID,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        user_name: str | None = None,
+        user_email: str | None = None,
+        field_value_search: str | None = None,
+    ) -> int:
+        """Count the submissions `stream_export_batches` yields for the same filters."""
         pass
     
     @abstractmethod
     async def count_by_form_id(self, form_id: UUID) -> int:
         pass
     
+    @abstractmethod
+    async def count_by_form_ids(self, form_ids: list[UUID]) -> dict[UUID, int]:
+        """Submission counts for several forms at once; forms without submissions map to 0."""
+        pass
+    
     @abstractmethod
     async def delete(self, submission_id: UUID) -> bool:
         pass
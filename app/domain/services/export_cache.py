@@ -0,0 +1,45 @@
+import hashlib
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import IO
+from uuid import UUID
+
+# Bump when the rendered output of single-submission exports changes, so cached
+# copies made by older code are no longer used
+EXPORT_RENDER_VERSION = 1
+
+
+def export_cache_key(submission_id: UUID, form_updated_at: datetime | None, format: str, locale: str) -> str:
+    """Content address of a single-submission export: every input that changes the rendered file."""
+    version = form_updated_at.isoformat() if form_updated_at else ""
+    payload = f"{EXPORT_RENDER_VERSION}:{submission_id}:{version}:{format}:{locale}"
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class IExportCache(ABC):
+    """Interface for the cache of rendered single-submission exports."""
+    
+    @abstractmethod
+    async def get(self, form_id: UUID, submission_id: UUID, key: str) -> IO[bytes] | None:
+        """
+        Open a cached export for reading.
+        
+        Returns:
+            Readable binary file (the caller closes it), or None on a miss
+        """
+        pass
+    
+    @abstractmethod
+    async def put(self, form_id: UUID, submission_id: UUID, key: str, file: IO[bytes]) -> None:
+        """Store a rendered export; `file` is read from the start and rewound afterwards."""
+        pass
+    
+    @abstractmethod
+    async def invalidate_submission(self, form_id: UUID, submission_id: UUID) -> None:
+        """Drop all cached exports of a submission."""
+        pass
+    
+    @abstractmethod
+    async def invalidate_form(self, form_id: UUID) -> None:
+        """Drop all cached exports of a form's submissions."""
+        pass
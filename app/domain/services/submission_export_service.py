@@ -1,12 +1,18 @@
 from abc import ABC, abstractmethod
-from io import BytesIO
-from typing import Literal
+from collections.abc import AsyncIterator
+from typing import IO, Any, Literal
 from uuid import UUID
-from app.domain.models import FormSubmission
+from app.domain.models import Form, FormSubmission
 
 
 ExportFormat = Literal["csv", "xlsx"]
 
+# Content type of a whole-form export, per format
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
 
 class ISubmissionExportService(ABC):
     """Interface for submission export service."""
@@ -17,7 +23,7 @@ class ISubmissionExportService(ABC):
         submission: FormSubmission, 
         format: ExportFormat,
         locale: str = "en"
-    ) -> tuple[BytesIO, str]:
+    ) -> tuple[IO[bytes], str]:
         """
         Export submission to specified format.
         
@@ -26,6 +32,46 @@ class ISubmissionExportService(ABC):
             format: Export format (csv or xlsx)
             
         Returns:
-            Tuple of (file buffer, filename)
+            Tuple of (readable binary file, filename); the caller closes the file
+        """
+        pass
+    
+    @abstractmethod
+    def stream_form_csv(
+        self,
+        form: Form,
+        batches: AsyncIterator[list[dict[str, Any]]],
+        locale: str = "en"
+    ) -> AsyncIterator[bytes]:
+        """
+        Render all submissions of a form as one wide CSV table, chunk by chunk.
+        
+        Args:
+            form: The form, with its fields loaded (one column per field)
+            batches: Submission rows as produced by
+                IFormSubmissionRepository.stream_export_batches
+            
+        Returns:
+            Async iterator of encoded CSV chunks, one per batch
         """
         pass
+    
+    @abstractmethod
+    def stream_form_xlsx(
+        self,
+        form: Form,
+        batches: AsyncIterator[list[dict[str, Any]]],
+        locale: str = "en"
+    ) -> AsyncIterator[bytes]:
+        """Same table as `stream_form_csv`, as an XLSX workbook streamed in chunks."""
+        pass
+    
+    @abstractmethod
+    def submission_export_filename(self, form_title: str | None, user_name: str | None, format: ExportFormat) -> str:
+        """Download filename for a single-submission export."""
+        pass
+    
+    @abstractmethod
+    def form_export_filename(self, form: Form, format: ExportFormat) -> str:
+        """Download filename for a whole-form export."""
+        pass
@@ -0,0 +1,162 @@
+"""SQLAlchemy implementation of ExportJobRepository"""
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.models import ExportJob, ExportJobStatus, ACTIVE_EXPORT_JOB_STATUSES, STALE_EXPORT_JOB_ERROR
+from app.domain.repositories.export_job_repository import IExportJobRepository
+
+
+class ExportJobRepository(IExportJobRepository):
+    """SQLAlchemy implementation of export job repository"""
+    
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def get_by_id(self, job_id: UUID) -> Optional[ExportJob]:
+        """Get job by ID"""
+        result = await self.session.execute(
+            select(ExportJob).where(ExportJob.id == job_id)
+        )
+        return result.scalar_one_or_none()
+    
+    async def create_or_get_active(self, job: ExportJob, stale_before: datetime) -> tuple[ExportJob, bool]:
+        """
+        Insert `job` unless a pending/running job with the same dedupe key exists.
+        
+        The insert skips conflicts on the partial unique index over active jobs, so
+        concurrent requests for the same export race safely onto a single row.
+        """
+        for _ in range(2):
+            if await self._insert_if_no_active(job):
+                return await self.get_by_id(job.id), True
+            
+            active = await self._get_active(job.dedupe_key)
+            if active is None:
+                # Finished between the insert and the lookup; try again
+                continue
+            if active.updated_at >= stale_before:
+                return active, False
+            await self._fail_stale(active, stale_before)
+        
+        raise RuntimeError(f"Could not create export job for {job.dedupe_key}")
+    
+    async def mark_running(self, job_id: UUID, total_rows: int) -> bool:
+        """Move a pending job to running; False if it is no longer pending"""
+        result = await self.session.execute(
+            update(ExportJob)
+            .where(ExportJob.id == job_id, ExportJob.status == ExportJobStatus.PENDING)
+            .values(status=ExportJobStatus.RUNNING, total_rows=total_rows, updated_at=datetime.utcnow())
+        )
+        return result.rowcount == 1
+    
+    async def update_progress(self, job_id: UUID, processed_rows: int) -> None:
+        """Record the number of rows rendered so far"""
+        await self.session.execute(
+            update(ExportJob)
+            .where(ExportJob.id == job_id)
+            .values(processed_rows=processed_rows, updated_at=datetime.utcnow())
+        )
+    
+    async def mark_completed(self, job_id: UUID, blob_name: str, filename: str, file_size: int) -> None:
+        """Record the uploaded export file"""
+        now = datetime.utcnow()
+        await self.session.execute(
+            update(ExportJob)
+            .where(ExportJob.id == job_id)
+            .values(
+                status=ExportJobStatus.COMPLETED,
+                blob_name=blob_name,
+                filename=filename,
+                file_size=file_size,
+                updated_at=now,
+                completed_at=now,
+            )
+        )
+    
+    async def mark_failed(self, job_id: UUID, error: str) -> None:
+        """Record why the job failed"""
+        now = datetime.utcnow()
+        await self.session.execute(
+            update(ExportJob)
+            .where(ExportJob.id == job_id)
+            .values(status=ExportJobStatus.FAILED, error=error, updated_at=now, completed_at=now)
+        )
+    
+    async def fail_stale_running(self, stale_before: datetime) -> int:
+        """Mark running jobs not updated since `stale_before` failed; returns how many"""
+        result = await self.session.execute(
+            self._fail_stale_statement(stale_before)
+            .where(ExportJob.status == ExportJobStatus.RUNNING)
+        )
+        return result.rowcount
+    
+    async def requeue_pending(self) -> list[UUID]:
+        """Restart the staleness clock of all pending jobs and return their ids, oldest first"""
+        result = await self.session.execute(
+            select(ExportJob.id)
+            .where(ExportJob.status == ExportJobStatus.PENDING)
+            .order_by(ExportJob.created_at)
+        )
+        job_ids = list(result.scalars().all())
+        if job_ids:
+            await self.session.execute(
+                update(ExportJob)
+                .where(ExportJob.id.in_(job_ids), ExportJob.status == ExportJobStatus.PENDING)
+                .values(updated_at=datetime.utcnow())
+            )
+        return job_ids
+    
+    async def _insert_if_no_active(self, job: ExportJob) -> bool:
+        insert = postgresql.insert if self.session.bind.dialect.name == "postgresql" else sqlite.insert
+        now = datetime.utcnow()
+        result = await self.session.execute(
+            insert(ExportJob)
+            .values(
+                id=job.id,
+                form_id=job.form_id,
+                format=job.format,
+                locale=job.locale,
+                filters=job.filters,
+                dedupe_key=job.dedupe_key,
+                status=ExportJobStatus.PENDING,
+                processed_rows=0,
+                created_at=now,
+                updated_at=now,
+            )
+            .on_conflict_do_nothing(
+                index_elements=[ExportJob.dedupe_key],
+                index_where=ExportJob.status.in_(ACTIVE_EXPORT_JOB_STATUSES),
+            )
+        )
+        return result.rowcount == 1
+    
+    async def _get_active(self, dedupe_key: str) -> Optional[ExportJob]:
+        result = await self.session.execute(
+            select(ExportJob).where(
+                ExportJob.dedupe_key == dedupe_key,
+                ExportJob.status.in_(ACTIVE_EXPORT_JOB_STATUSES)
+            )
+        )
+        return result.scalar_one_or_none()
+    
+    async def _fail_stale(self, job: ExportJob, stale_before: datetime) -> None:
+        await self.session.execute(self._fail_stale_statement(stale_before).where(ExportJob.id == job.id))
+    
+    @staticmethod
+    def _fail_stale_statement(stale_before: datetime):
+        now = datetime.utcnow()
+        # Guarded by updated_at, so a job that just reported progress is left alone
+        return (
+            update(ExportJob)
+            .where(ExportJob.status.in_(ACTIVE_EXPORT_JOB_STATUSES), ExportJob.updated_at < stale_before)
+            .values(
+                status=ExportJobStatus.FAILED,
+                error=STALE_EXPORT_JOB_ERROR,
+                updated_at=now,
+                completed_at=now,
+            )
+        )
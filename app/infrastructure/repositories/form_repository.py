@@ -1,8 +1,9 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, func, tuple_
 from sqlalchemy.orm import selectinload
 from uuid import UUID
-from app.domain.models import Form
+from typing import Any
+from app.domain.models import Form, FormSubmission, FormSubmissionCounter
 from app.domain.repositories.form_repository import IFormRepository
 
 
@@ -30,17 +31,75 @@ class FormRepository(IFormRepository):
         )
         return result.scalar_one_or_none()
     
-    async def get_by_creator_id(self, creator_id, skip: int = 0, limit: int = 10):
+    async def get_updated_at(self, form_id):
         result = await self.session.execute(
+            select(Form.updated_at).where(Form.id == form_id)
+        )
+        return result.scalar_one_or_none()
+    
+    async def get_by_ids(self, form_ids):
+        if not form_ids:
+            return []
+        result = await self.session.execute(
+            select(Form)
+            .options(selectinload(Form.fields))
+            .where(Form.id.in_(form_ids))
+        )
+        return list(result.scalars().all())
+    
+    async def get_by_creator_id(self, creator_id, skip: int = 0, limit: int = 10, cursor=None):
+        query = (
             select(Form)
             .options(selectinload(Form.fields))
             .where(Form.creator_id == creator_id)
-            .order_by(Form.created_at.desc())
+        )
+        if cursor:
+            # Keyset pagination: continue strictly after the last (created_at, id) seen
+            query = query.where(tuple_(Form.created_at, Form.id) < tuple_(*cursor))
+        result = await self.session.execute(
+            query
+            .order_by(Form.created_at.desc(), Form.id.desc())
             .offset(skip)
             .limit(limit)
         )
         return list(result.scalars().all())
     
+    async def get_overview_by_creator_id(self, creator_id, skip: int = 0, limit: int = 10, cursor=None) -> list[dict[str, Any]]:
+        """
+        Creator's forms (without fields) with submission count, file count and last
+        submission time, in one statement: counts come from the maintained counters,
+        the last timestamp from the (form_id, submitted_at) index.
+        """
+        last_submitted_at = (
+            select(func.max(FormSubmission.submitted_at))
+            .where(FormSubmission.form_id == Form.id)
+            .scalar_subquery()
+        )
+        query = (
+            select(
+                Form.id,
+                Form.title,
+                Form.description,
+                Form.creator_id,
+                Form.created_at,
+                Form.updated_at,
+                func.coalesce(FormSubmissionCounter.submission_count, 0).label("submission_count"),
+                func.coalesce(FormSubmissionCounter.file_count, 0).label("file_count"),
+                last_submitted_at.label("last_submitted_at"),
+            )
+            .outerjoin(FormSubmissionCounter, FormSubmissionCounter.form_id == Form.id)
+            .where(Form.creator_id == creator_id)
+        )
+        if cursor:
+            query = query.where(tuple_(Form.created_at, Form.id) < tuple_(*cursor))
+        result = await self.session.execute(
+            query
+            .order_by(Form.created_at.desc(), Form.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return [dict(row._mapping) for row in result]
+    
     async def update(self, form: Form) -> Form:
         await self.session.flush()
         await self.session.refresh(form)
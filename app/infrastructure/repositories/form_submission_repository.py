@@ -1,32 +1,115 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, insert, update, tuple_, exists, literal_column, type_coerce, case, JSON
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import selectinload
 from datetime import datetime
-from uuid import UUID
-from app.domain.models import FormSubmission, Form, User, FormFieldValue
+from collections.abc import AsyncIterator
+from typing import Any
+from uuid import UUID, uuid4
+from app.domain.models import FormSubmission, FormSubmissionCounter, Form, FormField, User, FormFieldValue, File
 from app.domain.repositories.form_submission_repository import IFormSubmissionRepository
 
 
+# Text search configuration for submission documents; 'simple' does no stemming, so
+# names, emails and free-form values in any language match as typed
+SEARCH_CONFIG = literal_column("'simple'::regconfig")
+
+# Signature fields store base64 image data URLs; they are never searched, and the
+# partial trigram index on form_field_values.value excludes them with this pattern
+SIGNATURE_VALUE_PATTERN = literal_column("'data:image/%'")
+
+
+def _searchable_value_matches(pattern: str):
+    """ILIKE over field values, skipping signature data (matches the partial trigram index)."""
+    return FormFieldValue.value.ilike(pattern) & FormFieldValue.value.not_like(SIGNATURE_VALUE_PATTERN)
+
+
+def _json_object(dialect: str, **columns):
+    """Build a JSON object from column expressions (json_build_object / json_object)."""
+    args = []
+    for key, column in columns.items():
+        args.extend([literal_column(f"'{key}'"), column])
+    if dialect == "postgresql":
+        return func.json_build_object(*args)
+    return func.json_object(*args)
+
+
+def _json_array(dialect: str, element):
+    """Aggregate `element` over the rows of a (sub)query into a JSON array, [] when empty."""
+    if dialect == "postgresql":
+        return func.coalesce(func.json_agg(element), literal_column("'[]'::json"))
+    return func.json_group_array(element)
+
+
 class FormSubmissionRepository(IFormSubmissionRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
     
     async def create(self, submission: FormSubmission) -> FormSubmission:
-        self.session.add(submission)
-        await self.session.flush()
-        # Reload submission with all related objects to avoid lazy loading issues
-        submission_id = submission.id
-        result = await self.session.execute(
-            select(FormSubmission)
-            .options(
-                selectinload(FormSubmission.form).selectinload(Form.fields),
-                selectinload(FormSubmission.user),
-                selectinload(FormSubmission.field_values),
-                selectinload(FormSubmission.files)
+        """
+        Insert a submission with its field values and files.
+        
+        Uses one multi-row Core INSERT per table instead of flushing the ORM graph and
+        reloading it, so the statement count does not depend on the number of fields
+        or files. The form's submission counter is incremented in the same
+        transaction. The object graph is not attached to the session; callers build their
+        response from the returned in-memory submission.
+        """
+        if submission.id is None:
+            submission.id = uuid4()
+        if submission.submitted_at is None:
+            submission.submitted_at = datetime.utcnow()
+        
+        # search_vector is maintained by database triggers on PostgreSQL
+        await self.session.execute(
+            insert(FormSubmission.__table__).values(
+                id=submission.id,
+                form_id=submission.form_id,
+                user_id=submission.user_id,
+                submitted_at=submission.submitted_at
             )
-            .where(FormSubmission.id == submission_id)
         )
-        return result.scalar_one()
+        
+        if submission.field_values:
+            for value in submission.field_values:
+                if value.id is None:
+                    value.id = uuid4()
+            await self.session.execute(
+                insert(FormFieldValue.__table__).values([
+                    {
+                        "id": value.id,
+                        "submission_id": submission.id,
+                        "field_id": value.field_id,
+                        "value": value.value
+                    } for value in submission.field_values
+                ])
+            )
+        
+        if submission.files:
+            for file in submission.files:
+                if file.id is None:
+                    file.id = uuid4()
+                if file.uploaded_at is None:
+                    file.uploaded_at = submission.submitted_at
+            await self.session.execute(
+                insert(File.__table__).values([
+                    {
+                        "id": file.id,
+                        "submission_id": submission.id,
+                        "field_id": file.field_id,
+                        "original_filename": file.original_filename,
+                        "blob_name": file.blob_name,
+                        "blob_url": file.blob_url,
+                        "file_size": file.file_size,
+                        "content_type": file.content_type,
+                        "uploaded_at": file.uploaded_at
+                    } for file in submission.files
+                ])
+            )
+        
+        await self._adjust_counter(submission.form_id, 1, len(submission.files))
+        
+        return submission
     
     async def get_by_id(self, submission_id):
         result = await self.session.execute(
@@ -41,8 +124,24 @@ class FormSubmissionRepository(IFormSubmissionRepository):
         )
         return result.scalar_one_or_none()
     
-    async def get_by_form_id(self, form_id, skip: int = 0, limit: int = 10):
+    async def get_export_metadata(self, submission_id: UUID) -> dict[str, Any] | None:
+        """Form id, form title, form updated_at and submitter name of a submission, in one narrow query."""
         result = await self.session.execute(
+            select(
+                FormSubmission.form_id,
+                Form.title.label("form_title"),
+                Form.updated_at.label("form_updated_at"),
+                User.name.label("user_name"),
+            )
+            .join(Form, Form.id == FormSubmission.form_id)
+            .outerjoin(User, User.id == FormSubmission.user_id)
+            .where(FormSubmission.id == submission_id)
+        )
+        row = result.first()
+        return dict(row._mapping) if row else None
+    
+    async def get_by_form_id(self, form_id, skip: int = 0, limit: int = 10, cursor=None):
+        query = (
             select(FormSubmission)
             .options(
                 selectinload(FormSubmission.user),
@@ -50,14 +149,12 @@ class FormSubmissionRepository(IFormSubmissionRepository):
                 selectinload(FormSubmission.files)
             )
             .where(FormSubmission.form_id == form_id)
-            .order_by(FormSubmission.submitted_at.desc())
-            .offset(skip)
-            .limit(limit)
         )
+        result = await self.session.execute(self._paginate(query, skip, limit, cursor))
         return list(result.scalars().all())
     
-    async def get_by_user_id(self, user_id, skip: int = 0, limit: int = 10):
-        result = await self.session.execute(
+    async def get_by_user_id(self, user_id, skip: int = 0, limit: int = 10, cursor=None):
+        query = (
             select(FormSubmission)
             .options(
                 selectinload(FormSubmission.form).selectinload(Form.fields),
@@ -65,10 +162,8 @@ class FormSubmissionRepository(IFormSubmissionRepository):
                 selectinload(FormSubmission.files)
             )
             .where(FormSubmission.user_id == user_id)
-            .order_by(FormSubmission.submitted_at.desc())
-            .offset(skip)
-            .limit(limit)
         )
+        result = await self.session.execute(self._paginate(query, skip, limit, cursor))
         return list(result.scalars().all())
     
     async def get_by_admin_id(
@@ -81,7 +176,8 @@ class FormSubmissionRepository(IFormSubmissionRepository):
         user_name: str | None = None,
         user_email: str | None = None,
         field_value_search: str | None = None,
-        form_id: UUID | None = None
+        form_id: UUID | None = None,
+        cursor: tuple[datetime, UUID] | None = None
     ):
         # Get submissions for forms created by admin and users created by admin
         query = (
@@ -94,15 +190,251 @@ class FormSubmissionRepository(IFormSubmissionRepository):
                 selectinload(FormSubmission.field_values),
                 selectinload(FormSubmission.files)
             )
-            .where(
-                (Form.creator_id == admin_id) | (User.admin_id == admin_id)
+        )
+        query = self._filter_admin_submissions(
+            query, admin_id, date_from, date_to, user_name, user_email, field_value_search, form_id
+        )
+        
+        result = await self.session.execute(self._paginate(query, skip, limit, cursor))
+        return list(result.scalars().all())
+    
+    async def get_rows_by_admin_id(
+        self,
+        admin_id: UUID,
+        skip: int = 0,
+        limit: int = 10,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        user_name: str | None = None,
+        user_email: str | None = None,
+        field_value_search: str | None = None,
+        form_id: UUID | None = None,
+        cursor: tuple[datetime, UUID] | None = None,
+        search: str | None = None,
+        include_form: bool = True
+    ) -> list[dict[str, Any]]:
+        """
+        Read-side variant of get_by_admin_id that runs a single SQL statement.
+        
+        Field values, files and form fields are aggregated into JSON arrays by the
+        database (correlated json_agg subqueries), and rows come back as plain dicts
+        shaped like FormSubmissionDTO - no ORM objects or identity map involved.
+        
+        `search` is a full-text query over the submitter's name, email and text field
+        values. On PostgreSQL it matches the submission's `search_vector` and orders
+        results by rank (most relevant first), so it cannot be combined with a cursor.
+        
+        With `include_form=False` the form definition is not selected and `form` is
+        None; callers that deduplicate forms load each one separately.
+        """
+        if search and cursor:
+            raise ValueError("Cursor pagination is not supported together with search")
+        dialect = self.session.bind.dialect.name
+        
+        field_values = (
+            select(_json_array(dialect, _json_object(
+                dialect,
+                id=FormFieldValue.id,
+                field_id=FormFieldValue.field_id,
+                value=FormFieldValue.value
+            )))
+            .where(FormFieldValue.submission_id == FormSubmission.id)
+            .scalar_subquery()
+        )
+        files = (
+            select(_json_array(dialect, _json_object(
+                dialect,
+                id=File.id,
+                field_id=File.field_id,
+                original_filename=File.original_filename,
+                blob_url=File.blob_url,
+                file_size=File.file_size,
+                content_type=File.content_type
+            )))
+            .where(File.submission_id == FormSubmission.id)
+            .scalar_subquery()
+        )
+        form_fields = (
+            select(_json_array(dialect, _json_object(
+                dialect,
+                id=FormField.id,
+                field_type=FormField.field_type,
+                label=FormField.label,
+                name=FormField.name,
+                is_required=FormField.is_required,
+                order=FormField.order,
+                options=FormField.options,
+                placeholder=FormField.placeholder
+            )))
+            .where(FormField.form_id == Form.id)
+            .scalar_subquery()
+        )
+        
+        query = (
+            select(
+                FormSubmission.id,
+                FormSubmission.form_id,
+                FormSubmission.user_id,
+                FormSubmission.submitted_at,
+                User.name.label("user_name"),
+                User.email.label("user_email"),
+                User.is_admin.label("user_is_admin"),
+                User.is_super_admin.label("user_is_super_admin"),
+                User.is_approved.label("user_is_approved"),
+                User.admin_id.label("user_admin_id"),
+                User.avatar_url.label("user_avatar_url"),
+                User.created_at.label("user_created_at"),
+                type_coerce(field_values, JSON).label("field_values"),
+                type_coerce(files, JSON).label("files"),
+            )
+            .join(Form, FormSubmission.form_id == Form.id)
+            .join(User, FormSubmission.user_id == User.id)
+        )
+        if include_form:
+            query = query.add_columns(
+                Form.title.label("form_title"),
+                Form.description.label("form_description"),
+                Form.creator_id.label("form_creator_id"),
+                Form.created_at.label("form_created_at"),
+                Form.updated_at.label("form_updated_at"),
+                type_coerce(form_fields, JSON).label("form_fields"),
             )
+        query = self._filter_admin_submissions(
+            query, admin_id, date_from, date_to, user_name, user_email, field_value_search, form_id
+        )
+        
+        if search:
+            query = self._search(query, dialect, search)
+        
+        result = await self.session.execute(self._paginate(query, skip, limit, cursor))
+        return [
+            {
+                "id": row.id,
+                "form_id": row.form_id,
+                "user_id": row.user_id,
+                "submitted_at": row.submitted_at,
+                "user": {
+                    "id": row.user_id,
+                    "name": row.user_name,
+                    "email": row.user_email,
+                    "is_admin": row.user_is_admin,
+                    "is_super_admin": row.user_is_super_admin,
+                    "is_approved": row.user_is_approved,
+                    "admin_id": row.user_admin_id,
+                    "avatar_url": row.user_avatar_url,
+                    "created_at": row.user_created_at,
+                },
+                "form": {
+                    "id": row.form_id,
+                    "title": row.form_title,
+                    "description": row.form_description,
+                    "creator_id": row.form_creator_id,
+                    "created_at": row.form_created_at,
+                    "updated_at": row.form_updated_at,
+                    "fields": sorted(row.form_fields or [], key=lambda f: f["order"]),
+                } if include_form else None,
+                "field_values": row.field_values or [],
+                "files": row.files or [],
+            }
+            for row in result
+        ]
+    
+    async def get_summary_rows_by_admin_id(
+        self,
+        admin_id: UUID,
+        skip: int = 0,
+        limit: int = 10,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        user_name: str | None = None,
+        user_email: str | None = None,
+        field_value_search: str | None = None,
+        form_id: UUID | None = None,
+        cursor: tuple[datetime, UUID] | None = None,
+        search: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Narrow projection of the admin listing for list views.
+        
+        Selects only the submission keys, form title, submitter name/email and the
+        number of field values and files (counted from the indexed child tables),
+        without loading any value, file or form field rows.
+        """
+        if search and cursor:
+            raise ValueError("Cursor pagination is not supported together with search")
+        
+        field_value_count = (
+            select(func.count(FormFieldValue.id))
+            .where(FormFieldValue.submission_id == FormSubmission.id)
+            .scalar_subquery()
+        )
+        file_count = (
+            select(func.count(File.id))
+            .where(File.submission_id == FormSubmission.id)
+            .scalar_subquery()
+        )
+        query = (
+            select(
+                FormSubmission.id,
+                FormSubmission.form_id,
+                Form.title.label("form_title"),
+                FormSubmission.user_id,
+                User.name.label("user_name"),
+                User.email.label("user_email"),
+                FormSubmission.submitted_at,
+                field_value_count.label("field_value_count"),
+                file_count.label("file_count"),
+            )
+            .join(Form, FormSubmission.form_id == Form.id)
+            .join(User, FormSubmission.user_id == User.id)
+        )
+        query = self._filter_admin_submissions(
+            query, admin_id, date_from, date_to, user_name, user_email, field_value_search, form_id
+        )
+        
+        if search:
+            query = self._search(query, self.session.bind.dialect.name, search)
+        
+        result = await self.session.execute(self._paginate(query, skip, limit, cursor))
+        return [dict(row._mapping) for row in result]
+    
+    @staticmethod
+    def _filter_admin_submissions(
+        query,
+        admin_id: UUID,
+        date_from: datetime | None,
+        date_to: datetime | None,
+        user_name: str | None,
+        user_email: str | None,
+        field_value_search: str | None,
+        form_id: UUID | None
+    ):
+        """Apply admin ownership and listing filters; `query` must join Form and User."""
+        # Expressed on the submission's own foreign keys, so each branch of the OR is a
+        # range of the (form_id|user_id, submitted_at, id) indexes instead of a scan
+        query = query.where(
+            FormSubmission.form_id.in_(select(Form.id).where(Form.creator_id == admin_id))
+            | FormSubmission.user_id.in_(select(User.id).where(User.admin_id == admin_id))
         )
         
         # Apply form_id filter
         if form_id:
             query = query.where(FormSubmission.form_id == form_id)
         
+        return FormSubmissionRepository._filter_submissions(
+            query, date_from, date_to, user_name, user_email, field_value_search
+        )
+    
+    @staticmethod
+    def _filter_submissions(
+        query,
+        date_from: datetime | None,
+        date_to: datetime | None,
+        user_name: str | None,
+        user_email: str | None,
+        field_value_search: str | None
+    ):
+        """Apply the submission listing filters; `query` must join User."""
         # Apply date filters
         if date_from:
             query = query.where(FormSubmission.submitted_at >= date_from)
@@ -117,35 +449,201 @@ class FormSubmissionRepository(IFormSubmissionRepository):
         if user_email:
             query = query.where(User.email.ilike(f"%{user_email}%"))
         
-        # Apply field value search filter
+        # Apply field value search filter (semi-join, so no DISTINCT over the result)
         if field_value_search:
-            # Join with FormFieldValue to search in field values
-            query = query.join(
-                FormFieldValue,
-                FormSubmission.id == FormFieldValue.submission_id
-            ).where(
-                FormFieldValue.value.ilike(f"%{field_value_search}%")
-            ).distinct()
+            query = query.where(
+                exists().where(
+                    FormFieldValue.submission_id == FormSubmission.id,
+                    _searchable_value_matches(f"%{field_value_search}%")
+                )
+            )
+        
+        return query
+    
+    @staticmethod
+    def _search(query, dialect: str, search: str):
+        """
+        Restrict `query` to submissions matching `search`, best matches first.
         
-        query = query.order_by(FormSubmission.submitted_at.desc()).offset(skip).limit(limit)
+        PostgreSQL uses the GIN-indexed `search_vector` document and ts_rank; other
+        dialects fall back to a substring match over name, email and field values.
+        """
+        if dialect == "postgresql":
+            ts_query = func.websearch_to_tsquery(SEARCH_CONFIG, search)
+            return (
+                query
+                .where(FormSubmission.search_vector.op("@@")(ts_query))
+                .order_by(func.ts_rank(FormSubmission.search_vector, ts_query).desc())
+            )
+        pattern = f"%{search}%"
+        return query.where(
+            User.name.ilike(pattern)
+            | User.email.ilike(pattern)
+            | exists().where(
+                FormFieldValue.submission_id == FormSubmission.id,
+                _searchable_value_matches(pattern)
+            )
+        )
+    
+    @staticmethod
+    def _paginate(query, skip: int, limit: int, cursor: tuple[datetime, UUID] | None):
+        """Order newest first; with a cursor, seek past the last (submitted_at, id) seen."""
+        if cursor:
+            query = query.where(tuple_(FormSubmission.submitted_at, FormSubmission.id) < tuple_(*cursor))
+        return (
+            query
+            .order_by(FormSubmission.submitted_at.desc(), FormSubmission.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+    
+    async def stream_export_batches(
+        self,
+        form_id: UUID,
+        presence_only_field_ids: list[UUID],
+        batch_size: int = 500,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        user_name: str | None = None,
+        user_email: str | None = None,
+        field_value_search: str | None = None,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Stream a form's submissions in batches for export.
         
+        Submissions are read through a server-side cursor `batch_size` rows at a time;
+        the field values and file counts of each batch are loaded with one query each,
+        so memory depends on the batch size, not on the number of submissions.
+        """
+        query = (
+            select(
+                FormSubmission.id,
+                FormSubmission.submitted_at,
+                User.name.label("user_name"),
+                User.email.label("user_email"),
+            )
+            .outerjoin(User, User.id == FormSubmission.user_id)
+            .where(FormSubmission.form_id == form_id)
+        )
+        query = self._filter_submissions(query, date_from, date_to, user_name, user_email, field_value_search)
+        result = await self.session.stream(
+            query
+            .order_by(FormSubmission.submitted_at, FormSubmission.id)
+            .execution_options(yield_per=batch_size)
+        )
+        try:
+            async for partition in result.partitions():
+                rows = {
+                    row.id: {
+                        "id": row.id,
+                        "submitted_at": row.submitted_at,
+                        "user_name": row.user_name,
+                        "user_email": row.user_email,
+                        "values": {},
+                        "file_counts": {},
+                    }
+                    for row in partition
+                }
+                values = await self.session.execute(
+                    select(
+                        FormFieldValue.submission_id,
+                        FormFieldValue.field_id,
+                        case(
+                            (FormFieldValue.field_id.in_(presence_only_field_ids), func.substr(FormFieldValue.value, 1, 1)),
+                            else_=FormFieldValue.value,
+                        ),
+                    )
+                    .where(FormFieldValue.submission_id.in_(rows))
+                )
+                for submission_id, field_id, value in values:
+                    rows[submission_id]["values"][field_id] = value
+                file_counts = await self.session.execute(
+                    select(File.submission_id, File.field_id, func.count())
+                    .where(File.submission_id.in_(rows))
+                    .group_by(File.submission_id, File.field_id)
+                )
+                for submission_id, field_id, count in file_counts:
+                    rows[submission_id]["file_counts"][field_id] = count
+                yield list(rows.values())
+        finally:
+            await result.close()
+    
+    async def count_for_export(
+        self,
+        form_id: UUID,
+        date_from: datetime | None = None,
+        date_to: datetime | None = None,
+        user_name: str | None = None,
+        user_email: str | None = None,
+        field_value_search: str | None = None,
+    ) -> int:
+        """Count the submissions `stream_export_batches` yields for the same filters."""
+        if not any((date_from, date_to, user_name, user_email, field_value_search)):
+            return await self.count_by_form_id(form_id)
+        query = (
+            select(func.count(FormSubmission.id))
+            .outerjoin(User, User.id == FormSubmission.user_id)
+            .where(FormSubmission.form_id == form_id)
+        )
+        query = self._filter_submissions(query, date_from, date_to, user_name, user_email, field_value_search)
         result = await self.session.execute(query)
-        return list(result.scalars().all())
+        return result.scalar_one()
     
     async def count_by_form_id(self, form_id: UUID) -> int:
-        """Count submissions for a specific form."""
+        """Count submissions for a specific form (reads the maintained counter)."""
+        counts = await self.count_by_form_ids([form_id])
+        return counts[form_id]
+    
+    async def count_by_form_ids(self, form_ids: list[UUID]) -> dict[UUID, int]:
+        """Count submissions for several forms with one primary-key lookup."""
+        counts = dict.fromkeys(form_ids, 0)
+        if not form_ids:
+            return counts
         result = await self.session.execute(
-            select(func.count(FormSubmission.id))
-            .where(FormSubmission.form_id == form_id)
+            select(FormSubmissionCounter.form_id, FormSubmissionCounter.submission_count)
+            .where(FormSubmissionCounter.form_id.in_(form_ids))
         )
-        return result.scalar_one() or 0
+        counts.update({form_id: count for form_id, count in result})
+        return counts
+    
+    async def _adjust_counter(self, form_id: UUID, submissions: int, files: int) -> None:
+        """Add to the form's submission and file counters, creating the row on first insert."""
+        if submissions > 0:
+            dialect_insert = postgresql.insert if self.session.bind.dialect.name == "postgresql" else sqlite.insert
+            stmt = dialect_insert(FormSubmissionCounter.__table__).values(
+                form_id=form_id, submission_count=submissions, file_count=files
+            )
+            await self.session.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[FormSubmissionCounter.form_id],
+                    set_={
+                        "submission_count": FormSubmissionCounter.submission_count + stmt.excluded.submission_count,
+                        "file_count": FormSubmissionCounter.file_count + stmt.excluded.file_count,
+                    }
+                )
+            )
+        else:
+            await self.session.execute(
+                update(FormSubmissionCounter.__table__)
+                .where(
+                    FormSubmissionCounter.form_id == form_id,
+                    FormSubmissionCounter.submission_count + submissions >= 0,
+                    FormSubmissionCounter.file_count + files >= 0
+                )
+                .values(
+                    submission_count=FormSubmissionCounter.submission_count + submissions,
+                    file_count=FormSubmissionCounter.file_count + files
+                )
+            )
     
     async def delete(self, submission_id: UUID) -> bool:
         """Delete a submission by ID."""
         submission = await self.get_by_id(submission_id)
         if not submission:
             return False
+        form_id, file_count = submission.form_id, len(submission.files)
         await self.session.delete(submission)
         await self.session.flush()
+        await self._adjust_counter(form_id, -1, -file_count)
         return True
 
@@ -1,3 +1,11 @@
+import asyncio
+import base64
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import IO, Any
+from urllib.parse import quote
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+from azure.storage.blob import BlobBlock, BlobSasPermissions, ContentSettings, generate_blob_sas
 from azure.storage.blob.aio import BlobServiceClient
 from app.core.config import settings
 
@@ -6,6 +14,9 @@ class AzureBlobStorageClient:
     def __init__(self):
         self.connection_string = settings.azure_storage_connection_string
         self.container_name = settings.azure_storage_container_name
+        self.chunk_size = settings.azure_upload_chunk_size
+        # Caps concurrent streamed uploads across all requests of this process
+        self._upload_semaphore = asyncio.Semaphore(settings.upload_concurrency_per_process)
         self._blob_service_client = None
         self._container_client = None
     
@@ -33,6 +44,51 @@ class AzureBlobStorageClient:
         await blob_client.upload_blob(file_content, overwrite=True)
         return blob_client.url
     
+    async def upload_stream(
+        self,
+        stream: Any,
+        blob_name: str,
+        content_type: str | None = None,
+    ) -> tuple[str, int]:
+        """
+        Upload a file-like object to Azure Blob Storage in fixed-size staged blocks.
+        
+        The stream is read chunk by chunk (``await stream.read(n)``, e.g. a starlette
+        UploadFile), so peak memory stays at one chunk regardless of file size.
+        
+        Returns:
+            Tuple of (blob URL, uploaded size in bytes)
+        """
+        async with self._upload_semaphore:
+            return await self._upload_blocks(stream, blob_name, content_type)
+    
+    async def _upload_blocks(self, stream: Any, blob_name: str, content_type: str | None) -> tuple[str, int]:
+        container = await self.container_client
+        blob_client = container.get_blob_client(blob_name)
+        
+        md5 = hashlib.md5()
+        size = 0
+        blocks: list[BlobBlock] = []
+        while True:
+            chunk = await stream.read(self.chunk_size)
+            if not chunk:
+                break
+            # Block ids must be base64 strings of equal length within a blob
+            block_id = base64.b64encode(f"{len(blocks):08d}".encode()).decode()
+            await blob_client.stage_block(block_id, chunk, length=len(chunk))
+            blocks.append(BlobBlock(block_id=block_id))
+            md5.update(chunk)
+            size += len(chunk)
+        
+        await blob_client.commit_block_list(
+            blocks,
+            content_settings=ContentSettings(
+                content_type=content_type,
+                content_md5=bytearray(md5.digest()),
+            ),
+        )
+        return blob_client.url, size
+    
     async def delete_file(self, blob_name: str) -> None:
         """Delete file from Azure Blob Storage"""
         container = await self.container_client
@@ -45,6 +101,90 @@ class AzureBlobStorageClient:
         blob_client = container.get_blob_client(blob_name)
         return blob_client.url
     
+    async def generate_upload_url(self, blob_name: str, expires_in: timedelta) -> tuple[str, datetime]:
+        """
+        Create a short-lived, write-only SAS URL for uploading a single blob directly.
+        
+        Returns:
+            Tuple of (SAS URL, expiry time in UTC)
+        """
+        service_client = await self.blob_service_client
+        container = await self.container_client
+        blob_client = container.get_blob_client(blob_name)
+        expires_at = datetime.now(timezone.utc) + expires_in
+        sas_token = generate_blob_sas(
+            account_name=service_client.account_name,
+            container_name=self.container_name,
+            blob_name=blob_name,
+            account_key=service_client.credential.account_key,
+            permission=BlobSasPermissions(create=True, write=True),
+            expiry=expires_at,
+        )
+        return f"{blob_client.url}?{sas_token}", expires_at
+    
+    async def generate_download_url(
+        self,
+        blob_name: str,
+        expires_in: timedelta,
+        filename: str | None = None,
+    ) -> tuple[str, datetime]:
+        """
+        Create a short-lived, read-only SAS URL for downloading a single blob directly.
+        
+        With `filename`, the blob is served as an attachment under that name.
+        
+        Returns:
+            Tuple of (SAS URL, expiry time in UTC)
+        """
+        service_client = await self.blob_service_client
+        container = await self.container_client
+        blob_client = container.get_blob_client(blob_name)
+        expires_at = datetime.now(timezone.utc) + expires_in
+        sas_token = generate_blob_sas(
+            account_name=service_client.account_name,
+            container_name=self.container_name,
+            blob_name=blob_name,
+            account_key=service_client.credential.account_key,
+            permission=BlobSasPermissions(read=True),
+            expiry=expires_at,
+            content_disposition=f"attachment; filename*=UTF-8''{quote(filename)}" if filename else None,
+        )
+        return f"{blob_client.url}?{sas_token}", expires_at
+    
+    async def copy_blob(self, source_blob_name: str, target_blob_name: str) -> bool:
+        """
+        Copy a blob within the container synchronously (Put Blob From URL).
+        
+        The source is read through a short-lived read-only SAS, and the call returns
+        once the target is complete. Returns False if the source does not exist.
+        """
+        source_url, _ = await self.generate_download_url(source_blob_name, timedelta(minutes=5))
+        container = await self.container_client
+        target_client = container.get_blob_client(target_blob_name)
+        try:
+            await target_client.upload_blob_from_url(source_url, overwrite=True)
+        except ResourceNotFoundError:
+            return False
+        except HttpResponseError as e:
+            if e.status_code == 404:
+                return False
+            raise
+        return True
+    
+    async def get_blob_properties(self, blob_name: str) -> dict[str, Any] | None:
+        """Get URL, size and content type of a blob, or None if it does not exist"""
+        container = await self.container_client
+        blob_client = container.get_blob_client(blob_name)
+        try:
+            properties = await blob_client.get_blob_properties()
+        except ResourceNotFoundError:
+            return None
+        return {
+            "url": blob_client.url,
+            "size": properties.size,
+            "content_type": properties.content_settings.content_type,
+        }
+    
     async def download_file(self, blob_name: str) -> bytes:
         """Download file content from Azure Blob Storage"""
         container = await self.container_client
@@ -52,6 +192,44 @@ class AzureBlobStorageClient:
         download_stream = await blob_client.download_blob()
         return await download_stream.readall()
     
+    async def download_to_file(self, blob_name: str, file: IO[bytes]) -> bool:
+        """Write a blob's content into `file` chunk by chunk; False if the blob does not exist"""
+        container = await self.container_client
+        blob_client = container.get_blob_client(blob_name)
+        try:
+            download_stream = await blob_client.download_blob()
+        except ResourceNotFoundError:
+            return False
+        async for chunk in download_stream.chunks():
+            file.write(chunk)
+        return True
+    
+    async def delete_prefix(self, prefix: str) -> int:
+        """Delete every blob whose name starts with `prefix`; returns the number deleted"""
+        container = await self.container_client
+        deleted = 0
+        async for blob in container.list_blobs(name_starts_with=prefix):
+            try:
+                await container.delete_blob(blob.name)
+            except ResourceNotFoundError:
+                continue
+            deleted += 1
+        return deleted
+    
+    async def delete_older_than(self, prefix: str, before: datetime) -> int:
+        """Delete every blob under `prefix` last modified before `before` (UTC); returns the number deleted"""
+        container = await self.container_client
+        deleted = 0
+        async for blob in container.list_blobs(name_starts_with=prefix):
+            if blob.last_modified >= before:
+                continue
+            try:
+                await container.delete_blob(blob.name)
+            except ResourceNotFoundError:
+                continue
+            deleted += 1
+        return deleted
+    
     async def close(self):
         """Close connections"""
         if self._container_client:
@@ -0,0 +1,235 @@
+import asyncio
+import logging
+import os
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import IO
+from uuid import UUID
+
+from app.domain.services.export_cache import IExportCache
+from app.infrastructure.services.azure_storage import AzureBlobStorageClient
+
+
+logger = logging.getLogger(__name__)
+
+BLOB_PREFIX = "export-cache"
+# Partially written entries; never served and skipped when the index is rebuilt
+TEMP_PREFIX = ".tmp-"
+
+
+class _AsyncFileReader:
+    """Awaitable `read(n)` over a local file, for `upload_stream`."""
+
+    def __init__(self, file: IO[bytes]):
+        self._file = file
+
+    async def read(self, size: int = -1) -> bytes:
+        return await asyncio.to_thread(self._file.read, size)
+
+
+class DiskExportCache(IExportCache):
+    """
+    Size-bounded LRU of rendered exports on local disk, optionally backed by blob storage.
+
+    Entries live at `{directory}/{form_id}/{submission_id}/{key}`, so all entries of a
+    submission or of a form go away with one directory. Recency is tracked by an
+    in-process index, rebuilt from file modification times on first use and touched
+    on every hit; processes sharing the directory each evict by their own view of it,
+    and a file removed underneath is just a miss. File system work runs in threads.
+
+    With `blob_storage`, rendered entries are also uploaded under `export-cache/`, and
+    a disk miss is filled from there before rendering again (e.g. on a fresh host).
+    The blob tier is only trimmed by invalidation, not by the local size bound.
+    `max_bytes <= 0` disables the cache.
+    """
+
+    def __init__(self, directory: str, max_bytes: int, blob_storage: AzureBlobStorageClient | None = None):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.blob_storage = blob_storage
+        self._entries: OrderedDict[Path, int] | None = None
+        self._total_bytes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    async def get(self, form_id: UUID, submission_id: UUID, key: str) -> IO[bytes] | None:
+        if not self.enabled:
+            return None
+        await self._load_index()
+        path = self._path(form_id, submission_id, key)
+        try:
+            file, size = await asyncio.to_thread(self._open, path)
+        except FileNotFoundError:
+            self._forget(path)
+            if self.blob_storage is None:
+                return None
+            return await self._fill_from_blob(path, self._blob_name(form_id, submission_id, key))
+        self._record(path, size)
+        await self._evict()
+        return file
+
+    async def put(self, form_id: UUID, submission_id: UUID, key: str, file: IO[bytes]) -> None:
+        if not self.enabled:
+            return
+        await self._load_index()
+        path = self._path(form_id, submission_id, key)
+        try:
+            size = await asyncio.to_thread(self._store, path, file)
+        except OSError as e:
+            logger.warning(f"Could not cache export {path}: {e}")
+            file.seek(0)
+            return
+        self._record(path, size)
+        await self._evict()
+        if self.blob_storage is not None:
+            await self._upload(path, self._blob_name(form_id, submission_id, key))
+
+    async def invalidate_submission(self, form_id: UUID, submission_id: UUID) -> None:
+        if not self.enabled:
+            return
+        await self._drop(self.directory / str(form_id) / str(submission_id), f"{BLOB_PREFIX}/{form_id}/{submission_id}/")
+
+    async def invalidate_form(self, form_id: UUID) -> None:
+        if not self.enabled:
+            return
+        await self._drop(self.directory / str(form_id), f"{BLOB_PREFIX}/{form_id}/")
+
+    def _path(self, form_id: UUID, submission_id: UUID, key: str) -> Path:
+        return self.directory / str(form_id) / str(submission_id) / key
+
+    @staticmethod
+    def _blob_name(form_id: UUID, submission_id: UUID, key: str) -> str:
+        return f"{BLOB_PREFIX}/{form_id}/{submission_id}/{key}"
+
+    async def _load_index(self) -> None:
+        if self._entries is not None:
+            return
+        entries = await asyncio.to_thread(self._scan)
+        if self._entries is None:
+            self._entries = entries
+            self._total_bytes = sum(entries.values())
+
+    def _record(self, path: Path, size: int) -> None:
+        self._forget(path)
+        self._entries[path] = size
+        self._total_bytes += size
+
+    def _forget(self, path: Path) -> None:
+        size = self._entries.pop(path, None)
+        if size is not None:
+            self._total_bytes -= size
+
+    async def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits; the newest entry always stays."""
+        evicted: list[Path] = []
+        while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+            path, size = self._entries.popitem(last=False)
+            self._total_bytes -= size
+            evicted.append(path)
+        if evicted:
+            await asyncio.to_thread(self._unlink_all, evicted)
+            logger.debug(f"Evicted {len(evicted)} cached export(s)")
+
+    async def _drop(self, directory: Path, blob_prefix: str) -> None:
+        await self._load_index()
+        for path in [path for path in self._entries if directory in path.parents]:
+            self._forget(path)
+        await asyncio.to_thread(shutil.rmtree, directory, True)
+        if self.blob_storage is not None:
+            try:
+                await self.blob_storage.delete_prefix(blob_prefix)
+            except Exception as e:
+                logger.warning(f"Could not delete cached exports under {blob_prefix}: {e}")
+
+    async def _fill_from_blob(self, path: Path, blob_name: str) -> IO[bytes] | None:
+        try:
+            temp = await asyncio.to_thread(self._temp_file, path)
+        except OSError as e:
+            logger.warning(f"Could not cache export {path}: {e}")
+            return None
+        try:
+            with temp:
+                found = await self.blob_storage.download_to_file(blob_name, temp)
+            if found:
+                await asyncio.to_thread(os.replace, temp.name, path)
+        except Exception as e:
+            logger.warning(f"Could not fill cached export {path} from {blob_name}: {e}")
+            found = False
+        if not found:
+            await asyncio.to_thread(self._unlink_all, [Path(temp.name)])
+            return None
+        file, size = await asyncio.to_thread(self._open, path)
+        self._record(path, size)
+        await self._evict()
+        return file
+
+    async def _upload(self, path: Path, blob_name: str) -> None:
+        try:
+            file = await asyncio.to_thread(open, path, "rb")
+        except FileNotFoundError:
+            return
+        try:
+            await self.blob_storage.upload_stream(_AsyncFileReader(file), blob_name)
+        except Exception as e:
+            logger.warning(f"Could not upload cached export {blob_name}: {e}")
+        finally:
+            file.close()
+
+    def _scan(self) -> OrderedDict[Path, int]:
+        found: list[tuple[float, Path, int]] = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.startswith(TEMP_PREFIX):
+                    continue
+                path = Path(root) / name
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                found.append((stat.st_mtime, path, stat.st_size))
+        found.sort(key=lambda entry: entry[0])
+        return OrderedDict((path, size) for _, path, size in found)
+
+    @staticmethod
+    def _open(path: Path) -> tuple[IO[bytes], int]:
+        file = open(path, "rb")
+        # Modification time is the recency order used when the index is rebuilt
+        os.utime(path)
+        return file, os.fstat(file.fileno()).st_size
+
+    @staticmethod
+    def _temp_file(path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return tempfile.NamedTemporaryFile(dir=path.parent, prefix=TEMP_PREFIX, delete=False)
+
+    def _store(self, path: Path, file: IO[bytes]) -> int:
+        temp = self._temp_file(path)
+        try:
+            with temp:
+                file.seek(0)
+                shutil.copyfileobj(file, temp)
+                size = temp.tell()
+            # Atomic, so readers never see a partially written entry
+            os.replace(temp.name, path)
+        except BaseException:
+            self._unlink_all([Path(temp.name)])
+            raise
+        finally:
+            file.seek(0)
+        return size
+
+    @staticmethod
+    def _unlink_all(paths: list[Path]) -> None:
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
@@ -1,16 +1,27 @@
+import asyncio
 import csv
+import functools
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Executor
 from io import BytesIO, StringIO
 from datetime import datetime
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils import get_column_letter
+from typing import IO, Any, TypeVar
 
-from app.domain.models import FormSubmission
+from app.domain.models import Form, FormField, FormSubmission
 from app.domain.services.submission_export_service import ISubmissionExportService, ExportFormat
+from app.infrastructure.services.xlsx_writer import BORDERED, CHUNK_SIZE, HEADER, METADATA, WRAPPED, XlsxTableWriter
+
+T = TypeVar("T")
 
 
 class SubmissionExportService(ISubmissionExportService):
-    """Service for exporting submissions to various formats."""
+    """
+    Service for exporting submissions to various formats.
+    
+    Rendering (CSV encoding, openpyxl rows, zip compression) is synchronous CPU
+    work, so it runs on `executor` (the loop's default executor when None)
+    instead of blocking the event loop.
+    """
     
     # Translations
     TRANSLATIONS = {
@@ -42,25 +53,33 @@ class SubmissionExportService(ISubmissionExportService):
         }
     }
     
+    def __init__(self, executor: Executor | None = None):
+        self.executor = executor
+    
     async def export_submission(
         self, 
         submission: FormSubmission, 
         format: ExportFormat,
         locale: str = "en"
-    ) -> tuple[BytesIO, str]:
+    ) -> tuple[IO[bytes], str]:
         """Export submission to specified format."""
         if format == "csv":
-            return await self._export_to_csv(submission, locale)
+            return await self._run(self._export_to_csv, submission, locale)
         elif format == "xlsx":
-            return await self._export_to_xlsx(submission, locale)
+            return await self._run(self._export_to_xlsx, submission, locale)
         else:
             raise ValueError(f"Unsupported export format: {format}")
     
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run blocking rendering work on the export executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args))
+    
     def _get_text(self, key: str, locale: str) -> str:
         """Get translated text."""
         return self.TRANSLATIONS.get(locale, self.TRANSLATIONS["en"]).get(key, key)
     
-    async def _export_to_csv(self, submission: FormSubmission, locale: str) -> tuple[BytesIO, str]:
+    def _export_to_csv(self, submission: FormSubmission, locale: str) -> tuple[BytesIO, str]:
         """Export submission to CSV format."""
         # Create CSV in memory
         output = StringIO()
@@ -114,39 +133,17 @@ class SubmissionExportService(ISubmissionExportService):
         buffer = BytesIO(csv_content.encode('utf-8-sig'))  # UTF-8 with BOM for Excel compatibility
         buffer.seek(0)
         
-        # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        form_title = submission.form.title if submission.form else "submission"
-        user_name = submission.user.name if submission.user and submission.user.name else "user"
-        # Sanitize filename parts
-        def sanitize(text: str) -> str:
-            return "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in text)
-        safe_title = sanitize(form_title)
-        safe_user = sanitize(user_name)
-        filename = f"{safe_title}_{safe_user}_{timestamp}.csv"
+        filename = self.submission_export_filename(
+            submission.form.title if submission.form else None,
+            submission.user.name if submission.user else None,
+            "csv"
+        )
         
         return buffer, filename
     
-    async def _export_to_xlsx(self, submission: FormSubmission, locale: str) -> tuple[BytesIO, str]:
+    def _export_to_xlsx(self, submission: FormSubmission, locale: str) -> tuple[IO[bytes], str]:
         """Export submission to XLSX format."""
-        # Create workbook
-        wb = Workbook()
-        ws = wb.active
-        ws.title = "Submission"
-        
-        # Define styles
-        header_fill = PatternFill(start_color="4F46E5", end_color="4F46E5", fill_type="solid")
-        header_font = Font(bold=True, color="FFFFFF", size=12)
-        metadata_fill = PatternFill(start_color="F3F4F6", end_color="F3F4F6", fill_type="solid")
-        metadata_font = Font(bold=True, size=11)
-        border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-        
-        row = 1
+        writer = XlsxTableWriter("Submission", column_widths=[30, 50])
         
         # Add metadata section
         metadata = [
@@ -155,30 +152,14 @@ class SubmissionExportService(ISubmissionExportService):
             (self._get_text("email", locale), submission.user.email if submission.user and submission.user.email else self._get_text("n_a", locale)),
             (self._get_text("submitted_at", locale), submission.submitted_at.strftime("%Y-%m-%d %H:%M:%S")),
         ]
-        
         for label, value in metadata:
-            cell_label = ws.cell(row=row, column=1, value=label)
-            cell_value = ws.cell(row=row, column=2, value=value)
-            cell_label.fill = metadata_fill
-            cell_label.font = metadata_font
-            cell_label.border = border
-            cell_value.border = border
-            row += 1
+            writer.append_styled([(label, METADATA), (value, BORDERED)])
         
         # Empty row
-        row += 1
+        writer.append([])
         
         # Add headers
-        header_cell_1 = ws.cell(row=row, column=1, value=self._get_text("field", locale))
-        header_cell_2 = ws.cell(row=row, column=2, value=self._get_text("value", locale))
-        
-        for cell in [header_cell_1, header_cell_2]:
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            cell.border = border
-        
-        row += 1
+        writer.append([self._get_text("field", locale), self._get_text("value", locale)], HEADER)
         
         # Add field values
         if submission.form and submission.form.fields:
@@ -209,33 +190,109 @@ class SubmissionExportService(ISubmissionExportService):
                 elif field_value:
                     value = field_value.value or ""
                 
-                cell_field = ws.cell(row=row, column=1, value=field.label)
-                cell_value = ws.cell(row=row, column=2, value=value)
-                
-                cell_field.border = border
-                cell_value.border = border
-                cell_value.alignment = Alignment(wrap_text=True, vertical='top')
-                
-                row += 1
+                writer.append_styled([(field.label, BORDERED), (value, WRAPPED)])
         
-        # Adjust column widths
-        ws.column_dimensions[get_column_letter(1)].width = 30
-        ws.column_dimensions[get_column_letter(2)].width = 50
+        buffer = writer.save()
         
-        # Save to buffer
-        buffer = BytesIO()
-        wb.save(buffer)
-        buffer.seek(0)
-        
-        # Generate filename
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        form_title = submission.form.title if submission.form else "submission"
-        user_name = submission.user.name if submission.user and submission.user.name else "user"
-        # Sanitize filename parts
-        def sanitize(text: str) -> str:
-            return "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in text)
-        safe_title = sanitize(form_title)
-        safe_user = sanitize(user_name)
-        filename = f"{safe_title}_{safe_user}_{timestamp}.xlsx"
+        filename = self.submission_export_filename(
+            submission.form.title if submission.form else None,
+            submission.user.name if submission.user else None,
+            "xlsx"
+        )
         
         return buffer, filename
+    
+    async def stream_form_csv(
+        self,
+        form: Form,
+        batches: AsyncIterator[list[dict[str, Any]]],
+        locale: str = "en"
+    ) -> AsyncIterator[bytes]:
+        """Render a form's submissions as a wide CSV: one row per submission, one column per field."""
+        fields = sorted(form.fields, key=lambda f: f.order)
+        output = StringIO()
+        writer = csv.writer(output)
+        writer.writerow([
+            self._get_text("submitted_at", locale),
+            self._get_text("submitted_by", locale),
+            self._get_text("email", locale),
+            *(field.label for field in fields),
+        ])
+        # UTF-8 with BOM for Excel compatibility; only the first chunk carries it
+        yield output.getvalue().encode("utf-8-sig")
+        
+        async for batch in batches:
+            yield await self._run(self._render_csv_rows, batch, fields, locale)
+    
+    async def stream_form_xlsx(
+        self,
+        form: Form,
+        batches: AsyncIterator[list[dict[str, Any]]],
+        locale: str = "en"
+    ) -> AsyncIterator[bytes]:
+        """Render a form's submissions as a wide XLSX sheet, streamed from a spooled temp file."""
+        fields = sorted(form.fields, key=lambda f: f.order)
+        writer = XlsxTableWriter("Submissions", column_widths=[20, 25, 30, *(30 for _ in fields)])
+        writer.append([
+            self._get_text("submitted_at", locale),
+            self._get_text("submitted_by", locale),
+            self._get_text("email", locale),
+            *(field.label for field in fields),
+        ], HEADER)
+        async for batch in batches:
+            await self._run(self._append_xlsx_rows, writer, batch, fields, locale)
+        
+        output = await self._run(writer.save)
+        try:
+            while chunk := await self._run(output.read, CHUNK_SIZE):
+                yield chunk
+        finally:
+            output.close()
+    
+    def submission_export_filename(self, form_title: str | None, user_name: str | None, format: ExportFormat) -> str:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"{self._sanitize(form_title or 'submission')}_{self._sanitize(user_name or 'user')}_{timestamp}.{format}"
+    
+    def form_export_filename(self, form: Form, format: ExportFormat) -> str:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        return f"{self._sanitize(form.title)}_submissions_{timestamp}.{format}"
+    
+    def _render_csv_rows(self, batch: list[dict[str, Any]], fields: list[FormField], locale: str) -> bytes:
+        output = StringIO()
+        csv.writer(output).writerows(self._form_export_row(row, fields, locale) for row in batch)
+        return output.getvalue().encode("utf-8")
+    
+    def _append_xlsx_rows(
+        self, writer: XlsxTableWriter, batch: list[dict[str, Any]], fields: list[FormField], locale: str
+    ) -> None:
+        for row in batch:
+            writer.append(self._form_export_row(row, fields, locale))
+    
+    def _form_export_row(self, row: dict[str, Any], fields: list[FormField], locale: str) -> list[str]:
+        """Cells of one submission row of a whole-form export."""
+        cells = [
+            row["submitted_at"].strftime("%Y-%m-%d %H:%M:%S"),
+            row["user_name"] or "Unknown",
+            row["user_email"] or self._get_text("n_a", locale),
+        ]
+        for field in fields:
+            if field.field_type == "files":
+                files_count = row["file_counts"].get(field.id, 0)
+                if files_count > 0:
+                    cells.append(f"{files_count} {self._get_text('files_uploaded', locale)}")
+                else:
+                    cells.append(self._get_text("no_files", locale))
+            elif field.field_type == "signature":
+                # Only presence is exported, never the base64 image
+                if row["values"].get(field.id):
+                    cells.append(self._get_text("signature_present", locale))
+                else:
+                    cells.append(self._get_text("no_signature", locale))
+            else:
+                cells.append(row["values"].get(field.id) or "")
+        return cells
+    
+    @staticmethod
+    def _sanitize(text: str) -> str:
+        """Make text safe for use in a filename."""
+        return "".join(c if c.isalnum() or c in (' ', '-', '_') else '_' for c in text)
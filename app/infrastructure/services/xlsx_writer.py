@@ -0,0 +1,93 @@
+import tempfile
+from collections.abc import Iterable, Iterator
+from typing import IO, Any
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+# Workbooks stay in memory up to this size, then roll over to a temp file on disk
+SPOOL_MAX_SIZE = 8 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+HEADER = "Export Header"
+METADATA = "Export Metadata"
+BORDERED = "Export Bordered"
+WRAPPED = "Export Wrapped"
+
+
+def _named_styles() -> list[NamedStyle]:
+    side = Side(style="thin")
+    border = Border(left=side, right=side, top=side, bottom=side)
+    return [
+        NamedStyle(
+            name=HEADER,
+            font=Font(bold=True, color="FFFFFF", size=12),
+            fill=PatternFill(start_color="4F46E5", end_color="4F46E5", fill_type="solid"),
+            alignment=Alignment(horizontal="center", vertical="center"),
+            border=border,
+        ),
+        NamedStyle(
+            name=METADATA,
+            font=Font(bold=True, size=11),
+            fill=PatternFill(start_color="F3F4F6", end_color="F3F4F6", fill_type="solid"),
+            border=border,
+        ),
+        NamedStyle(name=BORDERED, border=border),
+        NamedStyle(name=WRAPPED, border=border, alignment=Alignment(wrap_text=True, vertical="top")),
+    ]
+
+
+class XlsxTableWriter:
+    """
+    Single-sheet XLSX writer with memory independent of the number of rows.
+
+    Built on openpyxl's write-only mode: appended rows are serialized to a temp
+    file right away instead of being kept as cell objects. Styling uses the
+    workbook's named styles, so every styled cell refers to one shared style
+    record rather than carrying its own font, fill and border objects.
+    """
+
+    def __init__(self, sheet_title: str, column_widths: Iterable[float] = ()):
+        self._workbook = Workbook(write_only=True)
+        for style in _named_styles():
+            self._workbook.add_named_style(style)
+        self._sheet = self._workbook.create_sheet(title=sheet_title)
+        for index, width in enumerate(column_widths, start=1):
+            self._sheet.column_dimensions[get_column_letter(index)].width = width
+
+    def append(self, values: Iterable[Any], style: str | None = None) -> None:
+        """Append a row, optionally with one named style for all of its cells."""
+        if style is None:
+            self._sheet.append(list(values))
+        else:
+            self._sheet.append([self._cell(value, style) for value in values])
+
+    def append_styled(self, cells: Iterable[tuple[Any, str | None]]) -> None:
+        """Append a row of (value, named style) pairs."""
+        self._sheet.append([value if style is None else self._cell(value, style) for value, style in cells])
+
+    def save(self) -> IO[bytes]:
+        """Finish the workbook into a spooled temp file, rewound for reading."""
+        output = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)
+        try:
+            self._workbook.save(output)
+        except BaseException:
+            output.close()
+            raise
+        output.seek(0)
+        return output
+
+    def _cell(self, value: Any, style: str) -> WriteOnlyCell:
+        cell = WriteOnlyCell(self._sheet, value=value)
+        cell.style = style
+        return cell
+
+
+def iter_file_chunks(file: IO[bytes], chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+    """Read `file` in chunks and close it once exhausted (or abandoned)."""
+    try:
+        while chunk := file.read(chunk_size):
+            yield chunk
+    finally:
+        file.close()
@@ -10,10 +10,15 @@ from app.core.config import settings
 from app.api.routes import forms_router, users_router, auth_router, super_admin_router
 from app.core.container import container
 from app.core.middleware import ContainerSessionMiddleware
+from app.core.compression import CompressionMiddleware
+from app.core.responses import FastJSONResponse
 import app.application.handlers as handlers_pkg
 from app.core.container import container
 from app.domain.events.submission_events import SubmissionCreatedEvent
+from app.domain.events.export_events import ExportJobRequestedEvent
 from app.application.handlers.notifications.telegram_notification_handler import TelegramNotificationHandler
+from app.application.handlers.submissions.export_job_worker import ExportJobWorker
+from app.application.handlers.submissions.upload_sweeper import UploadSweeper
 
 # Configure logging
 logging.basicConfig(
@@ -63,6 +68,17 @@ async def lifespan(app: FastAPI):
         logger.info("Telegram notification handler subscribed to events")
     else:
         logger.info("Telegram bot token not configured, skipping notification handler")
+    
+    export_worker = ExportJobWorker(export_service=container.submission_export_service())
+    bus.subscribe(ExportJobRequestedEvent, export_worker.handle)
+    try:
+        await export_worker.recover()
+    except Exception as e:
+        logger.error(f"Failed to recover export jobs: {e}", exc_info=True)
+
+    # Direct uploads that were never submitted
+    upload_sweeper = UploadSweeper()
+    upload_sweeper.start()
 
     bot_service = container.telegram_bot_polling_service()
     await bot_service.start()
@@ -70,6 +86,10 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application...")
     await bot_service.stop()
+    await upload_sweeper.stop()
+    # Jobs first: their renders need the executor until they finish or are interrupted
+    await export_worker.shutdown(settings.export_job_shutdown_grace_seconds)
+    container.export_executor().shutdown(wait=False, cancel_futures=True)
 
 
 app = FastAPI(
@@ -77,6 +97,7 @@ app = FastAPI(
     version=settings.app_version,
     debug=settings.debug,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     docs_url="/docs" if settings.environment != "production" else None,
     redoc_url="/redoc" if settings.environment != "production" else None,
     openapi_url="/openapi.json" if settings.environment != "production" else None
@@ -85,6 +106,13 @@ app = FastAPI(
 # Per-request DB session + DI container middleware
 app.add_middleware(ContainerSessionMiddleware)
 
+# Response compression (streaming-aware, skips small and already-compressed bodies)
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.compression_gzip_level,
+)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
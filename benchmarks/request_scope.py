@@ -0,0 +1,77 @@
+"""
+Requests per second on cheap routes: lazy vs eager request scope.
+
+Drives the full ASGI stack (CORS, compression, ContainerSessionMiddleware,
+routing) in-process, so the numbers measure framework and middleware overhead
+only. The eager variant restores the previous behaviour, where every request
+got an AsyncSession and a DeferredEventBus up front (and closed the session
+afterwards) whether or not the route used them.
+
+    python -m benchmarks.request_scope [--requests 20000]
+"""
+import argparse
+import asyncio
+import time
+
+from starlette.middleware import Middleware
+
+from app.core.container import container
+from app.main import app
+
+ROUTES = ["/health", "/"]
+
+
+class EagerRequestScope:
+    """Opens the request's session and deferred bus before the route runs."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] not in ("OPTIONS", "HEAD"):
+            container.db_session()
+            container.request_event_bus()
+        await self.app(scope, receive, send)
+
+
+async def measure(asgi_app, path: str, requests: int) -> float:
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "headers": [(b"host", b"bench"), (b"accept-encoding", b"gzip")],
+        "client": ("127.0.0.1", 50000), "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    for _ in range(200):
+        await asgi_app(dict(scope), receive, send)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await asgi_app(dict(scope), receive, send)
+    return requests / (time.perf_counter() - start)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    args = parser.parse_args()
+
+    lazy_stack = app.build_middleware_stack()
+    # Innermost user middleware, i.e. running inside ContainerSessionMiddleware's scope
+    app.user_middleware.append(Middleware(EagerRequestScope))
+    eager_stack = app.build_middleware_stack()
+    app.user_middleware.pop()
+
+    for path in ROUTES:
+        eager = await measure(eager_stack, path, args.requests)
+        lazy = await measure(lazy_stack, path, args.requests)
+        print(f"GET {path:<8} eager: {eager:8.0f} req/s   lazy: {lazy:8.0f} req/s  ({lazy / eager - 1:+.0%})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
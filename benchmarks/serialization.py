@@ -0,0 +1,105 @@
+"""
+Response serialization: FastAPI's default path vs FastJSONResponse.
+
+The default path dumps the returned model, re-validates it against
+`response_model` and encodes it with the stdlib `json` module; the fast path
+renders the already-typed model directly. The payload mimics an admin
+submissions page: 100 submissions x 20 field values (one multi-KB signature
+value each), 2 files, and the full form definition embedded per submission.
+
+    python -m benchmarks.serialization [--submissions 100] [--rounds 50]
+"""
+import argparse
+import asyncio
+import base64
+import os
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from app.application.dto.models import (
+    FileDTO,
+    FormDTO,
+    FormFieldDTO,
+    FormFieldValueDTO,
+    FormSubmissionDTO,
+    UserDTO,
+)
+from app.application.handlers.submissions.get_submissions_by_admin_handler import GetSubmissionsByAdminResponse
+from app.core.responses import FastJSONResponse
+
+
+def build_payload(submission_count: int, field_count: int = 20) -> GetSubmissionsByAdminResponse:
+    fields = [
+        FormFieldDTO(
+            id=uuid4(), field_type="signature" if i == 0 else "text", label=f"Field {i}",
+            name=f"field_{i}", is_required=i % 2 == 0, order=i, placeholder="Type here"
+        ) for i in range(field_count)
+    ]
+    form = FormDTO(
+        id=uuid4(), title="Event registration", description="Annual event sign-up",
+        creator_id=uuid4(), created_at=datetime(2025, 1, 1), updated_at=datetime(2025, 1, 2), fields=fields
+    )
+    signature = "data:image/png;base64," + base64.b64encode(os.urandom(3 * 1024)).decode()
+    submissions = []
+    for n in range(submission_count):
+        user = UserDTO(id=uuid4(), name=f"User {n}", email=f"user{n}@example.com", is_admin=False, admin_id=form.creator_id)
+        submissions.append(FormSubmissionDTO(
+            id=uuid4(), form_id=form.id, user_id=user.id,
+            submitted_at=datetime(2025, 3, 1) + timedelta(minutes=n), user=user, form=form,
+            field_values=[
+                FormFieldValueDTO(id=uuid4(), field_id=f.id, value=signature if i == 0 else f"value {n}-{i}")
+                for i, f in enumerate(fields)
+            ],
+            files=[
+                FileDTO(
+                    id=uuid4(), field_id=fields[1].id, original_filename=f"doc{k}.pdf",
+                    blob_url=f"https://example.blob.core.windows.net/files/{n}/{k}", file_size=123456,
+                    content_type="application/pdf"
+                ) for k in range(2)
+            ]
+        ))
+    return GetSubmissionsByAdminResponse(submissions=submissions, next_cursor="abc")
+
+
+async def default_path(route: APIRoute, payload) -> bytes:
+    content = await serialize_response(field=route.response_field, response_content=payload, is_coroutine=True)
+    return JSONResponse(content).body
+
+
+async def fast_path(route: APIRoute, payload) -> bytes:
+    return FastJSONResponse(payload).body
+
+
+async def measure(fn, route, payload, rounds: int) -> tuple[float, int]:
+    body = await fn(route, payload)
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await fn(route, payload)
+    return (time.perf_counter() - start) / rounds, len(body)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--submissions", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    async def endpoint():
+        return None
+
+    route = APIRoute("/bench", endpoint, response_model=GetSubmissionsByAdminResponse)
+    payload = build_payload(args.submissions)
+
+    baseline, baseline_size = await measure(default_path, route, payload, args.rounds)
+    fast, fast_size = await measure(fast_path, route, payload, args.rounds)
+    print(f"payload: {args.submissions} submissions, {baseline_size / 1024:.0f} KiB (fast: {fast_size / 1024:.0f} KiB)")
+    print(f"default (re-validate + json): {baseline * 1000:8.2f} ms/response")
+    print(f"fast (typed render)         : {fast * 1000:8.2f} ms/response  ({baseline / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
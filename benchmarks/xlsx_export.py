@@ -0,0 +1,95 @@
+"""
+Peak memory of XLSX generation: write-only XlsxTableWriter vs a regular Workbook.
+
+Every row count runs in a fresh subprocess, which writes a wide sheet (header
+plus 3 metadata and 10 field columns per row) into a spooled temp file and
+reports its peak RSS. The write-only engine should stay flat as rows grow;
+the regular workbook keeps every cell in memory until it is saved.
+
+    python -m benchmarks.xlsx_export [--rows 1000,10000,100000,1000000] [--engine write-only|regular|both]
+"""
+import argparse
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+FIELD_COUNT = 10
+# The regular workbook needs several GB beyond this; skip it for larger runs
+REGULAR_MAX_ROWS = 100_000
+
+
+def rows(count: int):
+    start = datetime(2025, 1, 1)
+    for n in range(count):
+        yield [
+            (start + timedelta(seconds=n)).strftime("%Y-%m-%d %H:%M:%S"),
+            f"User {n}",
+            f"user{n}@example.com",
+            *(f"value {n}-{i}" for i in range(FIELD_COUNT)),
+        ]
+
+
+def header() -> list[str]:
+    return ["Submitted At", "Submitted By", "Email", *(f"Field {i}" for i in range(FIELD_COUNT))]
+
+
+def write_only(count: int) -> int:
+    from app.infrastructure.services.xlsx_writer import HEADER, XlsxTableWriter
+
+    writer = XlsxTableWriter("Submissions", column_widths=[20, 25, 30, *([30] * FIELD_COUNT)])
+    writer.append(header(), HEADER)
+    for row in rows(count):
+        writer.append(row)
+    with writer.save() as output:
+        return output.seek(0, 2)
+
+
+def regular(count: int) -> int:
+    from openpyxl import Workbook
+    from openpyxl.styles import Font
+
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(header())
+    for cell in sheet[1]:
+        cell.font = Font(bold=True)
+    for row in rows(count):
+        sheet.append(row)
+    with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as output:
+        workbook.save(output)
+        return output.seek(0, 2)
+
+
+def child(engine: str, count: int) -> None:
+    start = time.perf_counter()
+    size = (write_only if engine == "write-only" else regular)(count)
+    elapsed = time.perf_counter() - start
+    # ru_maxrss is in KiB on Linux
+    peak_mib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{engine:<10} {count:>9} rows  peak RSS {peak_mib:8.1f} MiB  {elapsed:7.1f} s  xlsx {size / 1024 / 1024:7.1f} MiB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", default="1000,10000,100000,1000000")
+    parser.add_argument("--engine", choices=["write-only", "regular", "both"], default="both")
+    parser.add_argument("--child", nargs=2, metavar=("ENGINE", "ROWS"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child[0], int(args.child[1]))
+        return
+
+    engines = ["write-only", "regular"] if args.engine == "both" else [args.engine]
+    for engine in engines:
+        for count in (int(value) for value in args.rows.split(",")):
+            if engine == "regular" and args.engine == "both" and count > REGULAR_MAX_ROWS:
+                continue
+            subprocess.run([sys.executable, "-m", "benchmarks.xlsx_export", "--child", engine, str(count)], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,10 @@
 import pytest
 import asyncio
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest import mock
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.pool import StaticPool
 from httpx import AsyncClient
@@ -11,7 +16,7 @@ from app.main import app
 from app.core.database import Base
 from app.infrastructure.services.azure_storage import azure_storage_client
 from app.core.container import container
-from app.domain.models import User
+from app.domain.models import User, Form, FormField, FormSubmission, FormFieldValue, File
 import app.application.handlers as handlers_pkg
 
 
@@ -84,6 +89,153 @@ async def admin_user(db_session):
     return admin
 
 
+class FakeBlobStorage:
+    """
+    In-memory stand-in for AzureBlobStorageClient.
+    
+    Pass it where a storage client is injected, or use `patch` for code calling the
+    global `azure_storage_client` directly.
+    """
+    
+    # Methods `patch` replaces on the real client
+    DIRECT_UPLOAD_METHODS = ("generate_upload_url", "get_blob_properties", "copy_blob", "delete_file")
+    
+    def __init__(self):
+        self.blobs: dict[str, bytes] = {}
+        self.content_types: dict[str, str | None] = {}
+    
+    @staticmethod
+    def url(blob_name: str) -> str:
+        return f"https://test.blob.core.windows.net/test-container/{blob_name}"
+    
+    def put(self, blob_name: str, data: bytes, content_type: str | None = None) -> None:
+        """Store a blob as a client uploading through a SAS URL would."""
+        self.blobs[blob_name] = data
+        self.content_types[blob_name] = content_type
+    
+    def patch(self, client, methods=DIRECT_UPLOAD_METHODS):
+        """Route `methods` of the real storage client to this fake."""
+        return mock.patch.multiple(client, **{name: mock.AsyncMock(side_effect=getattr(self, name)) for name in methods})
+    
+    async def upload_stream(self, stream, blob_name, content_type=None):
+        data = b""
+        while chunk := await stream.read(1024):
+            data += chunk
+        self.put(blob_name, data, content_type)
+        return self.url(blob_name), len(data)
+    
+    async def generate_upload_url(self, blob_name, expires_in):
+        return f"{self.url(blob_name)}?sig=fake", datetime.now(timezone.utc) + expires_in
+    
+    async def get_blob_properties(self, blob_name):
+        if blob_name not in self.blobs:
+            return None
+        return {
+            "url": self.url(blob_name),
+            "size": len(self.blobs[blob_name]),
+            "content_type": self.content_types.get(blob_name),
+        }
+    
+    async def copy_blob(self, source_blob_name, target_blob_name):
+        if source_blob_name not in self.blobs:
+            return False
+        self.put(target_blob_name, self.blobs[source_blob_name], self.content_types.get(source_blob_name))
+        return True
+    
+    async def delete_file(self, blob_name):
+        del self.blobs[blob_name]
+        self.content_types.pop(blob_name, None)
+    
+    async def download_to_file(self, blob_name, file):
+        if blob_name not in self.blobs:
+            return False
+        file.write(self.blobs[blob_name])
+        return True
+    
+    async def delete_prefix(self, prefix):
+        names = [name for name in self.blobs if name.startswith(prefix)]
+        for name in names:
+            await self.delete_file(name)
+        return len(names)
+
+
+@dataclass
+class SeededForm:
+    """Rows created by the `seed_form` fixture."""
+    admin: User
+    form: Form
+    # field name -> field
+    fields: dict[str, FormField]
+    submissions: list[FormSubmission] = field(default_factory=list)
+
+
+SEED_BASE_TIME = datetime(2025, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="function")
+def seed_form(db_session):
+    """
+    Factory committing an admin, one form and its submissions.
+    
+    Fields are FormField keyword arguments (order defaults to the position). Per
+    submission index, `values` gives field name -> value, `file_counts` field name ->
+    number of files, `submitted_at` the timestamp (default: one minute apart) and
+    `submitter` the user (default: a new user "User {i}" linked to the admin).
+    Pass `admin` to seed a form for an existing (or not yet added) admin.
+    """
+    async def seed(
+        *,
+        admin: User | None = None,
+        admin_name: str = "Admin",
+        fields: Sequence[dict[str, Any]] = ({"field_type": "text", "label": "Answer", "name": "answer"},),
+        submissions: int = 0,
+        values: Callable[[int], dict[str, str]] | None = None,
+        file_counts: Callable[[int], dict[str, int]] | None = None,
+        submitted_at: Callable[[int], datetime] = lambda i: SEED_BASE_TIME + timedelta(minutes=i),
+        submitter: Callable[[int], User] | None = None,
+        **form_columns: Any,
+    ) -> SeededForm:
+        if admin is None:
+            admin = User(id=uuid4(), name=admin_name, email=f"admin-{uuid4().hex[:8]}@test.com", is_admin=True)
+        db_session.add(admin)
+        form = Form(id=uuid4(), creator_id=admin.id, **{"title": "Form", **form_columns})
+        form.fields.extend(
+            FormField(id=uuid4(), **{"order": position, **spec}) for position, spec in enumerate(fields)
+        )
+        db_session.add(form)
+        seeded = SeededForm(admin=admin, form=form, fields={f.name: f for f in form.fields})
+        
+        for i in range(submissions):
+            if submitter is not None:
+                user = submitter(i)
+            else:
+                user = User(
+                    id=uuid4(), name=f"User {i}", email=f"user{i}-{uuid4().hex[:8]}@test.com",
+                    is_admin=False, admin_id=admin.id
+                )
+            db_session.add(user)
+            submission = FormSubmission(id=uuid4(), form_id=form.id, user_id=user.id, submitted_at=submitted_at(i))
+            for name, value in (values(i) if values else {}).items():
+                submission.field_values.append(
+                    FormFieldValue(id=uuid4(), field_id=seeded.fields[name].id, value=value)
+                )
+            for name, count in (file_counts(i) if file_counts else {}).items():
+                submission.files.extend(
+                    File(
+                        id=uuid4(), field_id=seeded.fields[name].id, original_filename=f"{k}.pdf",
+                        blob_name=f"b/{submission.id}/{k}", blob_url=f"https://blob/{submission.id}/{k}",
+                        file_size=1
+                    ) for k in range(count)
+                )
+            db_session.add(submission)
+            seeded.submissions.append(submission)
+        
+        await db_session.commit()
+        return seeded
+    
+    return seed
+
+
 @pytest.fixture(scope="function")
 def mock_azure_storage():
     """Mock Azure Storage client."""
@@ -92,7 +244,14 @@ def mock_azure_storage():
     async def mock_upload_file(file_content, blob_name):
         return f"https://test.blob.core.windows.net/test-container/{blob_name}"
     
-    with mock.patch.object(azure_storage_client, 'upload_file', side_effect=mock_upload_file):
+    async def mock_upload_stream(stream, blob_name, content_type=None):
+        size = 0
+        while chunk := await stream.read(azure_storage_client.chunk_size):
+            size += len(chunk)
+        return f"https://test.blob.core.windows.net/test-container/{blob_name}", size
+    
+    with mock.patch.object(azure_storage_client, 'upload_file', side_effect=mock_upload_file), \
+            mock.patch.object(azure_storage_client, 'upload_stream', side_effect=mock_upload_stream):
         yield azure_storage_client
 
 
@@ -0,0 +1,338 @@
+import base64
+import hashlib
+import io
+import json
+import pytest
+from unittest import mock
+from uuid import uuid4
+
+from app.infrastructure.services.azure_storage import AzureBlobStorageClient
+from tests.conftest import FakeBlobStorage
+
+
+class FakeAsyncStream:
+    """Minimal async file-like object mimicking starlette's UploadFile.read()."""
+
+    def __init__(self, content: bytes):
+        self._buffer = io.BytesIO(content)
+        self.max_read = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        chunk = self._buffer.read(size)
+        self.max_read = max(self.max_read, len(chunk))
+        return chunk
+
+
+class FakeBlobClient:
+    url = "https://test.blob.core.windows.net/test-container/blob"
+
+    def __init__(self):
+        self.blocks: dict[str, bytes] = {}
+        self.committed: list = []
+        self.content_settings = None
+
+    async def stage_block(self, block_id, data, length=None):
+        self.blocks[block_id] = data
+
+    async def commit_block_list(self, block_list, content_settings=None):
+        self.committed = [self.blocks[b.id] for b in block_list]
+        self.content_settings = content_settings
+
+
+@pytest.mark.asyncio
+async def test_upload_stream_stages_fixed_size_blocks():
+    """Uploads are read and staged chunk by chunk, never as one buffer."""
+    client = AzureBlobStorageClient()
+    client.chunk_size = 1024
+    blob_client = FakeBlobClient()
+    container = mock.Mock()
+    container.get_blob_client.return_value = blob_client
+    client._container_client = container
+
+    content = b"x" * 5000
+    stream = FakeAsyncStream(content)
+    url, size = await client.upload_stream(stream, "some/blob.bin", content_type="application/octet-stream")
+
+    assert url == blob_client.url
+    assert size == len(content)
+    assert stream.max_read == 1024
+    assert [len(b) for b in blob_client.committed] == [1024, 1024, 1024, 1024, 904]
+    assert b"".join(blob_client.committed) == content
+    assert bytes(blob_client.content_settings.content_md5) == hashlib.md5(content).digest()
+    block_ids = list(blob_client.blocks)
+    assert len({len(base64.b64decode(b)) for b in block_ids}) == 1
+
+
+async def _create_file_form(client, admin_user, auth_token) -> tuple[str, str]:
+    form_data = {
+        "title": "Upload Form",
+        "creator_id": str(admin_user.id),
+        "fields": [
+            {
+                "field_type": "files",
+                "label": "Attachments",
+                "name": "attachments",
+                "is_required": False,
+                "order": 0
+            }
+        ]
+    }
+    response = await client.post(
+        "/api/v1/forms",
+        json=form_data,
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+    form = response.json()["form"]
+    return form["id"], form["fields"][0]["id"]
+
+
+def _multipart(field_id: str, count: int):
+    data = {
+        "user_name": "Uploader",
+        "field_values_json": "{}",
+        "file_fields_json": "{" + ", ".join(f'"{i}": "{field_id}"' for i in range(count)) + "}"
+    }
+    files = [
+        ("files", (f"file{i}.txt", io.BytesIO(f"content {i}".encode()), "text/plain"))
+        for i in range(count)
+    ]
+    return data, files
+
+
+@pytest.mark.asyncio
+async def test_submission_uploads_run_concurrently(client, admin_user, auth_token):
+    """All attachments of one submission are uploaded in parallel, bounded per request."""
+    import asyncio
+    from app.core.config import settings
+    from app.infrastructure.services.azure_storage import azure_storage_client
+
+    form_id, field_id = await _create_file_form(client, admin_user, auth_token)
+    in_flight = 0
+    max_in_flight = 0
+
+    async def slow_upload(stream, blob_name, content_type=None):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return f"https://test.blob.core.windows.net/test-container/{blob_name}", len(await stream.read())
+
+    data, files = _multipart(field_id, 6)
+    with mock.patch.object(settings, "upload_concurrency_per_request", 3), \
+            mock.patch.object(azure_storage_client, "upload_stream", side_effect=slow_upload):
+        response = await client.post(f"/api/v1/forms/{form_id}/submit", data=data, files=files)
+
+    assert response.status_code == 200
+    assert len(response.json()["submission"]["files"]) == 6
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_upload_removes_already_uploaded_blobs(client, admin_user, auth_token):
+    """A single failed upload rejects the submission and deletes the other blobs."""
+    from app.infrastructure.services.azure_storage import azure_storage_client
+
+    form_id, field_id = await _create_file_form(client, admin_user, auth_token)
+    uploaded: list[str] = []
+
+    async def flaky_upload(stream, blob_name, content_type=None):
+        if blob_name.endswith("file1.txt"):
+            raise RuntimeError("storage unavailable")
+        uploaded.append(blob_name)
+        return f"https://test.blob.core.windows.net/test-container/{blob_name}", len(await stream.read())
+
+    delete_file = mock.AsyncMock()
+    data, files = _multipart(field_id, 3)
+    with mock.patch.object(azure_storage_client, "upload_stream", side_effect=flaky_upload), \
+            mock.patch.object(azure_storage_client, "delete_file", delete_file):
+        response = await client.post(f"/api/v1/forms/{form_id}/submit", data=data, files=files)
+
+    assert response.status_code == 400
+    assert sorted(call.args[0] for call in delete_file.await_args_list) == sorted(uploaded)
+    assert len(uploaded) == 2
+
+
+@pytest.mark.asyncio
+async def test_direct_upload_via_presigned_url(client, admin_user, auth_token):
+    """Client uploads to a SAS URL and submits only the blob reference."""
+    from app.infrastructure.services.azure_storage import azure_storage_client
+
+    form_id, field_id = await _create_file_form(client, admin_user, auth_token)
+    store = FakeBlobStorage()
+    with store.patch(azure_storage_client):
+        url_response = await client.post(
+            f"/api/v1/forms/{form_id}/uploads",
+            json={"field_id": field_id, "filename": "report.pdf", "content_type": "application/pdf", "file_size": 2048}
+        )
+        assert url_response.status_code == 200
+        upload = url_response.json()
+        assert upload["blob_name"].startswith(f"uploads/{form_id}/{field_id}/")
+        assert "sig=" in upload["upload_url"]
+        assert upload["headers"]["x-ms-blob-type"] == "BlockBlob"
+        traversal = await client.post(f"/api/v1/forms/{form_id}/uploads", json={"field_id": field_id, "filename": "../x.pdf"})
+        assert traversal.status_code == 400
+
+        # Simulate the browser PUT to storage
+        store.put(upload["blob_name"], b"x" * 2048, "application/pdf")
+
+        submit_response = await client.post(
+            f"/api/v1/forms/{form_id}/submit",
+            data={
+                "user_name": "Direct Uploader",
+                "uploaded_files_json": json.dumps([
+                    {"field_id": field_id, "blob_name": upload["blob_name"], "filename": "report.pdf", "file_size": 2048}
+                ])
+            }
+        )
+
+    assert submit_response.status_code == 200
+    files = submit_response.json()["submission"]["files"]
+    assert len(files) == 1
+    assert files[0]["original_filename"] == "report.pdf"
+    assert files[0]["file_size"] == 2048
+    assert files[0]["content_type"] == "application/pdf"
+    # Taken over into a submission path the upload SAS does not cover
+    submission_id = submit_response.json()["submission"]["id"]
+    assert list(store.blobs) == [f"{submission_id}/{field_id}/{files[0]['blob_url'].split('/')[-2]}/report.pdf"]
+
+
+@pytest.mark.asyncio
+async def test_direct_upload_reference_is_verified(client, admin_user, auth_token):
+    """Missing blobs, foreign paths, mismatched sizes and malformed references are rejected."""
+    from app.infrastructure.services.azure_storage import azure_storage_client
+
+    form_id, field_id = await _create_file_form(client, admin_user, auth_token)
+    store = FakeBlobStorage()
+    own_blob = f"uploads/{form_id}/{field_id}/abc/report.pdf"
+    foreign_blob = f"uploads/{uuid4()}/{field_id}/abc/report.pdf"
+    store.put(own_blob, b"x" * 10, "application/pdf")
+    store.put(foreign_blob, b"x" * 10, "application/pdf")
+
+    references = [
+        {"field_id": field_id, "blob_name": f"uploads/{form_id}/{field_id}/missing/report.pdf"},
+        {"field_id": field_id, "blob_name": foreign_blob},
+        {"field_id": field_id, "blob_name": own_blob, "file_size": 11},
+        {"field_id": field_id, "blob_name": own_blob, "content_type": "image/png"},
+        # Malformed declarations are a bad request, not a server error
+        {"field_id": field_id, "blob_name": own_blob, "file_size": [10]},
+        {"field_id": field_id, "blob_name": own_blob, "file_size": {"bytes": 10}},
+        {"field_id": field_id, "blob_name": own_blob, "file_size": "10"},
+        {"field_id": field_id, "blob_name": own_blob, "file_size": True},
+        {"field_id": field_id, "blob_name": own_blob, "filename": ["report.pdf"]},
+        {"field_id": field_id, "blob_name": own_blob, "filename": "../../report.pdf"},
+    ]
+    with store.patch(azure_storage_client):
+        for reference in references:
+            response = await client.post(
+                f"/api/v1/forms/{form_id}/submit",
+                data={"user_name": "Mallory", "uploaded_files_json": json.dumps([reference])}
+            )
+            assert response.status_code == 400, reference
+            # Rejected copies are removed again; the uploads themselves are left alone
+            assert sorted(store.blobs) == sorted([own_blob, foreign_blob])
+
+
+@pytest.mark.asyncio
+async def test_rejected_reference_fails_before_multipart_uploads(client, admin_user, auth_token):
+    """A bad direct-upload reference rejects the submission without streaming any multipart file."""
+    from app.infrastructure.services.azure_storage import azure_storage_client
+
+    form_id, field_id = await _create_file_form(client, admin_user, auth_token)
+    store = FakeBlobStorage()
+    good_blob = f"uploads/{form_id}/{field_id}/good/report.pdf"
+    store.put(good_blob, b"x" * 10, "application/pdf")
+    references = [
+        {"field_id": field_id, "blob_name": good_blob},
+        {"field_id": field_id, "blob_name": f"uploads/{form_id}/{field_id}/missing/report.pdf"},
+    ]
+    upload_stream = mock.AsyncMock()
+    data, files = _multipart(field_id, 1)
+    data["uploaded_files_json"] = json.dumps(references)
+    with store.patch(azure_storage_client), mock.patch.object(azure_storage_client, "upload_stream", upload_stream):
+        response = await client.post(f"/api/v1/forms/{form_id}/submit", data=data, files=files)
+
+    assert response.status_code == 400
+    upload_stream.assert_not_awaited()
+    assert list(store.blobs) == [good_blob]
+
+
+@pytest.mark.asyncio
+async def test_failed_multipart_upload_removes_accepted_copies(client, admin_user, auth_token):
+    """Direct uploads taken over by a submission are removed again if its multipart upload fails."""
+    from app.infrastructure.services.azure_storage import azure_storage_client
+
+    form_id, field_id = await _create_file_form(client, admin_user, auth_token)
+    store = FakeBlobStorage()
+    good_blob = f"uploads/{form_id}/{field_id}/good/report.pdf"
+    store.put(good_blob, b"x" * 10, "application/pdf")
+    data, files = _multipart(field_id, 1)
+    data["uploaded_files_json"] = json.dumps([{"field_id": field_id, "blob_name": good_blob}])
+    upload_stream = mock.AsyncMock(side_effect=RuntimeError("storage unavailable"))
+    with store.patch(azure_storage_client), mock.patch.object(azure_storage_client, "upload_stream", upload_stream):
+        response = await client.post(f"/api/v1/forms/{form_id}/submit", data=data, files=files)
+
+    assert response.status_code == 400
+    # The copy is gone; the client's upload stays for a retry
+    assert list(store.blobs) == [good_blob]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("failure", ["insert", "commit"])
+async def test_failed_submission_keeps_direct_uploads(client, admin_user, auth_token, failure):
+    """The client's uploads are only removed once the submission commits; its copies go if it does not."""
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from app.infrastructure.repositories.form_submission_repository import FormSubmissionRepository
+    from app.infrastructure.services.azure_storage import azure_storage_client
+
+    form_id, field_id = await _create_file_form(client, admin_user, auth_token)
+    store = FakeBlobStorage()
+    good_blob = f"uploads/{form_id}/{field_id}/good/report.pdf"
+    store.put(good_blob, b"x" * 10, "application/pdf")
+    data = {"user_name": "Retrier", "uploaded_files_json": json.dumps([{"field_id": field_id, "blob_name": good_blob}])}
+
+    with store.patch(azure_storage_client):
+        if failure == "insert":
+            with mock.patch.object(FormSubmissionRepository, "create", side_effect=RuntimeError("insert failed")):
+                response = await client.post(f"/api/v1/forms/{form_id}/submit", data=data)
+            assert response.status_code == 500
+        else:
+            # A failed commit propagates out of the middleware
+            with mock.patch.object(AsyncSession, "commit", side_effect=RuntimeError("commit failed")), \
+                    pytest.raises(RuntimeError):
+                await client.post(f"/api/v1/forms/{form_id}/submit", data=data)
+
+    assert list(store.blobs) == [good_blob]
+
+    with store.patch(azure_storage_client):
+        response = await client.post(f"/api/v1/forms/{form_id}/submit", data=data)
+    assert response.status_code == 200
+    assert good_blob not in store.blobs
+    assert len(store.blobs) == 1
+
+
+@pytest.mark.asyncio
+async def test_sweep_deletes_only_abandoned_uploads():
+    """Blobs under uploads/ older than the URL lifetime plus grace are removed; newer ones stay."""
+    from datetime import datetime, timedelta, timezone
+    from types import SimpleNamespace
+    from app.application.handlers.submissions.upload_sweeper import UploadSweeper
+
+    now = datetime.now(timezone.utc)
+    listed = {"uploads/f/a/old.pdf": now - timedelta(hours=3), "uploads/f/a/new.pdf": now - timedelta(minutes=5)}
+    deleted: list[str] = []
+
+    async def list_blobs(name_starts_with):
+        assert name_starts_with == "uploads/"
+        for name, last_modified in listed.items():
+            yield SimpleNamespace(name=name, last_modified=last_modified)
+
+    async def delete_blob(name):
+        deleted.append(name)
+
+    storage = AzureBlobStorageClient()
+    storage._container_client = mock.Mock(list_blobs=list_blobs, delete_blob=delete_blob)
+    sweeper = UploadSweeper(storage, interval_seconds=60, max_age=timedelta(minutes=75))
+
+    assert await sweeper.sweep() == 1
+    assert deleted == ["uploads/f/a/old.pdf"]
@@ -0,0 +1,109 @@
+import asyncio
+import gzip
+import pytest
+import zlib
+from httpx import AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+from app.core.compression import CompressionMiddleware, select_encoding
+
+
+LARGE = {"rows": [{"id": i, "value": "repeated submission value"} for i in range(500)]}
+
+
+async def large_json(request):
+    return JSONResponse(LARGE)
+
+
+async def small_json(request):
+    return JSONResponse({"ok": True})
+
+
+async def pdf(request):
+    return Response(b"%PDF-" + b"x" * 5000, media_type="application/pdf")
+
+
+async def stream(request):
+    async def rows():
+        yield b"id,value\n"
+        for i in range(1000):
+            yield f"{i},value {i}\n".encode()
+    return StreamingResponse(rows(), media_type="text/csv")
+
+
+def _client() -> AsyncClient:
+    app = Starlette(routes=[
+        Route("/large", large_json), Route("/small", small_json), Route("/pdf", pdf), Route("/stream", stream)
+    ])
+    return AsyncClient(app=CompressionMiddleware(app, minimum_size=500), base_url="http://test")
+
+
+async def _raw(client: AsyncClient, path: str, accept_encoding: str | None = "gzip"):
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {"Accept-Encoding": ""}
+    async with client.stream("GET", path, headers=headers) as response:
+        body = b"".join([chunk async for chunk in response.aiter_raw()])
+    return response, body
+
+
+@pytest.mark.asyncio
+async def test_large_response_is_gzipped():
+    async with _client() as client:
+        response, body = await _raw(client, "/large")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) == len(body)
+    assert gzip.decompress(body) == JSONResponse(LARGE).body
+
+
+@pytest.mark.asyncio
+async def test_small_excluded_and_unaccepted_responses_pass_through():
+    async with _client() as client:
+        small, small_body = await _raw(client, "/small")
+        document, document_body = await _raw(client, "/pdf")
+        identity, identity_body = await _raw(client, "/large", accept_encoding=None)
+    assert "content-encoding" not in small.headers and small_body == b'{"ok":true}'
+    assert "content-encoding" not in document.headers and document_body.startswith(b"%PDF-")
+    assert "content-encoding" not in identity.headers and identity_body == JSONResponse(LARGE).body
+
+
+@pytest.mark.asyncio
+async def test_streamed_response_is_compressed_incrementally():
+    messages = []
+
+    async def app(scope, receive, send):
+        await (await stream(None))(scope, receive, send)
+
+    async def receive():
+        # No disconnect during the test; StreamingResponse keeps listening for one
+        await asyncio.Event().wait()
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "method": "GET", "path": "/stream", "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip")],
+    }
+    await CompressionMiddleware(app, minimum_size=500)(scope, receive, send)
+
+    headers = dict(messages[0]["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    bodies = [m for m in messages[1:] if m["type"] == "http.response.body"]
+    # One sync-flushed compressed chunk per streamed chunk, so rows reach the client as produced
+    assert len(bodies) > 1 and all(m["body"] for m in bodies[:-1])
+    assert bodies[-1]["more_body"] is False
+    body = zlib.decompress(b"".join(m["body"] for m in bodies), 16 + zlib.MAX_WBITS).decode()
+    assert body.splitlines()[0] == "id,value" and body.splitlines()[-1] == "999,value 999"
+
+
+def test_encoding_negotiation():
+    supported = ["br", "zstd", "gzip"]
+    assert select_encoding("gzip, deflate, br", supported) == "br"
+    assert select_encoding("br;q=0.5, gzip", supported) == "gzip"
+    assert select_encoding("zstd, gzip;q=0", supported) == "zstd"
+    assert select_encoding("*", ["gzip"]) == "gzip"
+    assert select_encoding("identity", supported) is None
+    assert select_encoding("br", ["gzip"]) is None
@@ -0,0 +1,138 @@
+import io
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from sqlalchemy.ext.asyncio import AsyncSession
+from uuid import uuid4
+
+from app.core.container import container
+from app.domain.models import User, FormSubmission
+from app.domain.services.export_cache import export_cache_key
+from app.infrastructure.services.export_cache import DiskExportCache
+from tests.conftest import FakeBlobStorage
+
+
+@pytest.fixture
+def export_cache(tmp_path):
+    cache = DiskExportCache(str(tmp_path / "exports"), max_bytes=1024 * 1024)
+    with container.export_cache.override(cache):
+        yield cache
+
+
+async def _seed(seed_form):
+    admin = User(id=uuid4(), name="Auditor", email="cache-admin@test.com", is_admin=True)
+    seeded = await seed_form(
+        admin=admin, title="Audit", updated_at=datetime(2025, 1, 1),
+        submissions=1, values=lambda i: {"answer": "Yes"}, submitter=lambda i: admin,
+    )
+    return seeded.form, seeded.submissions[0]
+
+
+def _entries(cache: DiskExportCache, submission_id):
+    directory = next(cache.directory.glob(f"*/{submission_id}"), None)
+    return sorted(path.name for path in directory.iterdir()) if directory else []
+
+
+@pytest.mark.asyncio
+async def test_repeat_export_is_served_from_cache(client, seed_form, export_cache):
+    form, submission = await _seed(seed_form)
+    url = f"/api/v1/submissions/{submission.id}/export?format=xlsx&locale=en"
+
+    first = await client.get(url)
+    assert first.status_code == 200
+    assert _entries(export_cache, submission.id) == [export_cache_key(submission.id, form.updated_at, "xlsx", "en")]
+
+    with patch("app.infrastructure.services.submission_export_service.SubmissionExportService.export_submission",
+               side_effect=AssertionError("rendered again")):
+        second = await client.get(url)
+    assert second.status_code == 200
+    assert second.content == first.content
+    assert "Audit_Auditor_" in second.headers["content-disposition"]
+
+    # Another locale is another entry
+    assert (await client.get(f"/api/v1/submissions/{submission.id}/export?format=xlsx&locale=uk")).status_code == 200
+    assert len(_entries(export_cache, submission.id)) == 2
+
+
+@pytest.mark.asyncio
+async def test_form_change_and_submission_delete_invalidate(client, db_session, seed_form, export_cache, auth_token):
+    form, submission = await _seed(seed_form)
+    other = FormSubmission(id=uuid4(), form_id=form.id, user_id=submission.user_id)
+    db_session.add(other)
+    await db_session.commit()
+    for submission_id in (submission.id, other.id):
+        await client.get(f"/api/v1/submissions/{submission_id}/export?format=csv")
+
+    await client.delete(f"/api/v1/submissions/{other.id}")
+    assert _entries(export_cache, other.id) == []
+    assert len(_entries(export_cache, submission.id)) == 1
+
+    response = await client.put(
+        f"/api/v1/forms/{form.id}",
+        json={"form_id": str(form.id), "title": "Audit 2025"},
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+    assert response.status_code == 200
+    assert _entries(export_cache, submission.id) == []
+    assert export_cache.total_bytes == 0
+
+    # Rendered again with the new title
+    response = await client.get(f"/api/v1/submissions/{submission.id}/export?format=csv")
+    assert "Audit 2025" in response.content.decode("utf-8-sig")
+
+
+@pytest.mark.asyncio
+async def test_failed_submission_delete_keeps_cached_exports(client, seed_form, export_cache):
+    form, submission = await _seed(seed_form)
+    await client.get(f"/api/v1/submissions/{submission.id}/export?format=csv")
+
+    # Invalidation waits for the commit; a rolled back delete leaves the entry alone
+    with patch.object(AsyncSession, "commit", side_effect=RuntimeError("commit failed")), \
+            pytest.raises(RuntimeError):
+        await client.delete(f"/api/v1/submissions/{submission.id}")
+    assert len(_entries(export_cache, submission.id)) == 1
+
+
+@pytest.mark.asyncio
+async def test_disk_cache_evicts_least_recently_used(tmp_path):
+    form_id = uuid4()
+    cache = DiskExportCache(str(tmp_path), max_bytes=250)
+    submissions = [uuid4() for _ in range(3)]
+    for submission_id in submissions[:2]:
+        await cache.put(form_id, submission_id, "k", io.BytesIO(b"x" * 100))
+
+    # Touch the first, so the second is the least recently used
+    (await cache.get(form_id, submissions[0], "k")).close()
+    await cache.put(form_id, submissions[2], "k", io.BytesIO(b"y" * 100))
+
+    assert await cache.get(form_id, submissions[1], "k") is None
+    for submission_id in (submissions[0], submissions[2]):
+        with await cache.get(form_id, submission_id, "k") as file:
+            assert len(file.read()) == 100
+    assert cache.total_bytes == 200
+
+    # A new process rebuilds the index from disk
+    reopened = DiskExportCache(str(tmp_path), max_bytes=250)
+    with await reopened.get(form_id, submissions[2], "k") as file:
+        assert file.read() == b"y" * 100
+    assert reopened.total_bytes == 200
+
+
+@pytest.mark.asyncio
+async def test_blob_tier_fills_an_empty_disk(tmp_path):
+    form_id, submission_id = uuid4(), uuid4()
+    storage = FakeBlobStorage()
+    rendered = io.BytesIO(b"rendered export")
+    await DiskExportCache(str(tmp_path / "a"), 1024, storage).put(form_id, submission_id, "k", rendered)
+    assert rendered.tell() == 0
+    assert storage.blobs == {f"export-cache/{form_id}/{submission_id}/k": b"rendered export"}
+
+    other_host = DiskExportCache(str(tmp_path / "b"), 1024, storage)
+    with await other_host.get(form_id, submission_id, "k") as file:
+        assert file.read() == b"rendered export"
+    assert (tmp_path / "b" / str(form_id) / str(submission_id) / "k").exists()
+    assert await other_host.get(form_id, submission_id, "missing") is None
+
+    await other_host.invalidate_form(form_id)
+    assert storage.blobs == {}
+    assert not (tmp_path / "b" / str(form_id)).exists()
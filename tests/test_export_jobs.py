@@ -0,0 +1,201 @@
+import asyncio
+import csv
+import io
+import pytest
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from uuid import UUID, uuid4
+
+from app.application.handlers.submissions.export_job_worker import ExportJobWorker
+from app.core.auth import create_access_token
+from app.core.container import container
+from app.domain.events.export_events import ExportJobRequestedEvent
+from app.domain.models import ExportJob, ExportJobStatus, STALE_EXPORT_JOB_ERROR
+from app.infrastructure.repositories.export_job_repository import ExportJobRepository
+from app.infrastructure.services.submission_export_service import SubmissionExportService
+from tests.conftest import FakeBlobStorage, TestSessionLocal
+
+
+async def _seed(seed_form, submission_count: int = 5):
+    seeded = await seed_form(
+        title="Survey", submissions=submission_count,
+        values=lambda i: {"answer": f"Answer {i}"},
+        submitted_at=lambda i: datetime(2025, 5, 1, 12, 0, 0) + timedelta(days=i),
+    )
+    return seeded.form
+
+
+def _sign_in(client, user_id) -> None:
+    client.headers["Authorization"] = f"Bearer {create_access_token(data={'sub': str(user_id)})}"
+
+
+@contextmanager
+def _worker(storage: FakeBlobStorage):
+    worker = ExportJobWorker(SubmissionExportService(), storage=storage, session_factory=TestSessionLocal)
+    bus = container.event_bus()
+    bus.subscribe(ExportJobRequestedEvent, worker.handle)
+    try:
+        yield worker
+    finally:
+        bus._subscribers.pop(ExportJobRequestedEvent, None)
+
+
+@pytest.mark.asyncio
+async def test_export_job_renders_uploads_and_redirects(client, seed_form):
+    form = await _seed(seed_form)
+    _sign_in(client, form.creator_id)
+    storage = FakeBlobStorage()
+    body = {"format": "csv", "filters": {"date_from": "2025-05-02T00:00:00"}}
+
+    with _worker(storage) as worker, \
+            patch("app.application.handlers.submissions.export_job_worker.settings.export_batch_size", 2):
+        created = await client.post(f"/api/v1/forms/{form.id}/export-jobs", json=body)
+        # Same export while the first is still queued: attaches to it
+        duplicate = await client.post(f"/api/v1/forms/{form.id}/export-jobs", json=body)
+        await worker.drain()
+
+    assert created.status_code == 202
+    job = created.json()["job"]
+    assert created.json()["created"] is True
+    assert job["status"] == "pending"
+    assert duplicate.json()["created"] is False
+    assert duplicate.json()["job"]["id"] == job["id"]
+
+    async def download_url(blob_name, expires_in, filename=None):
+        return f"https://test.blob.core.windows.net/test-container/{blob_name}?sig=test", datetime.utcnow() + expires_in
+
+    with patch("app.application.handlers.submissions.get_export_job_handler.azure_storage_client.generate_download_url",
+               side_effect=download_url):
+        status = await client.get(f"/api/v1/export-jobs/{job['id']}")
+        download = await client.get(f"/api/v1/export-jobs/{job['id']}/download", follow_redirects=False)
+
+    finished = status.json()["job"]
+    assert finished["status"] == "completed"
+    assert (finished["processed_rows"], finished["total_rows"]) == (4, 4)
+    blob_name = f"exports/{form.id}/{job['id']}.csv"
+    assert finished["download_url"].startswith(f"https://test.blob.core.windows.net/test-container/{blob_name}")
+    assert finished["file_size"] == len(storage.blobs[blob_name])
+    assert download.status_code == 303
+    assert download.headers["location"] == finished["download_url"]
+
+    rows = list(csv.reader(io.StringIO(storage.blobs[blob_name].decode("utf-8-sig"))))
+    assert [row[3] for row in rows[1:]] == ["Answer 1", "Answer 2", "Answer 3", "Answer 4"]
+
+    # Finished jobs no longer absorb requests
+    again = await client.post(f"/api/v1/forms/{form.id}/export-jobs", json=body)
+    assert again.json()["created"] is True
+    assert again.json()["job"]["id"] != job["id"]
+
+
+@pytest.mark.asyncio
+async def test_export_job_download_before_completion_is_409(client, seed_form):
+    form = await _seed(seed_form, submission_count=1)
+    _sign_in(client, form.creator_id)
+
+    # No worker subscribed: the job stays pending
+    created = await client.post(f"/api/v1/forms/{form.id}/export-jobs", json={"format": "xlsx"})
+    job_id = created.json()["job"]["id"]
+
+    assert (await client.get(f"/api/v1/export-jobs/{job_id}/download", follow_redirects=False)).status_code == 409
+    assert (await client.get(f"/api/v1/export-jobs/{uuid4()}")).status_code == 404
+    assert (await client.post(f"/api/v1/forms/{uuid4()}/export-jobs", json={})).status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_export_jobs_are_limited_to_the_form_owner(client, seed_form, admin_user):
+    form = await _seed(seed_form, submission_count=1)
+    _sign_in(client, form.creator_id)
+    job_id = (await client.post(f"/api/v1/forms/{form.id}/export-jobs", json={})).json()["job"]["id"]
+
+    _sign_in(client, admin_user.id)
+    assert (await client.post(f"/api/v1/forms/{form.id}/export-jobs", json={})).status_code == 403
+    assert (await client.get(f"/api/v1/export-jobs/{job_id}")).status_code == 403
+    assert (await client.get(f"/api/v1/export-jobs/{job_id}/download", follow_redirects=False)).status_code == 403
+
+    del client.headers["Authorization"]
+    assert (await client.get(f"/api/v1/export-jobs/{job_id}")).status_code in (401, 403)
+
+
+@pytest.mark.asyncio
+async def test_stale_active_job_is_replaced(db_session, seed_form):
+    form = await _seed(seed_form, submission_count=0)
+    repository = ExportJobRepository(db_session)
+
+    def job():
+        return ExportJob(id=uuid4(), form_id=form.id, format="csv", locale="en", filters={}, dedupe_key="k")
+
+    first, created = await repository.create_or_get_active(job(), stale_before=datetime.utcnow() - timedelta(minutes=10))
+    assert created
+    # Still fresh: attached
+    same, created = await repository.create_or_get_active(job(), stale_before=datetime.utcnow() - timedelta(minutes=10))
+    assert (same.id, created) == (first.id, False)
+
+    # Not updated since the cutoff: abandoned and replaced
+    replacement, created = await repository.create_or_get_active(job(), stale_before=datetime.utcnow() + timedelta(seconds=1))
+    assert created and replacement.id != first.id
+    abandoned = await db_session.get(ExportJob, first.id, populate_existing=True)
+    assert abandoned.status == ExportJobStatus.FAILED
+
+
+@pytest.mark.asyncio
+async def test_stale_active_job_is_reported_failed(client, db_session, seed_form):
+    form = await _seed(seed_form, submission_count=1)
+    _sign_in(client, form.creator_id)
+    created = await client.post(f"/api/v1/forms/{form.id}/export-jobs", json={"format": "csv"})
+    job_id = created.json()["job"]["id"]
+
+    job = await db_session.get(ExportJob, UUID(job_id))
+    job.updated_at = datetime.utcnow() - timedelta(hours=1)
+    await db_session.commit()
+
+    status = (await client.get(f"/api/v1/export-jobs/{job_id}")).json()["job"]
+    assert (status["status"], status["error"]) == ("failed", STALE_EXPORT_JOB_ERROR)
+    assert (await client.get(f"/api/v1/export-jobs/{job_id}/download", follow_redirects=False)).status_code == 409
+
+
+@pytest.mark.asyncio
+async def test_shutdown_interrupts_running_jobs_and_recover_requeues_pending(db_session, seed_form):
+    form = await _seed(seed_form, submission_count=2)
+    jobs = []
+    for key in ("running", "queued"):
+        job = ExportJob(id=uuid4(), form_id=form.id, format="csv", locale="en", filters={}, dedupe_key=key)
+        jobs.append((await ExportJobRepository(db_session).create_or_get_active(job, datetime.utcnow()))[0])
+    # Left running by a process that died
+    abandoned = ExportJob(
+        id=uuid4(), form_id=form.id, format="csv", locale="en", filters={}, dedupe_key="abandoned",
+        status=ExportJobStatus.RUNNING, updated_at=datetime.utcnow() - timedelta(hours=1)
+    )
+    db_session.add(abandoned)
+    await db_session.commit()
+
+    uploading = asyncio.Event()
+
+    class StalledStorage(FakeBlobStorage):
+        async def upload_stream(self, stream, blob_name, content_type=None):
+            uploading.set()
+            await asyncio.Event().wait()
+
+    worker = ExportJobWorker(SubmissionExportService(), storage=StalledStorage(), session_factory=TestSessionLocal,
+                             concurrency=1)
+    for job in jobs:
+        await worker.handle(ExportJobRequestedEvent(job_id=job.id))
+    await uploading.wait()
+    await worker.shutdown(grace_seconds=0.01)
+
+    async def status(job_id):
+        return (await db_session.get(ExportJob, job_id, populate_existing=True)).status
+
+    assert await status(jobs[0].id) == ExportJobStatus.FAILED
+    # Never got a slot: left for the next start
+    assert await status(jobs[1].id) == ExportJobStatus.PENDING
+    await worker.handle(ExportJobRequestedEvent(job_id=jobs[1].id))
+    assert not worker._tasks
+
+    storage = FakeBlobStorage()
+    restarted = ExportJobWorker(SubmissionExportService(), storage=storage, session_factory=TestSessionLocal)
+    await restarted.recover()
+    await restarted.drain()
+    assert await status(jobs[1].id) == ExportJobStatus.COMPLETED
+    assert list(storage.blobs) == [f"exports/{form.id}/{jobs[1].id}.csv"]
+    assert await status(abandoned.id) == ExportJobStatus.FAILED
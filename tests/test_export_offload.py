@@ -0,0 +1,93 @@
+import asyncio
+import threading
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from unittest.mock import patch
+from uuid import uuid4
+
+from app.domain.models import Form, FormField
+from app.infrastructure.services.submission_export_service import SubmissionExportService
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """
+    Records the thread of every task, and only lets a task proceed once the event
+    loop has run again after it started - which it can't if the task blocks the loop.
+    """
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.threads: list[int] = []
+        self.loop_ticked = threading.Event()
+
+    def submit(self, fn, *args, **kwargs):
+        def run():
+            self.threads.append(threading.get_ident())
+            self.loop_ticked.clear()
+            if not self.loop_ticked.wait(timeout=10):
+                raise AssertionError("event loop did not run while the task was in progress")
+            return fn(*args, **kwargs)
+        return super().submit(run)
+
+
+def _form(field_count: int = 10) -> Form:
+    form = Form(id=uuid4(), title="Lag", creator_id=uuid4())
+    form.fields = [
+        FormField(id=uuid4(), field_type="text", label=f"F{i}", name=f"f{i}", order=i) for i in range(field_count)
+    ]
+    return form
+
+
+async def _batches(form: Form, batch_count: int = 4, batch_size: int = 50):
+    for b in range(batch_count):
+        yield [
+            {
+                "id": uuid4(), "submitted_at": datetime(2025, 1, 1), "user_name": f"User {b}-{n}",
+                "user_email": None, "values": {f.id: f"value {n}" for f in form.fields}, "file_counts": {},
+            }
+            for n in range(batch_size)
+        ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("format, render_step", [("csv", "_render_csv_rows"), ("xlsx", "_append_xlsx_rows")])
+async def test_export_rendering_runs_off_the_event_loop(format, render_step):
+    form = _form()
+    loop_thread = threading.get_ident()
+    executor = RecordingExecutor()
+    service = SubmissionExportService(executor)
+    render_threads: list[int] = []
+    render = getattr(service, render_step)
+
+    def recording_render(*args):
+        render_threads.append(threading.get_ident())
+        return render(*args)
+
+    ticks = 0
+    done = asyncio.Event()
+
+    async def ticker():
+        nonlocal ticks
+        while not done.is_set():
+            ticks += 1
+            executor.loop_ticked.set()
+            await asyncio.sleep(0.001)
+
+    stream = service.stream_form_csv if format == "csv" else service.stream_form_xlsx
+    task = asyncio.create_task(ticker())
+    try:
+        with patch.object(service, render_step, recording_render):
+            content = b"".join([chunk async for chunk in stream(form, _batches(form), "en")])
+    finally:
+        done.set()
+        await task
+        executor.shutdown()
+
+    assert content
+    # Every batch was rendered on the executor, none on the event loop thread
+    assert len(render_threads) == 4
+    assert loop_thread not in render_threads
+    assert set(render_threads) <= set(executor.threads)
+    # and the loop kept running during each executor task (or the task would have failed)
+    assert ticks >= len(executor.threads)
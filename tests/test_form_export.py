@@ -0,0 +1,107 @@
+import csv
+import io
+import pytest
+from openpyxl import load_workbook
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from uuid import uuid4
+
+from app.core.auth import create_access_token
+from app.domain.models import User
+from app.infrastructure.repositories.form_submission_repository import FormSubmissionRepository
+
+
+SIGNATURE = "data:image/png;base64," + "A" * 5000
+
+
+async def _seed(seed_form, submission_count: int = 5):
+    seeded = await seed_form(
+        title="Registration",
+        # Declared out of order: columns must follow FormField.order
+        fields=[
+            {"field_type": "signature", "label": "Signature", "name": "sig", "order": 2},
+            {"field_type": "text", "label": "Name", "name": "name", "order": 0},
+            {"field_type": "files", "label": "Documents", "name": "docs", "order": 1},
+        ],
+        submissions=submission_count,
+        values=lambda i: {"name": f"Name, {i}", **({"sig": SIGNATURE} if i % 2 == 0 else {})},
+        file_counts=lambda i: {"docs": i},
+        # Inserted newest first; the export is chronological
+        submitted_at=lambda i: datetime(2025, 5, 1, 12, 0, 0) - timedelta(minutes=i),
+    )
+    return seeded.form, seeded.fields["sig"]
+
+
+def _auth(user_id) -> dict[str, str]:
+    return {"Authorization": f"Bearer {create_access_token(data={'sub': str(user_id)})}"}
+
+
+@pytest.mark.asyncio
+async def test_form_export_streams_wide_csv(client, seed_form):
+    form, _ = await _seed(seed_form)
+
+    with patch("app.application.handlers.submissions.export_form_submissions_handler.settings.export_batch_size", 2):
+        response = await client.get(f"/api/v1/forms/{form.id}/export?format=csv&locale=en", headers=_auth(form.creator_id))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "attachment;" in response.headers["content-disposition"]
+    assert response.content.startswith(b"\xef\xbb\xbf")
+    rows = list(csv.reader(io.StringIO(response.content.decode("utf-8-sig"))))
+    assert rows[0] == ["Submitted At", "Submitted By", "Email", "Name", "Documents", "Signature"]
+    assert [row[1] for row in rows[1:]] == [f"User {i}" for i in range(4, -1, -1)]
+    assert rows[1][3:] == ["Name, 4", "4 file(s) uploaded", "[Digital Signature Present]"]
+    assert rows[2][3:] == ["Name, 3", "3 file(s) uploaded", "No signature"]
+    assert rows[5][3:] == ["Name, 0", "No files", "[Digital Signature Present]"]
+
+
+@pytest.mark.asyncio
+async def test_form_export_streams_xlsx(client, seed_form):
+    form, _ = await _seed(seed_form)
+
+    with patch("app.application.handlers.submissions.export_form_submissions_handler.settings.export_batch_size", 2):
+        response = await client.get(f"/api/v1/forms/{form.id}/export?format=xlsx&locale=uk", headers=_auth(form.creator_id))
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    sheet = load_workbook(io.BytesIO(response.content)).active
+    rows = [[cell.value for cell in row] for row in sheet.iter_rows()]
+    assert rows[0] == ["Дата подання", "Подано", "Електронна пошта", "Name", "Documents", "Signature"]
+    assert sheet["A1"].style == "Export Header"
+    assert len(rows) == 6
+    assert rows[1][3:] == ["Name, 4", "4 файл(ів) завантажено", "[Цифровий підпис присутній]"]
+
+
+@pytest.mark.asyncio
+async def test_form_export_unknown_form_is_404(client, db_session, admin_user):
+    response = await client.get(f"/api/v1/forms/{uuid4()}/export", headers=_auth(admin_user.id))
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_form_export_is_limited_to_the_form_owner(client, db_session, seed_form, admin_user):
+    form, _ = await _seed(seed_form, submission_count=1)
+    url = f"/api/v1/forms/{form.id}/export"
+
+    assert (await client.get(url)).status_code in (401, 403)
+    assert (await client.get(url, headers=_auth(admin_user.id))).status_code == 403
+    assert (await client.get(f"{url}?format=pdf", headers=_auth(form.creator_id))).status_code == 422
+
+    super_admin = User(id=uuid4(), name="Root", email="export-root@test.com", is_admin=True, is_super_admin=True)
+    db_session.add(super_admin)
+    await db_session.commit()
+    assert (await client.get(url, headers=_auth(super_admin.id))).status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_export_batches_follow_batch_size(db_session, seed_form):
+    form, signature = await _seed(seed_form)
+    repository = FormSubmissionRepository(db_session)
+
+    batches = [batch async for batch in repository.stream_export_batches(form.id, [signature.id], batch_size=2)]
+
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    rows = [row for batch in batches for row in batch]
+    assert [row["user_name"] for row in rows] == [f"User {i}" for i in range(4, -1, -1)]
+    # Presence-only values are not loaded in full
+    assert rows[0]["values"][signature.id] == "d"
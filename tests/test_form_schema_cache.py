@@ -0,0 +1,173 @@
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from uuid import UUID
+from sqlalchemy import event
+
+from app.core.container import container
+from app.core.middleware import ContainerSessionMiddleware
+from app.domain.models import Form
+from tests.conftest import test_engine
+
+
+async def _create_form(client, admin_user, auth_token, fields) -> dict:
+    response = await client.post(
+        "/api/v1/forms",
+        json={"title": "Cached Form", "creator_id": str(admin_user.id), "fields": fields},
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+    assert response.status_code == 200
+    return response.json()["form"]
+
+
+@pytest.mark.asyncio
+async def test_public_form_fetch_is_served_from_cache(client, admin_user, auth_token):
+    """Repeated GETs of a form do not query the database until the form changes."""
+    form = await _create_form(client, admin_user, auth_token, [
+        {"field_type": "text", "label": "Name", "name": "name", "is_required": True, "order": 0}
+    ])
+    await client.get(f"/api/v1/forms/{form['id']}")
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        response = await client.get(f"/api/v1/forms/{form['id']}")
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+
+    assert response.status_code == 200
+    assert response.json()["form"]["title"] == "Cached Form"
+    assert statements == []
+
+    # Update invalidates the cached definition
+    await client.put(
+        f"/api/v1/forms/{form['id']}",
+        json={"title": "Renamed Form"},
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+    response = await client.get(f"/api/v1/forms/{form['id']}")
+    assert response.json()["form"]["title"] == "Renamed Form"
+
+
+@pytest.mark.asyncio
+async def test_read_interleaved_with_update_cannot_cache_the_old_version(client, admin_user, auth_token):
+    """Invalidation waits for the commit, and older versions loaded around it are not cached."""
+    form = await _create_form(client, admin_user, auth_token, [])
+    cache = container.form_schema_cache()
+
+    def load_previous_version():
+        # What a read racing the update (or a lagging replica) loads: the form as it was
+        previous = Form(
+            id=UUID(form["id"]), title=form["title"], description=None,
+            creator_id=admin_user.id, updated_at=datetime.fromisoformat(form["updated_at"])
+        )
+        return cache.put(previous)
+
+    commit = ContainerSessionMiddleware._commit
+
+    async def commit_after_concurrent_read(self, scope, request):
+        # The update is flushed but not committed yet
+        load_previous_version()
+        await commit(self, scope, request)
+
+    with patch.object(ContainerSessionMiddleware, "_commit", commit_after_concurrent_read):
+        response = await client.put(
+            f"/api/v1/forms/{form['id']}",
+            json={"title": "Renamed Form"},
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+    assert response.status_code == 200
+    assert cache.get(UUID(form["id"])) is None
+
+    # Served to that read, but not cached over the committed version
+    assert load_previous_version().dto.title == "Cached Form"
+    assert cache.get(UUID(form["id"])) is None
+    response = await client.get(f"/api/v1/forms/{form['id']}")
+    assert response.json()["form"]["title"] == "Renamed Form"
+    assert cache.get(UUID(form["id"])).dto.title == "Renamed Form"
+
+    await client.delete(f"/api/v1/forms/{form['id']}", headers={"Authorization": f"Bearer {auth_token}"})
+    load_previous_version()
+    assert cache.get(UUID(form["id"])) is None
+    assert (await client.get(f"/api/v1/forms/{form['id']}")).json()["form"] is None
+
+
+@pytest.mark.asyncio
+async def test_submission_is_validated_against_compiled_form(client, admin_user, auth_token):
+    """Required, email, number and select fields are validated on submit."""
+    form = await _create_form(client, admin_user, auth_token, [
+        {"field_type": "text", "label": "Name", "name": "name", "is_required": True, "order": 0},
+        {"field_type": "email", "label": "Contact", "name": "contact", "is_required": False, "order": 1},
+        {"field_type": "number", "label": "Age", "name": "age", "is_required": False, "order": 2},
+        {"field_type": "select", "label": "Plan", "name": "plan", "is_required": False, "order": 3,
+         "options": json.dumps(["basic", "pro"])},
+    ])
+    name_id, email_id, age_id, plan_id = (f["id"] for f in form["fields"])
+
+    async def submit(values: dict) -> int:
+        response = await client.post(
+            f"/api/v1/forms/{form['id']}/submit",
+            data={"user_name": "Validator", "field_values_json": json.dumps(values)}
+        )
+        return response.status_code
+
+    assert await submit({email_id: "a@b.co"}) == 400
+    assert await submit({name_id: "Ann", email_id: "not-an-email"}) == 400
+    assert await submit({name_id: "Ann", age_id: "forty"}) == 400
+    assert await submit({name_id: "Ann", plan_id: "enterprise"}) == 400
+    assert await submit({name_id: "Ann", email_id: "a@b.co", age_id: "40", plan_id: "pro"}) == 200
+
+
+@pytest.mark.asyncio
+async def test_public_form_supports_conditional_get(client, admin_user, auth_token):
+    """ETag revalidation answers 304 from memory and changes when the form is updated."""
+    from app.core.container import container
+
+    form = await _create_form(client, admin_user, auth_token, [
+        {"field_type": "text", "label": "Name", "name": "name", "is_required": True, "order": 0}
+    ])
+    first = await client.get(f"/api/v1/forms/{form['id']}", headers={"Accept-Encoding": "identity"})
+    etag = first.headers["etag"]
+    assert not etag.startswith("W/")
+    assert first.headers["cache-control"].startswith("public, max-age=")
+
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        # A weak tag (as sent back after a compressed response) also matches
+        not_modified = await client.get(f"/api/v1/forms/{form['id']}", headers={"If-None-Match": f"W/{etag}"})
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+    assert statements == []
+
+    # Cold cache: the version is read without loading the form's fields
+    container.form_schema_cache().clear()
+    event.listen(test_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        cold = await client.get(f"/api/v1/forms/{form['id']}", headers={"If-None-Match": etag})
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", record)
+    assert cold.status_code == 304
+    assert len(statements) == 1 and "form_fields" not in statements[0]
+
+    await client.put(
+        f"/api/v1/forms/{form['id']}",
+        json={"title": "Revalidated Form"},
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+    changed = await client.get(f"/api/v1/forms/{form['id']}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.json()["form"]["title"] == "Revalidated Form"
+    assert changed.headers["etag"].removeprefix("W/") != etag
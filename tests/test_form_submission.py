@@ -213,3 +213,209 @@ async def test_form_with_only_file_field(client, admin_user, mock_azure_storage,
     assert len(submission["files"]) == 1
     assert submission["files"][0]["original_filename"] == "document.pdf"
 
+
+
+@pytest.mark.asyncio
+async def test_submission_statement_count_does_not_grow_with_fields(client, admin_user, auth_token):
+    """Submitting costs the same number of SQL statements for 2 or 20 fields."""
+    from sqlalchemy import event
+    from tests.conftest import test_engine
+
+    async def submit_with_fields(field_count: int, email: str) -> int:
+        form_data = {
+            "title": f"Form with {field_count} fields",
+            "creator_id": str(admin_user.id),
+            "fields": [
+                {
+                    "field_type": "text",
+                    "label": f"Field {i}",
+                    "name": f"field_{i}",
+                    "is_required": False,
+                    "order": i
+                } for i in range(field_count)
+            ]
+        }
+        create_response = await client.post(
+            "/api/v1/forms",
+            json=form_data,
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+        form = create_response.json()["form"]
+        field_values = {field["id"]: f"value {field['order']}" for field in form["fields"]}
+
+        statements: list[str] = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", count_statement)
+        try:
+            import json
+            response = await client.post(
+                f"/api/v1/forms/{form['id']}/submit",
+                data={
+                    "user_name": "Counter",
+                    "user_email": email,
+                    "field_values_json": json.dumps(field_values)
+                }
+            )
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", count_statement)
+
+        assert response.status_code == 200
+        assert len(response.json()["submission"]["field_values"]) == field_count
+        return len(statements)
+
+    assert await submit_with_fields(2, "few@test.com") == await submit_with_fields(20, "many@test.com")
+
+
+@pytest.mark.asyncio
+async def test_admin_submission_listing_is_a_single_query(client, admin_user, mock_azure_storage, auth_token):
+    """The admin listing loads nested values, files and form fields in one statement."""
+    import io
+    import json
+    from sqlalchemy import event
+    from tests.conftest import test_engine
+
+    create_response = await client.post(
+        "/api/v1/forms",
+        json={
+            "title": "Listing Form",
+            "creator_id": str(admin_user.id),
+            "fields": [
+                {"field_type": "file", "label": "Attachment", "name": "attachment", "is_required": False, "order": 1},
+                {"field_type": "text", "label": "Name", "name": "name", "is_required": True, "order": 0}
+            ]
+        },
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+    form = create_response.json()["form"]
+    text_field_id = next(f["id"] for f in form["fields"] if f["field_type"] == "text")
+    file_field_id = next(f["id"] for f in form["fields"] if f["field_type"] == "file")
+
+    async def list_submissions() -> tuple[list[dict], int]:
+        statements: list[str] = []
+
+        def count_statement(conn, cursor, statement, parameters, context, executemany):
+            if "form_submissions" in statement:
+                statements.append(statement)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", count_statement)
+        try:
+            response = await client.get(
+                f"/api/v1/admin/{admin_user.id}/submissions",
+                params={"form_id": form["id"], "limit": 50},
+                headers={"Authorization": f"Bearer {auth_token}"}
+            )
+        finally:
+            event.remove(test_engine.sync_engine, "before_cursor_execute", count_statement)
+        assert response.status_code == 200
+        return response.json()["submissions"], len(statements)
+
+    for i in range(3):
+        submit_response = await client.post(
+            f"/api/v1/forms/{form['id']}/submit",
+            data={
+                "user_name": f"Lister {i}",
+                "user_email": f"lister{i}@test.com",
+                "field_values_json": json.dumps({text_field_id: f"Name {i}"}),
+                "file_fields_json": json.dumps({"0": file_field_id})
+            },
+            files=[("files", (f"doc{i}.txt", io.BytesIO(b"content"), "text/plain"))]
+        )
+        assert submit_response.status_code == 200
+
+    submissions, statement_count = await list_submissions()
+    assert statement_count == 1
+    assert len(submissions) == 3
+
+    latest = submissions[0]
+    assert latest["user"]["email"] == "lister2@test.com"
+    assert latest["user"]["is_admin"] is False
+    assert latest["form"]["title"] == "Listing Form"
+    assert [f["name"] for f in latest["form"]["fields"]] == ["name", "attachment"]
+    assert latest["field_values"] == [
+        {"id": latest["field_values"][0]["id"], "field_id": text_field_id, "value": "Name 2"}
+    ]
+    assert latest["files"][0]["original_filename"] == "doc2.txt"
+    assert latest["files"][0]["field_id"] == file_field_id
+
+    summary_response = await client.get(
+        f"/api/v1/admin/{admin_user.id}/submissions",
+        params={"form_id": form["id"], "view": "summary", "limit": 1},
+        headers={"Authorization": f"Bearer {auth_token}"}
+    )
+    assert summary_response.status_code == 200
+    summary = summary_response.json()["submissions"][0]
+    assert summary["id"] == latest["id"]
+    assert summary["user_name"] == "Lister 2"
+    assert (summary["field_value_count"], summary["file_count"]) == (1, 1)
+    assert "field_values" not in summary
+
+
+@pytest.mark.asyncio
+async def test_normalized_admin_listing_deduplicates_forms_and_users(client, seed_form):
+    """view=normalized returns each form and user once, referenced by id."""
+    from datetime import datetime, timedelta
+    from app.domain.models import User
+    from app.core.container import container
+
+    container.form_schema_cache().clear()
+    admin = User(id=uuid4(), name="Admin", email="normalized@test.com", is_admin=True)
+    submitters = [User(id=uuid4(), name=f"Submitter {i}", is_admin=False, admin_id=admin.id) for i in range(2)]
+    seeded = await seed_form(
+        admin=admin, title="Shared Form", fields=[{"field_type": "text", "label": "Note", "name": "note"}],
+        submissions=6,
+        submitted_at=lambda i: datetime(2025, 1, 1) + timedelta(minutes=i),
+        submitter=lambda i: submitters[i % 2],
+    )
+    form = seeded.form
+
+    response = await client.get(f"/api/v1/admin/{admin.id}/submissions", params={"view": "normalized"})
+    assert response.status_code == 200
+    body = response.json()
+    assert len(body["submissions"]) == 6
+    assert all(s["form"] is None and s["user"] is None for s in body["submissions"])
+    assert list(body["forms"]) == [str(form.id)]
+    assert body["forms"][str(form.id)]["fields"][0]["name"] == "note"
+    assert set(body["users"]) == {str(u.id) for u in submitters}
+    assert {s["user_id"] for s in body["submissions"]} == set(body["users"])
+
+
+@pytest.mark.asyncio
+async def test_submission_counters_follow_inserts_and_deletes(client, admin_user, auth_token):
+    """Counters are updated on submit/delete and served in batch."""
+    form_ids = []
+    for title in ("Counted A", "Counted B"):
+        response = await client.post(
+            "/api/v1/forms",
+            json={"title": title, "creator_id": str(admin_user.id), "fields": []},
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+        form_ids.append(response.json()["form"]["id"])
+
+    submission_ids = []
+    for form_id in (form_ids[0], form_ids[0], form_ids[0], form_ids[1]):
+        response = await client.post(
+            f"/api/v1/forms/{form_id}/submit",
+            data={"user_name": "Counter", "field_values_json": "{}"}
+        )
+        assert response.status_code == 200
+        submission_ids.append(response.json()["submission"]["id"])
+
+    delete_response = await client.delete(f"/api/v1/submissions/{submission_ids[0]}")
+    assert delete_response.status_code == 200
+
+    unknown = str(uuid4())
+    response = await client.get(
+        "/api/v1/forms/submission-counts",
+        params={"form_ids": [f"{form_ids[0]},{form_ids[1]}", unknown]}
+    )
+    assert response.status_code == 200
+    assert response.json()["counts"] == {form_ids[0]: 2, form_ids[1]: 1, unknown: 0}
+
+    single = await client.get(f"/api/v1/forms/{form_ids[0]}/submissions/count")
+    assert single.json()["count"] == 2
+
+    invalid = await client.get("/api/v1/forms/submission-counts", params={"form_ids": "not-a-uuid"})
+    assert invalid.status_code == 400
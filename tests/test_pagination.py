@@ -0,0 +1,115 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+from app.domain.models import User
+
+
+async def _seed(seed_form, submission_count: int, form_count: int = 1):
+    admin = User(id=uuid4(), name="Admin", email="pager@test.com", is_admin=True)
+    base = datetime(2025, 1, 1, 12, 0, 0)
+    forms = []
+    submissions = []
+    for i in range(form_count):
+        seeded = await seed_form(
+            admin=admin, title=f"Form {i}", fields=(), created_at=base + timedelta(minutes=i // 2),
+            submissions=submission_count if i == 0 else 0,
+            # Pairs of submissions share a timestamp to exercise the id tie-breaker
+            submitted_at=lambda n: base + timedelta(seconds=n // 2),
+            submitter=lambda n: admin,
+        )
+        forms.append(seeded.form)
+        submissions.extend(seeded.submissions)
+    return admin, forms, submissions
+
+
+async def _collect(client, url: str, key: str) -> list[str]:
+    ids: list[str] = []
+    cursor = None
+    while True:
+        params = {"limit": 10}
+        if cursor:
+            params["cursor"] = cursor
+        response = await client.get(url, params=params)
+        assert response.status_code == 200
+        body = response.json()
+        ids.extend(item["id"] for item in body[key])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return ids
+
+
+@pytest.mark.asyncio
+async def test_submission_listings_page_with_cursor(client, seed_form):
+    """Cursor pages cover every submission exactly once, newest first."""
+    admin, forms, submissions = await _seed(seed_form, 25)
+    expected = [
+        str(s.id) for s in sorted(submissions, key=lambda s: (s.submitted_at, s.id), reverse=True)
+    ]
+
+    assert await _collect(client, f"/api/v1/forms/{forms[0].id}/submissions", "submissions") == expected
+    assert await _collect(client, f"/api/v1/admin/{admin.id}/submissions", "submissions") == expected
+
+
+@pytest.mark.asyncio
+async def test_form_listing_pages_with_cursor(client, seed_form):
+    """Creator form listing pages by (created_at, id)."""
+    admin, forms, _ = await _seed(seed_form, 0, form_count=13)
+    expected = [str(f.id) for f in sorted(forms, key=lambda f: (f.created_at, f.id), reverse=True)]
+
+    assert await _collect(client, f"/api/v1/admin/{admin.id}/forms", "forms") == expected
+
+
+@pytest.mark.asyncio
+async def test_invalid_cursor_is_rejected(client, seed_form):
+    admin, forms, _ = await _seed(seed_form, 1)
+    response = await client.get(f"/api/v1/forms/{forms[0].id}/submissions", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_summary_view_pages_with_cursor(client, seed_form):
+    """view=summary returns compact rows and pages the same way as the full listing."""
+    admin, forms, submissions = await _seed(seed_form, 12)
+    url = f"/api/v1/admin/{admin.id}/submissions"
+
+    expected = await _collect(client, url, "submissions")
+    assert await _collect(client, f"{url}?view=summary", "submissions") == expected
+
+    response = await client.get(url, params={"view": "summary", "limit": 1})
+    row = response.json()["submissions"][0]
+    assert set(row) == {
+        "id", "form_id", "form_title", "user_id", "user_name", "user_email",
+        "submitted_at", "field_value_count", "file_count"
+    }
+    assert row["form_title"] == "Form 0"
+    assert row["user_email"] == "pager@test.com"
+    assert row["field_value_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_forms_overview_reports_activity(client, db_session, seed_form):
+    """The overview lists forms with counts and last submission time, paged by cursor."""
+    from app.domain.models import File, FormSubmissionCounter
+
+    admin, forms, submissions = await _seed(seed_form, 4, form_count=13)
+    # Seeded rows bypass the repository, so set the maintained counters directly
+    db_session.add(File(
+        id=uuid4(), submission_id=submissions[0].id, original_filename="a.txt", blob_name="a",
+        blob_url="https://blob/a", file_size=1
+    ))
+    db_session.add(FormSubmissionCounter(form_id=forms[0].id, submission_count=4, file_count=1))
+    await db_session.commit()
+
+    url = f"/api/v1/admin/{admin.id}/forms/overview"
+    expected = [str(f.id) for f in sorted(forms, key=lambda f: (f.created_at, f.id), reverse=True)]
+    assert await _collect(client, url, "forms") == expected
+
+    response = await client.get(url, params={"limit": 20})
+    overview = {f["id"]: f for f in response.json()["forms"]}
+    first = overview[str(forms[0].id)]
+    assert (first["submission_count"], first["file_count"]) == (4, 1)
+    assert first["last_submitted_at"].startswith(submissions[-1].submitted_at.isoformat())
+    assert "fields" not in first
+    other = overview[str(forms[1].id)]
+    assert (other["submission_count"], other["file_count"], other["last_submitted_at"]) == (0, 0, None)
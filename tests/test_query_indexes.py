@@ -0,0 +1,133 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from sqlalchemy import event
+
+from app.core.database import Base
+from app.domain.models import User
+from app.infrastructure.repositories.form_repository import FormRepository
+from app.infrastructure.repositories.form_submission_repository import FormSubmissionRepository
+from app.infrastructure.repositories.user_repository import UserRepository
+from tests.conftest import test_engine
+
+
+async def _seed(seed_form):
+    admin = User(id=uuid4(), name="Admin", email="index-admin@test.com", is_admin=True)
+    users = [
+        User(id=uuid4(), name=f"User {i}", email=f"index{i}@test.com", is_admin=False, admin_id=admin.id)
+        for i in range(20)
+    ]
+    base = datetime(2025, 1, 1)
+    forms = []
+    for f in range(5):
+        # 200 submissions spread round-robin over the forms; n-th of form f is overall submission f + 5n
+        seeded = await seed_form(
+            admin=admin, title=f"Form {f}", created_at=base + timedelta(hours=f),
+            fields=[{"field_type": "text", "label": f"F{j}", "name": f"f{j}"} for j in range(3)],
+            submissions=40,
+            values=lambda n, f=f: {f"f{j}": f"value {f + 5 * n}" for j in range(3)},
+            file_counts=lambda n: {"f0": 1},
+            submitted_at=lambda n, f=f: base + timedelta(minutes=f + 5 * n),
+            submitter=lambda n, f=f: users[(f + 5 * n) % len(users)],
+        )
+        forms.append(seeded.form)
+    return admin, forms, users
+
+
+async def _query_plans(db_session, call) -> list[str]:
+    """Run a repository call and return the EXPLAIN QUERY PLAN lines of every statement it issued."""
+    statements: list[tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        # One plan per executemany statement is enough
+        statements.append((statement, parameters[0] if executemany else parameters))
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        await call()
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", capture)
+
+    connection = await db_session.connection()
+    plans = []
+    for statement, parameters in statements:
+        result = await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        plans.extend(row[-1] for row in result)
+    return plans
+
+
+def _assert_no_full_scans(plans: list[str]) -> None:
+    """Every SCAN step must go through an index."""
+    assert not [line for line in plans if line.startswith("SCAN") and "INDEX" not in line], plans
+
+
+@pytest.mark.asyncio
+async def test_repository_queries_use_indexes(db_session, seed_form):
+    admin, forms, users = await _seed(seed_form)
+    db_session.expunge_all()
+    submissions = FormSubmissionRepository(db_session)
+    form_repository = FormRepository(db_session)
+    user_repository = UserRepository(db_session)
+    users_submission_id = (await submissions.get_by_user_id(users[1].id, 0, 1))[0].id
+    db_session.expunge_all()
+
+    cases = [
+        (
+            lambda: submissions.get_by_form_id(forms[0].id, 0, 10),
+            {"ix_form_submissions_form_id_submitted_at", "ix_form_field_values_submission_id", "ix_files_submission_id"},
+        ),
+        # Counts are a primary-key lookup on the maintained counter table
+        (lambda: submissions.count_by_form_id(forms[0].id), {"sqlite_autoindex_form_submission_counters_1"}),
+        (lambda: submissions.get_by_user_id(users[0].id, 0, 10), {"ix_form_submissions_user_id_submitted_at"}),
+        (
+            lambda: form_repository.get_by_creator_id(admin.id, 0, 10),
+            {"ix_forms_creator_id_created_at", "ix_form_fields_form_id_order"},
+        ),
+        (lambda: user_repository.get_by_admin_id(admin.id), {"ix_users_admin_id"}),
+        # Admin listing (ORM and single-statement variants, ordered and paged): the
+        # ownership OR is answered from both composite indexes, not a scan
+        *(
+            (
+                lambda listing=listing: listing(admin.id, 20, 10),
+                {
+                    "ix_forms_creator_id_created_at", "ix_users_admin_id",
+                    "ix_form_submissions_form_id_submitted_at", "ix_form_submissions_user_id_submitted_at",
+                    "ix_form_field_values_submission_id", "ix_files_submission_id",
+                },
+            )
+            for listing in (submissions.get_by_admin_id, submissions.get_rows_by_admin_id)
+        ),
+        # Cascading deletes load children by foreign key
+        (
+            lambda: submissions.delete(users_submission_id),
+            {"ix_form_field_values_submission_id", "ix_files_submission_id"},
+        ),
+        (
+            lambda: form_repository.delete(forms[2].id),
+            {
+                "ix_form_fields_form_id_order", "ix_form_submissions_form_id_submitted_at",
+                "ix_form_field_values_field_id", "ix_form_field_values_submission_id", "ix_files_submission_id",
+            },
+        ),
+    ]
+    for call, expected_indexes in cases:
+        plans = await _query_plans(db_session, call)
+        for index in expected_indexes:
+            assert any(index in line for line in plans), f"{index} not used in plan: {plans}"
+        _assert_no_full_scans(plans)
+        db_session.expunge_all()
+
+
+@pytest.mark.asyncio
+async def test_foreign_keys_are_indexed(db_session):
+    """Referencing rows can be found by index, for ON DELETE CASCADE and FK checks on parent deletes."""
+    connection = await db_session.connection()
+    for table in Base.metadata.sorted_tables:
+        for foreign_key in table.foreign_keys:
+            column = foreign_key.parent.name
+            result = await connection.exec_driver_sql(
+                f'EXPLAIN QUERY PLAN SELECT 1 FROM {table.name} WHERE "{column}" = ?', ("",)
+            )
+            plans = [row[-1] for row in result]
+            assert any(line.startswith("SEARCH") and "INDEX" in line for line in plans), \
+                f"{table.name}.{column} is not indexed: {plans}"
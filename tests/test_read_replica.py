@@ -0,0 +1,157 @@
+import pytest
+import time
+from unittest.mock import patch
+from uuid import uuid4
+from mediatr import Mediator
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.application.handlers.users.get_user_handler import GetUserRequest
+from app.core.auth import create_access_token
+from app.core.container import container
+from app.core.database import Base
+from app.core.middleware import ContainerSessionMiddleware
+from app.core.read_replica import PIN_COOKIE, REPLICA_BIND, RoutingSession
+from app.domain.models import User, ExportJob
+from tests.conftest import test_engine
+
+
+@pytest.fixture
+async def replica_engine():
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+async def _seed(engine, user_id, name):
+    async with AsyncSession(engine) as session:
+        session.add(User(id=user_id, name=name, email="replica@test.com", is_admin=True))
+        await session.commit()
+
+
+def _middleware(user_id, observed: list):
+    async def endpoint(scope, receive, send):
+        session = container.db_session()
+        if scope["path"] == "/write":
+            await session.execute(update(User).where(User.id == user_id).values(name="Written"))
+        if scope["path"] == "/query":
+            response = await Mediator.send_async(GetUserRequest(user_id=user_id))
+            observed.append(response.user.name)
+        observed.append(await session.scalar(select(User.name).where(User.id == user_id)))
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    return ContainerSessionMiddleware(endpoint)
+
+
+async def _call(middleware, method, path, token, cookie: str | None = None) -> dict[bytes, bytes]:
+    """Send a request through the middleware and return its response headers."""
+    headers: dict[bytes, bytes] = {}
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            headers.update(message["headers"])
+
+    request_headers = [(b"authorization", f"Bearer {token}".encode())]
+    if cookie:
+        request_headers.append((b"cookie", cookie.encode()))
+    scope = {"type": "http", "method": method, "path": path, "headers": request_headers, "client": ("10.0.0.1", 1234)}
+    await middleware(scope, receive, send)
+    return headers
+
+
+@pytest.mark.asyncio
+async def test_reads_are_routed_to_replica_unless_pinned(db_session, replica_engine):
+    user_id = uuid4()
+    await _seed(test_engine, user_id, "Primary")
+    await _seed(replica_engine, user_id, "Replica")
+    session_factory = async_sessionmaker(
+        test_engine, class_=AsyncSession, sync_session_class=RoutingSession,
+        info={REPLICA_BIND: replica_engine.sync_engine}, expire_on_commit=False
+    )
+    observed: list[str] = []
+    middleware = _middleware(user_id, observed)
+
+    with patch("app.core.middleware.AsyncSessionLocal", session_factory):
+        await _call(middleware, "GET", "/read", "a")
+        assert observed == ["Replica"]
+
+        # Read-only Mediator queries use the replica outside of GET requests too;
+        # other statements of a mutating request stay on the primary
+        observed.clear()
+        await _call(middleware, "POST", "/query", "b")
+        assert observed == ["Replica", "Primary"]
+
+        # A write pins the rest of its session, and the client's next reads, to the primary
+        observed.clear()
+        await _call(middleware, "POST", "/write", "a")
+        await _call(middleware, "GET", "/read", "a")
+        await _call(middleware, "GET", "/query", "a")
+        assert observed == ["Written", "Written", "Written", "Written"]
+
+        # Other clients are not pinned, and the pin ends with the window
+        observed.clear()
+        await _call(middleware, "GET", "/read", "c")
+        middleware.primary_pins.window_seconds = 0
+        await _call(middleware, "POST", "/write", "d")
+        await _call(middleware, "GET", "/read", "d")
+        assert observed == ["Replica", "Written", "Replica"]
+
+
+@pytest.mark.asyncio
+async def test_export_job_polling_reads_from_the_primary(client, db_session, seed_form, replica_engine):
+    """Job status is polled while the worker updates it, so it never comes from a lagging replica."""
+    seeded = await seed_form()
+    job = ExportJob(id=uuid4(), form_id=seeded.form.id, format="csv", locale="en", filters={}, dedupe_key="k")
+    db_session.add(job)
+    await db_session.commit()
+    # The replica has the requester, but has not caught up with the form or the job yet
+    await _seed(replica_engine, seeded.admin.id, seeded.admin.name)
+    session_factory = async_sessionmaker(
+        test_engine, class_=AsyncSession, sync_session_class=RoutingSession,
+        info={REPLICA_BIND: replica_engine.sync_engine}, expire_on_commit=False
+    )
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(seeded.admin.id)})}"}
+
+    with patch("app.core.middleware.AsyncSessionLocal", session_factory):
+        # Other GET requests of the client still read from the replica
+        forms = await client.get(f"/api/v1/admin/{seeded.admin.id}/forms", headers=headers)
+        response = await client.get(f"/api/v1/export-jobs/{job.id}", headers=headers)
+
+    assert forms.json()["forms"] == []
+    assert response.status_code == 200
+    assert response.json()["job"]["status"] == "pending"
+
+
+@pytest.mark.asyncio
+async def test_pin_cookie_carries_read_after_write_to_other_workers(db_session, replica_engine):
+    user_id = uuid4()
+    await _seed(test_engine, user_id, "Primary")
+    await _seed(replica_engine, user_id, "Replica")
+    session_factory = async_sessionmaker(
+        test_engine, class_=AsyncSession, sync_session_class=RoutingSession,
+        info={REPLICA_BIND: replica_engine.sync_engine}, expire_on_commit=False
+    )
+    observed: list[str] = []
+    # Two worker processes: the in-memory pin of one is invisible to the other
+    writer, reader = _middleware(user_id, observed), _middleware(user_id, observed)
+
+    with patch("app.core.middleware.AsyncSessionLocal", session_factory):
+        headers = await _call(writer, "POST", "/write", "a")
+        cookie = headers[b"set-cookie"].decode().split(";")[0]
+        assert cookie.startswith(f"{PIN_COOKIE}=")
+
+        observed.clear()
+        await _call(reader, "GET", "/read", "a")
+        await _call(reader, "GET", "/read", "a", cookie=cookie)
+        # Cookies claiming a pin longer than one window are ignored
+        await _call(reader, "GET", "/read", "a", cookie=f"{PIN_COOKIE}={time.time() + 3600}")
+        assert observed == ["Replica", "Written", "Replica"]
@@ -0,0 +1,95 @@
+import asyncio
+import random
+import pytest
+from unittest.mock import patch
+
+from app.core.container import container
+from app.core.middleware import ContainerSessionMiddleware
+from tests.conftest import TestSessionLocal
+
+
+@pytest.mark.asyncio
+async def test_no_session_leak_between_concurrent_requests():
+    """Hundreds of interleaved in-flight requests each resolve only their own session and bus."""
+    request_count = 500
+    resolved: dict[int, list] = {}
+
+    async def endpoint(scope, receive, send):
+        request_id = int(scope["path"].rsplit("/", 1)[-1])
+        first_session = container.db_session()
+        first_bus = container.request_event_bus()
+        repository_session = container.form_repository().session
+        observed = [(first_session, first_bus, repository_session)]
+        for _ in range(5):
+            # Yield to the loop so the other requests interleave with this one
+            await asyncio.sleep(random.random() / 1000)
+            observed.append((container.db_session(), container.request_event_bus(), container.user_repository().session))
+        resolved[request_id] = observed
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = ContainerSessionMiddleware(endpoint)
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    async def call(request_id: int):
+        scope = {"type": "http", "method": "GET", "path": f"/probe/{request_id}", "headers": []}
+        await middleware(scope, receive, send)
+
+    with patch("app.core.middleware.AsyncSessionLocal", TestSessionLocal):
+        await asyncio.gather(*(call(i) for i in range(request_count)))
+
+    assert len(resolved) == request_count
+    sessions = set()
+    for observed in resolved.values():
+        session, bus, _ = observed[0]
+        assert all(s is session and b is bus and r is session for s, b, r in observed)
+        sessions.add(id(session))
+    assert len(sessions) == request_count
+
+
+def test_session_is_unavailable_outside_a_request():
+    """Resolving the request session without a request scope fails loudly."""
+    with pytest.raises(RuntimeError):
+        container.db_session()
+
+
+@pytest.mark.asyncio
+async def test_session_and_bus_are_created_on_first_use():
+    """Routes that never touch the database don't open a session or create a deferred bus."""
+    opened = []
+
+    def session_factory():
+        session = TestSessionLocal()
+        opened.append(session)
+        return session
+
+    async def endpoint(scope, receive, send):
+        if scope["path"] == "/db":
+            container.form_repository()
+            assert container.db_session() is opened[0]
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    middleware = ContainerSessionMiddleware(endpoint)
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    with patch("app.core.middleware.AsyncSessionLocal", session_factory), \
+            patch("app.core.middleware.DeferredEventBus") as deferred_bus:
+        for method in ("GET", "POST"):
+            await middleware({"type": "http", "method": method, "path": "/health", "headers": []}, receive, send)
+        assert opened == []
+        deferred_bus.assert_not_called()
+
+        await middleware({"type": "http", "method": "POST", "path": "/db", "headers": []}, receive, send)
+        assert len(opened) == 1
+        deferred_bus.assert_not_called()
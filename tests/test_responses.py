@@ -0,0 +1,71 @@
+import json
+import pytest
+from datetime import datetime
+from unittest.mock import patch
+from uuid import uuid4
+from fastapi import APIRouter, FastAPI
+from fastapi.encoders import jsonable_encoder
+from httpx import AsyncClient
+from pydantic import BaseModel
+
+from app.application.dto.models import FormDTO, FormFieldDTO
+from app.core.responses import FastJSONResponse, TypedResponseRoute
+
+
+class ItemResponse(BaseModel):
+    form: FormDTO
+    tags: dict[str, int] = {}
+
+
+class ExtendedItemResponse(ItemResponse):
+    secret: str = "hidden"
+
+
+def _form() -> FormDTO:
+    return FormDTO(
+        id=uuid4(),
+        title="Ünïcode form",
+        creator_id=uuid4(),
+        created_at=datetime(2025, 1, 2, 3, 4, 5, 678000),
+        fields=[FormFieldDTO(id=uuid4(), field_type="text", label="Name", name="name", is_required=True, order=0)]
+    )
+
+
+def _app(result) -> FastAPI:
+    router = APIRouter(route_class=TypedResponseRoute)
+
+    @router.post("/items", response_model=ItemResponse, status_code=201)
+    async def create_item():
+        return result
+
+    app = FastAPI(default_response_class=FastJSONResponse)
+    app.include_router(router)
+    return app
+
+
+@pytest.mark.asyncio
+async def test_typed_result_skips_revalidation():
+    item = ItemResponse(form=_form(), tags={"a": 1})
+    with patch("fastapi.routing.serialize_response", side_effect=AssertionError("re-validated")):
+        async with AsyncClient(app=_app(item), base_url="http://test") as client:
+            response = await client.post("/items")
+    assert response.status_code == 201
+    assert response.headers["content-type"] == "application/json"
+    # Same document as the regular FastAPI encoding
+    assert response.json() == json.loads(json.dumps(jsonable_encoder(item)))
+
+
+@pytest.mark.asyncio
+async def test_other_results_use_response_model():
+    """Subclasses and plain dicts are still filtered through response_model."""
+    extended = ExtendedItemResponse(form=_form())
+    async with AsyncClient(app=_app(extended), base_url="http://test") as client:
+        response = await client.post("/items")
+    assert response.status_code == 201
+    assert "secret" not in response.json()
+
+    as_dict = {"form": jsonable_encoder(_form()), "tags": {}, "secret": "x"}
+    async with AsyncClient(app=_app(as_dict), base_url="http://test") as client:
+        response = await client.post("/items")
+    assert response.json()["form"]["title"] == "Ünïcode form"
+    assert "secret" not in response.json()
@@ -0,0 +1,75 @@
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from app.domain.models import User, FormSubmission
+from app.infrastructure.repositories.form_submission_repository import FormSubmissionRepository
+
+
+async def _seed(seed_form):
+    admin = User(id=uuid4(), name="Admin", email="search-admin@test.com", is_admin=True)
+    entries = [
+        ("Alice Walker", "alice@example.com", "needs a wheelchair ramp"),
+        ("Bob Stone", "bob@example.com", "vegetarian meal"),
+        ("Carol Reed", "carol@walker.org", "no notes"),
+    ]
+    seeded = await seed_form(
+        admin=admin, title="Search Form",
+        fields=[
+            {"field_type": "text", "label": "Note", "name": "note"},
+            {"field_type": "signature", "label": "Sign", "name": "sign"},
+        ],
+        submissions=len(entries),
+        # Base64 image data is never searched
+        values=lambda i: {"note": entries[i][2], "sign": "data:image/png;base64,bWealkerWalkerVEG"},
+        submitted_at=lambda i: datetime(2025, 1, 1, 12, 0, 0) + timedelta(minutes=i),
+        submitter=lambda i: User(
+            id=uuid4(), name=entries[i][0], email=entries[i][1], is_admin=False, admin_id=admin.id
+        ),
+    )
+    return admin, seeded.submissions
+
+
+@pytest.mark.asyncio
+async def test_search_matches_name_email_and_values(client, seed_form):
+    admin, submissions = await _seed(seed_form)
+    url = f"/api/v1/admin/{admin.id}/submissions"
+
+    response = await client.get(url, params={"search": "walker"})
+    assert response.status_code == 200
+    assert {s["id"] for s in response.json()["submissions"]} == {str(submissions[0].id), str(submissions[2].id)}
+
+    response = await client.get(url, params={"search": "vegetarian"})
+    assert [s["id"] for s in response.json()["submissions"]] == [str(submissions[1].id)]
+    # Ranked results are paged with skip/limit only
+    assert response.json()["next_cursor"] is None
+
+    response = await client.get(url, params={"field_value_search": "walker"})
+    assert response.json()["submissions"] == []
+
+
+@pytest.mark.asyncio
+async def test_search_rejects_cursor(client, seed_form):
+    admin, submissions = await _seed(seed_form)
+    page = await client.get(f"/api/v1/admin/{admin.id}/submissions", params={"limit": 1})
+    response = await client.get(
+        f"/api/v1/admin/{admin.id}/submissions",
+        params={"search": "walker", "cursor": page.json()["next_cursor"]}
+    )
+    assert response.status_code == 400
+
+
+def test_postgres_search_uses_ranked_tsvector_match():
+    query = FormSubmissionRepository._search(select(FormSubmission.id), "postgresql", "wheelchair ramp")
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert "form_submissions.search_vector @@ websearch_to_tsquery('simple'::regconfig" in sql
+    assert "ORDER BY ts_rank(form_submissions.search_vector" in sql
+
+
+def test_field_value_filter_matches_partial_trigram_index():
+    """The filter repeats the index predicate as a literal, so the planner can use the partial index."""
+    query = FormSubmissionRepository._filter_submissions(select(FormSubmission.id), None, None, None, None, "ramp")
+    sql = str(query.compile(dialect=postgresql.asyncpg.dialect()))
+    assert "form_field_values.value NOT LIKE 'data:image/%'" in sql